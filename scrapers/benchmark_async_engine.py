@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 엔진 vs 스레드 엔진 벤치마크
+로컬 픽스처 서버(fixture_server.py)에 요청 지연을 주고
+목록+상세 수집 시간을 비교합니다. (Selenium 이미지 수집은 제외)
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from fixture_server import FixtureServer, FixtureSite
+from michelin_scraper_async import AsyncMichelinScraper
+from michelin_scraper_ultra_fast import UltraFastMichelinScraper, scrape_restaurants_continuously
+from rate_limiter import HostLimit, HostRateLimiter
+
+
+def unlimited_rate_limiter():
+    """엔진 자체 성능만 비교하도록 픽스처 호스트에는 속도 제한을 사실상 끔"""
+    return HostRateLimiter(host_limits={'127.0.0.1': HostLimit(initial_rate=10000, max_rate=10000, burst=10000)})
+
+
+def run_threaded(start_url, max_workers):
+    """스레드 경로: 순차 목록 수집 + 연속 작업 큐 ThreadPoolExecutor"""
+    scraper = UltraFastMichelinScraper(max_workers=max_workers, driver_pool_size=0, scrape_images=False,
+                                       rate_limiter=unlimited_rate_limiter())
+    start_time = time.perf_counter()
+    restaurant_urls = scraper.get_restaurant_urls(start_url)
+    successful_count, _ = scrape_restaurants_continuously(scraper, restaurant_urls)
+    elapsed = time.perf_counter() - start_time
+    scraper.image_pipeline.close()
+    return elapsed, successful_count
+
+
+def run_async(start_url, per_host_limit):
+    """비동기 경로: 동시 목록 수집 + aiohttp 상세 수집"""
+    scraper = AsyncMichelinScraper(driver_pool_size=0, scrape_images=False, per_host_limit=per_host_limit,
+                                   rate_limiter=unlimited_rate_limiter())
+    start_time = time.perf_counter()
+    successful_count, _ = asyncio.run(scraper.crawl(start_url))
+    elapsed = time.perf_counter() - start_time
+    scraper.close()
+    return elapsed, successful_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기/스레드 엔진 픽스처 벤치마크")
+    parser.add_argument('--restaurants', type=int, default=100, help="픽스처 음식점 수")
+    parser.add_argument('--latency', type=float, default=0.1, help="요청당 서버 지연 (초)")
+    parser.add_argument('--max-workers', type=int, default=4, help="스레드 엔진 워커 수")
+    parser.add_argument('--per-host-limit', type=int, default=8, help="비동기 엔진 호스트당 동시 요청 수")
+    args = parser.parse_args()
+
+    site = FixtureSite(restaurant_count=args.restaurants)
+    workdir = tempfile.mkdtemp(prefix="michelin_bench_")
+    cwd = os.getcwd()
+    os.chdir(workdir)  # restaurant_images 디렉토리가 작업 폴더를 더럽히지 않도록
+
+    try:
+        with FixtureServer(site, latency=args.latency) as server:
+            print(f"🧪 픽스처 서버: {server.base_url} (음식점 {args.restaurants}개, 지연 {args.latency}s)")
+            threaded_time, threaded_count = run_threaded(site.start_url, args.max_workers)
+            async_time, async_count = run_async(site.start_url, args.per_host_limit)
+    finally:
+        os.chdir(cwd)
+
+    print("\n" + "=" * 50)
+    print("📊 벤치마크 결과")
+    print("=" * 50)
+    print(f"🧵 스레드 엔진 ({args.max_workers}개 워커): {threaded_time:.2f}초, {threaded_count}개 "
+          f"({threaded_count / threaded_time:.1f}개/초)")
+    print(f"⚡ 비동기 엔진 (호스트당 {args.per_host_limit}개): {async_time:.2f}초, {async_count}개 "
+          f"({async_count / async_time:.1f}개/초)")
+    print(f"🚀 속도 향상: {threaded_time / async_time:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
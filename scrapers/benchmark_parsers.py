@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파서 백엔드 마이크로 벤치마크
+픽스처 상세 페이지(fixture_server.FixtureSite)와 저장된 목록 페이지(michelin-web.html)를
+백엔드별로 파싱해 초당 페이지 수를 비교합니다.
+모든 백엔드의 결과가 html.parser 결과와 같은지도 함께 확인합니다.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fixture_server import FixtureSite
+from page_parser import available_backends, parse_detail, parse_listing
+
+SAVED_LISTING_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'michelin-web.html')
+BASE_URL = "https://guide.michelin.com"
+
+
+def load_pages(detail_count):
+    """(상세 페이지 목록, 목록 페이지 목록) 바이트로 반환"""
+    site = FixtureSite(restaurant_count=detail_count)
+    detail_pages = [site.detail_page(i).encode('utf-8') for i in range(detail_count)]
+    listing_pages = [site.listing_page(1).encode('utf-8')]
+    if os.path.exists(SAVED_LISTING_PAGE):
+        with open(SAVED_LISTING_PAGE, 'rb') as f:
+            listing_pages.append(f.read())
+    return detail_pages, listing_pages
+
+
+def _parse_detail_batch(pages, backend):
+    for page in pages:
+        parse_detail(page, backend)
+    return len(pages)
+
+
+def _parse_listing_batch(pages, backend):
+    for page in pages:
+        parse_listing(page, BASE_URL, backend)
+    return len(pages)
+
+
+def measure(function, pages, backend, repeat, processes):
+    """pages 를 repeat 번 파싱한 초당 페이지 수 (processes > 0 이면 프로세스 풀에 나눠서)"""
+    work = pages * repeat
+    if processes <= 0:
+        started = time.perf_counter()
+        parsed = function(work, backend)
+        return parsed / (time.perf_counter() - started)
+
+    chunk = max(1, len(work) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # 프로세스 기동/임포트 시간은 제외하고 파싱 처리량만 측정
+        list(executor.map(function, [pages[:1]] * processes, [backend] * processes))
+        started = time.perf_counter()
+        futures = [executor.submit(function, work[i:i + chunk], backend) for i in range(0, len(work), chunk)]
+        parsed = sum(future.result() for future in futures)
+        return parsed / (time.perf_counter() - started)
+
+
+def check_consistency(detail_pages, listing_pages, backends):
+    """각 백엔드 결과가 html.parser 와 같은지 확인하고 다른 백엔드 이름 목록 반환"""
+    expected_details = [parse_detail(page) for page in detail_pages]
+    expected_listings = [parse_listing(page, BASE_URL) for page in listing_pages]
+    mismatched = []
+    for backend in backends:
+        details = [parse_detail(page, backend) for page in detail_pages]
+        listings = [parse_listing(page, BASE_URL, backend) for page in listing_pages]
+        if details != expected_details or listings != expected_listings:
+            mismatched.append(backend)
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument('--pages', type=int, default=50, help="픽스처 상세 페이지 수")
+    parser.add_argument('--repeat', type=int, default=20, help="상세 페이지 반복 횟수")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 2, help="프로세스 풀 크기")
+    args = parser.parse_args()
+
+    backends = available_backends()
+    detail_pages, listing_pages = load_pages(args.pages)
+    print(f"🧪 백엔드: {', '.join(backends)} | 상세 {len(detail_pages)}개 x {args.repeat}회, 목록 {len(listing_pages)}개")
+
+    mismatched = check_consistency(detail_pages, listing_pages, backends)
+    if mismatched:
+        print(f"⚠️ html.parser 와 결과가 다른 백엔드: {', '.join(mismatched)}")
+    else:
+        print("✅ 모든 백엔드 결과가 html.parser 와 동일")
+
+    print("\n" + "=" * 60)
+    print(f"{'백엔드':<14}{'상세(1프로세스)':>14}{'상세(' + str(args.processes) + '프로세스)':>16}{'목록':>12}  (페이지/초)")
+    print("=" * 60)
+    listing_repeat = max(1, args.repeat // 4)
+    for backend in backends:
+        single = measure(_parse_detail_batch, detail_pages, backend, args.repeat, 0)
+        pooled = measure(_parse_detail_batch, detail_pages, backend, args.repeat, args.processes)
+        listing = measure(_parse_listing_batch, listing_pages, backend, listing_repeat, 0)
+        print(f"{backend:<14}{single:>14.1f}{pooled:>16.1f}{listing:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 재생 벤치마크
+녹화한 아카이브(fixture_archive.py record) 또는 합성 픽스처를 로컬 서버로 재생하고
+스크래퍼 엔진별로 목록 → 상세 → (정적) 이미지 수집 전체를 돌려 비교합니다.
+- 처리량(음식점/초), 음식점당 지연 시간 p50/p95, 최대 RSS(chromedriver/Chrome 자식 프로세스 포함), 재시도 수
+- 서버 지연/지터/오류 비율을 바꿔 가며 동시성 설정을 운영 사이트에 쓰기 전에 평가
+- 엔진마다 새 프로세스(spawn)에서 실행해 메모리 측정이 서로 섞이지 않게 함
+
+사용법:
+    python benchmark_replay.py --archive fixtures/seoul --latency 0.2 --jitter 0.1 --error-rate 0.02
+    python benchmark_replay.py --restaurants 100 --engines ultra,async --max-workers 8
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+
+from browser_pool import process_tree_rss_mb
+
+from fixture_archive import ArchiveSite
+from fixture_server import FixtureServer, FixtureSite
+from page_parser import BACKEND_NAMES, DEFAULT_BACKEND
+from rate_limiter import HostLimit, HostRateLimiter
+from run_metrics import configure_logging
+
+
+def unlimited_rate_limiter():
+    """엔진 자체 성능만 비교하도록 재생 서버 호스트에는 속도 제한을 사실상 끔"""
+    return HostRateLimiter(host_limits={'127.0.0.1': HostLimit(initial_rate=10000, max_rate=10000, burst=10000)})
+
+
+def _timed(function, latencies):
+    """음식점 하나 처리 시간을 latencies 에 (초, 성공 여부) 로 기록하는 래퍼"""
+    def wrapper(*args):
+        started = time.perf_counter()
+        result = function(*args)
+        latencies.append((time.perf_counter() - started, bool(result)))
+        return result
+    return wrapper
+
+
+def _timed_async(function, latencies):
+    async def wrapper(*args):
+        started = time.perf_counter()
+        result = await function(*args)
+        latencies.append((time.perf_counter() - started, bool(result)))
+        return result
+    return wrapper
+
+
+def run_simple(start_url, base_url, options, latencies):
+    """MichelinScraper: 순차 수집"""
+    from michelin_scraper import MichelinScraper
+
+    scraper = MichelinScraper(rate_limiter=unlimited_rate_limiter())
+    scraper.base_url = base_url
+    scraper.scrape_restaurant_detail = _timed(scraper.scrape_restaurant_detail, latencies)
+    try:
+        scraper.scrape_all_restaurants(start_url)
+    finally:
+        scraper.close_selenium_driver()
+    return scraper.retry_policy.retries
+
+
+def run_ultra(start_url, base_url, options, latencies):
+    """UltraFastMichelinScraper: 스레드 워커 + 이미지 다운로드 단계"""
+    from michelin_scraper_ultra_fast import UltraFastMichelinScraper, scrape_restaurants_continuously
+
+    scraper = UltraFastMichelinScraper(max_workers=options['max_workers'], driver_pool_size=0,
+                                       scrape_images=options['images'], image_workers=options['image_workers'],
+                                       rate_limiter=unlimited_rate_limiter(), parser_backend=options['parser'],
+                                       parse_processes=options['parse_processes'])
+    scraper.base_url = base_url
+    scraper.scrape_restaurant_detail = _timed(scraper.scrape_restaurant_detail, latencies)
+    try:
+        scrape_restaurants_continuously(scraper, scraper.iter_restaurant_urls(start_url))
+    finally:
+        scraper.image_pipeline.close()
+        scraper.page_parser.close()
+        scraper.driver_pool.close()
+    return scraper.retry_policy.retries
+
+
+def run_async(start_url, base_url, options, latencies):
+    """AsyncMichelinScraper: aiohttp 목록/상세 + 스레드 이미지 수집"""
+    from michelin_scraper_async import AsyncMichelinScraper
+
+    scraper = AsyncMichelinScraper(driver_pool_size=0, scrape_images=options['images'],
+                                   per_host_limit=options['per_host_limit'], image_workers=options['image_workers'],
+                                   rate_limiter=unlimited_rate_limiter(), parser_backend=options['parser'],
+                                   parse_processes=options['parse_processes'])
+    scraper.base_url = base_url
+    scraper.scrape_restaurant_detail_async = _timed_async(scraper.scrape_restaurant_detail_async, latencies)
+    try:
+        asyncio.run(scraper.crawl(start_url))
+    finally:
+        scraper.close()
+    return scraper.retry_policy.retries
+
+
+# 새 엔진은 (start_url, base_url, options, latencies) → 재시도 수 함수를 여기에 추가
+ENGINES = {
+    'simple': run_simple,
+    'ultra': run_ultra,
+    'async': run_async,
+}
+
+
+def percentile(values, q):
+    """nearest-rank 백분위수 (값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class TreeRssSampler:
+    """실행 중 이 프로세스와 모든 자식(chromedriver, Chrome 등) RSS 합의 최대값을 주기적으로 측정"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+
+    def _sample(self):
+        rss = process_tree_rss_mb(os.getpid())
+        if rss is not None:
+            self.peak_mb = max(self.peak_mb, rss)
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+        self._sample()
+
+
+def _engine_process(engine, start_url, base_url, options, results):
+    """자식 프로세스: 임시 작업 폴더에서 엔진 한 번 실행 후 결과를 큐로 전달"""
+    configure_logging('WARNING')
+    os.chdir(tempfile.mkdtemp(prefix=f"michelin_replay_{engine}_"))  # restaurant_images 등 산출물 격리
+    latencies = []
+    started = time.perf_counter()
+    with TreeRssSampler() as sampler:
+        try:
+            retries = ENGINES[engine](start_url, base_url, options, latencies)
+            error = None
+        except Exception as e:
+            retries, error = 0, str(e)
+    elapsed = time.perf_counter() - started
+
+    ok_latencies = [seconds for seconds, ok in latencies if ok]
+    results.put({
+        'engine': engine,
+        'ok': len(ok_latencies),
+        'failed': len(latencies) - len(ok_latencies),
+        'seconds': round(elapsed, 3),
+        'restaurants_per_second': round(len(ok_latencies) / elapsed, 2) if elapsed > 0 else 0.0,
+        'p50_seconds': round(percentile(ok_latencies, 50), 3),
+        'p95_seconds': round(percentile(ok_latencies, 95), 3),
+        # 샘플링한 프로세스 트리 최대값 (샘플 사이의 짧은 최대값은 자기/종료된 자식 ru_maxrss 로 보완, 리눅스는 KB)
+        'peak_rss_mb': round(max(
+            sampler.peak_mb,
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+        ), 1),
+        'retries': retries,
+        'error': error,
+    })
+
+
+def run_engine(engine, server, options, timeout=3600):
+    """엔진을 새 프로세스에서 실행하고 결과 dict 반환"""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    errors_before = server.faults.errors
+    process = context.Process(target=_engine_process,
+                              args=(engine, server.site.start_url, server.base_url, options, results))
+    process.start()
+    try:
+        result = results.get(timeout=timeout)
+    finally:
+        process.join()
+    result['injected_errors'] = server.faults.errors - errors_before
+    return result
+
+
+def print_results(results):
+    print("\n" + "=" * 102)
+    print(f"{'엔진':<8}{'성공':>6}{'실패':>6}{'시간(초)':>10}{'음식점/초':>10}{'p50(초)':>10}{'p95(초)':>10}"
+          f"{'최대 RSS(MB,자식 포함)':>20}{'재시도':>8}{'주입 오류':>10}")
+    print("=" * 102)
+    for r in results:
+        print(f"{r['engine']:<8}{r['ok']:>6}{r['failed']:>6}{r['seconds']:>10.2f}{r['restaurants_per_second']:>10.2f}"
+              f"{r['p50_seconds']:>10.3f}{r['p95_seconds']:>10.3f}{r['peak_rss_mb']:>20.1f}{r['retries']:>8}"
+              f"{r['injected_errors']:>10}")
+        if r['error']:
+            print(f"   ❌ {r['engine']} 실행 오류: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화/합성 픽스처 재생 벤치마크")
+    parser.add_argument('--archive', default=None, help="fixture_archive.py 로 녹화한 아카이브 (없으면 합성 픽스처)")
+    parser.add_argument('--restaurants', type=int, default=60, help="합성 픽스처 음식점 수")
+    parser.add_argument('--engines', default=','.join(ENGINES), help=f"실행할 엔진 (쉼표 구분: {', '.join(ENGINES)})")
+    parser.add_argument('--latency', type=float, default=0.1, help="요청당 서버 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 을 돌려줄 요청 비율 (0~1)")
+    parser.add_argument('--seed', type=int, default=42, help="지터/오류 주입 난수 시드")
+    parser.add_argument('--max-workers', type=int, default=4, help="ultra 엔진 워커 수")
+    parser.add_argument('--per-host-limit', type=int, default=8, help="async 엔진 호스트당 동시 요청 수")
+    parser.add_argument('--image-workers', type=int, default=8, help="이미지 다운로드 워커 수")
+    parser.add_argument('--parser', default=DEFAULT_BACKEND, choices=BACKEND_NAMES, help="HTML 파서 백엔드")
+    parser.add_argument('--parse-processes', type=int, default=0, help="파싱 프로세스 수")
+    parser.add_argument('--no-images', action='store_true', help="ultra/async 엔진에서 이미지 수집 생략")
+    parser.add_argument('--output', default=None, help="결과를 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    engines = [name.strip() for name in args.engines.split(',') if name.strip()]
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown:
+        parser.error(f"알 수 없는 엔진: {', '.join(unknown)}")
+
+    site = ArchiveSite(args.archive) if args.archive else FixtureSite(restaurant_count=args.restaurants)
+    options = {
+        'max_workers': args.max_workers,
+        'per_host_limit': args.per_host_limit,
+        'image_workers': args.image_workers,
+        'parser': args.parser,
+        'parse_processes': args.parse_processes,
+        'images': not args.no_images,
+    }
+
+    results = []
+    with FixtureServer(site, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                       seed=args.seed) as server:
+        print(f"🧪 재생 서버: {server.base_url} ({'아카이브 ' + args.archive if args.archive else '합성 픽스처'}, "
+              f"음식점 {site.restaurant_count}개, 지연 {args.latency}s + 지터 {args.jitter}s, 오류 {args.error_rate:.0%})")
+        for engine in engines:
+            print(f"▶️ {engine} 실행 중...")
+            results.append(run_engine(engine, server, options))
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'settings': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스스로 복구하는 Selenium 브라우저 풀
+- 체크아웃할 때마다 드라이버가 살아있는지 확인하고, 죽었으면 버리고 새로 띄움
+- N 페이지를 처리했거나 Chrome 프로세스 트리 RSS 가 임계값을 넘으면 드라이버 교체(recycle)
+- 살아있는 브라우저 수는 size 를 넘지 않음 (풀이 비어도 몰래 추가 생성하지 않고 기다림)
+- 시작할 때 드라이버를 병렬로 띄움
+- 대기 시간, 사용률, 교체 사유 등 풀 지표 제공
+오래 도는 크롤에서 Chrome 이 부풀거나 좀비 드라이버가 쌓이는 것을 막습니다.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 리눅스 /proc 으로 RSS 계산
+    psutil = None
+
+
+def process_tree_rss_mb(pid):
+    """pid 와 모든 자식 프로세스의 RSS 합 (MB, 알 수 없으면 None)"""
+    if pid is None:
+        return None
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes if p.is_running()) / 1024 / 1024
+        except psutil.Error:
+            return None
+    if not os.path.isdir('/proc'):
+        return None
+
+    # /proc/<pid>/stat 의 부모 pid 로 프로세스 트리를 구성
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+        stack.extend(children.get(current, []))
+    return total_kb / 1024
+
+
+def driver_pid(driver):
+    """chromedriver 서비스 프로세스 pid (Chrome 은 그 자식 프로세스)"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created = time.monotonic()
+        self.checked_out = None
+
+
+class BrowserPool:
+    def __init__(self, factory, size=4, max_pages=50, max_rss_mb=1500, checkout_timeout=60):
+        """
+        Args:
+            factory: 새 드라이버를 만드는 함수 (실패하면 None)
+            size: 동시에 살아있을 수 있는 최대 브라우저 수
+            max_pages: 이 페이지 수를 처리하면 드라이버 교체 (0 이면 끔)
+            max_rss_mb: 프로세스 트리 RSS 가 이 값을 넘으면 교체 (0 이면 끔)
+            checkout_timeout: 모든 브라우저가 사용 중일 때 기다리는 최대 시간 (초)
+        """
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.checkout_timeout = checkout_timeout
+
+        self.condition = threading.Condition()
+        self.idle = []           # 대기 중인 _PooledDriver
+        self.in_use = {}         # id(driver) → _PooledDriver
+        self.live = 0            # 살아있거나 생성 중인 브라우저 수 (≤ size)
+        self.closed = False
+
+        self.started_at = time.monotonic()
+        self.stats = {
+            'checkouts': 0, 'timeouts': 0, 'created': 0, 'create_failed': 0,
+            'recycled_pages': 0, 'recycled_rss': 0, 'dead': 0,
+            'wait_seconds': 0.0, 'max_wait_seconds': 0.0, 'busy_seconds': 0.0, 'peak_rss_mb': 0.0
+        }
+
+    def _spawn(self):
+        """드라이버 하나 생성 (live 자리는 호출자가 미리 확보)"""
+        driver = None
+        try:
+            driver = self.factory()
+        finally:
+            with self.condition:
+                if driver is None:
+                    self.live -= 1
+                    self.stats['create_failed'] += 1
+                else:
+                    self.stats['created'] += 1
+                self.condition.notify_all()
+        return _PooledDriver(driver) if driver is not None else None
+
+    def start(self):
+        """size 개 드라이버를 병렬로 띄워 풀을 채우고 준비된 수 반환"""
+        with self.condition:
+            missing = self.size - self.live
+            self.live += missing
+        if missing <= 0:
+            return self.live
+
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            for pooled in executor.map(lambda _: self._spawn(), range(missing)):
+                if pooled:
+                    with self.condition:
+                        self.idle.append(pooled)
+                        self.condition.notify()
+        return self.live
+
+    def _is_alive(self, pooled):
+        try:
+            pooled.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, pooled, reason=None):
+        """드라이버 종료 후 자리 반납 (reason 이 있으면 교체 사유로 집계)"""
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self.condition:
+            self.live -= 1
+            if reason:
+                self.stats[reason] += 1
+            self.condition.notify_all()
+
+    def checkout(self):
+        """살아있는 드라이버를 빌려줌 (제한 시간 안에 못 구하면 None)"""
+        started = time.monotonic()
+        deadline = started + self.checkout_timeout
+        while True:
+            pooled = None
+            spawn = False
+            with self.condition:
+                while not self.closed and not self.idle and self.live >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats['timeouts'] += 1
+                        return None
+                    self.condition.wait(remaining)
+                if self.closed:
+                    return None
+                if self.idle:
+                    pooled = self.idle.pop()
+                else:
+                    self.live += 1  # 한도 안에서 새로 띄울 자리 확보
+                    spawn = True
+
+            if spawn:
+                pooled = self._spawn()
+                if pooled is None:
+                    return None
+            elif not self._is_alive(pooled):
+                print("    ♻️ 응답 없는 드라이버 폐기 후 교체")
+                self._discard(pooled, 'dead')
+                continue
+
+            waited = time.monotonic() - started
+            with self.condition:
+                pooled.checked_out = time.monotonic()
+                self.in_use[id(pooled.driver)] = pooled
+                self.stats['checkouts'] += 1
+                self.stats['wait_seconds'] += waited
+                self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], waited)
+            return pooled.driver
+
+    def checkin(self, driver, healthy=True, pages=1):
+        """드라이버 반납 (pages: 빌려간 동안 처리한 페이지 수): 페이지 수/RSS 한도를 넘었거나 비정상이면 교체"""
+        if driver is None:
+            return
+        with self.condition:
+            pooled = self.in_use.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        pooled.pages += pages
+        with self.condition:
+            self.stats['busy_seconds'] += time.monotonic() - pooled.checked_out
+
+        if self.closed:
+            self._discard(pooled)
+            return
+        if not healthy:
+            self._discard(pooled, 'dead')
+            return
+        if self.max_pages and pooled.pages >= self.max_pages:
+            self._discard(pooled, 'recycled_pages')
+            return
+        if self.max_rss_mb:
+            rss = process_tree_rss_mb(driver_pid(driver))
+            if rss is not None:
+                with self.condition:
+                    self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], rss)
+                if rss > self.max_rss_mb:
+                    print(f"    ♻️ 드라이버 메모리 {rss:.0f}MB > {self.max_rss_mb}MB, 교체")
+                    self._discard(pooled, 'recycled_rss')
+                    return
+
+        with self.condition:
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    def close(self):
+        """대기 중인 드라이버 종료 (사용 중인 드라이버는 반납될 때 종료)"""
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.condition.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+
+    def snapshot(self):
+        """풀 지표 (dict)"""
+        with self.condition:
+            stats = dict(self.stats)
+            wall = time.monotonic() - self.started_at
+            stats['live'] = self.live
+            stats['idle'] = len(self.idle)
+            stats['in_use'] = len(self.in_use)
+            stats['avg_wait_seconds'] = round(stats['wait_seconds'] / stats['checkouts'], 3) if stats['checkouts'] else 0.0
+            stats['utilization'] = round(stats['busy_seconds'] / (self.size * wall), 3) if self.size and wall > 0 else 0.0
+            return stats
+
+    def print_summary(self):
+        stats = self.snapshot()
+        print(f"🧭 브라우저 풀: 대여 {stats['checkouts']}회 (평균 대기 {stats['avg_wait_seconds']}초, "
+              f"최대 {stats['max_wait_seconds']:.2f}초, 시간 초과 {stats['timeouts']}회), 사용률 {stats['utilization'] * 100:.0f}%")
+        print(f"   생성 {stats['created']}개 (실패 {stats['create_failed']}개), 교체: 페이지 수 {stats['recycled_pages']}개, "
+              f"메모리 {stats['recycled_rss']}개, 응답 없음 {stats['dead']}개, 최대 RSS {stats['peak_rss_mb']:.0f}MB")
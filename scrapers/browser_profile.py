@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+갤러리 URL 추출용 경량(lean) 브라우저 프로필
+Selenium 단계에서는 img[ci-src] 속성만 읽으므로 이미지 본문, 폰트, 분석/광고 스크립트를 받을 필요가 없습니다.
+- Chrome 이미지 로딩 끔 (content settings) + CDP Network.setBlockedURLs 로 폰트/트래커/이미지 URL 차단
+- 갤러리 모달을 여는 데 필요한 사이트 자체 JS/CSS 는 그대로 둠
+- performance 로그(Network.loadingFinished/loadingFailed)로 페이지당 전송 바이트, 차단 요청 수, 시간 집계
+
+사용법 (같은 페이지를 일반/경량 프로필로 열어 절약량 비교):
+    python browser_profile.py https://guide.michelin.com/kr/ko/.../restaurant/woo-lae-oak
+"""
+
+import json
+import sys
+import threading
+import time
+
+# 이미지/폰트 본문, 분석·광고·소셜 서드파티 스크립트
+LEAN_BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*cloudimg.io*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*facebook.net*', '*facebook.com/tr*', '*hotjar.com*', '*criteo.*', '*scorecardresearch.com*',
+    '*cookielaw.org*', '*onetrust.com*', '*optimizely.com*', '*newrelic.com*', '*nr-data.net*',
+]
+
+
+def configure_chrome_options(chrome_options, lean=True):
+    """Chrome 옵션에 트래픽 측정용 performance 로그와 (lean 이면) 이미지 끄기 설정 추가"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    if lean:
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    return chrome_options
+
+
+def apply_lean_profile(driver, patterns=LEAN_BLOCKED_URL_PATTERNS):
+    """생성된 드라이버에 CDP 로 URL 차단 목록 적용 (실패하면 False)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        return True
+    except Exception as e:
+        print(f"⚠️ 경량 브라우저 프로필 적용 실패 (일반 모드로 진행): {e}")
+        return False
+
+
+def drain_traffic(driver):
+    """지난 호출 이후 쌓인 performance 로그를 비우고 {'bytes', 'requests', 'blocked'} 반환 (로그가 없으면 None)"""
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return None
+
+    traffic = {'bytes': 0, 'requests': 0, 'blocked': 0}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.loadingFinished':
+            traffic['bytes'] += int(params.get('encodedDataLength', 0))
+            traffic['requests'] += 1
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            traffic['blocked'] += 1
+    return traffic
+
+
+class BrowserTrafficStats:
+    """프로필(lean/full)별 페이지당 바이트, 요청 수, 차단 수, 시간 집계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = {}
+
+    def record(self, profile, seconds, traffic):
+        with self.lock:
+            stats = self.profiles.setdefault(profile, {'pages': 0, 'seconds': 0.0, 'bytes': 0, 'requests': 0, 'blocked': 0})
+            stats['pages'] += 1
+            stats['seconds'] += seconds
+            if traffic:
+                stats['bytes'] += traffic['bytes']
+                stats['requests'] += traffic['requests']
+                stats['blocked'] += traffic['blocked']
+
+    def per_page(self, profile):
+        """프로필의 페이지당 평균 (없으면 None)"""
+        with self.lock:
+            stats = self.profiles.get(profile)
+            if not stats or not stats['pages']:
+                return None
+            pages = stats['pages']
+            return {
+                'pages': pages,
+                'seconds': stats['seconds'] / pages,
+                'kb': stats['bytes'] / pages / 1024,
+                'requests': stats['requests'] / pages,
+                'blocked': stats['blocked'] / pages
+            }
+
+    def print_summary(self):
+        for profile in ('full', 'lean'):
+            average = self.per_page(profile)
+            if average:
+                print(f"🌐 브라우저({profile}): 페이지 {average['pages']}개, 페이지당 {average['kb']:.0f}KB, "
+                      f"요청 {average['requests']:.0f}개, 차단 {average['blocked']:.0f}개, {average['seconds']:.2f}초")
+        full, lean = self.per_page('full'), self.per_page('lean')
+        if full and lean:
+            print(f"💡 경량 프로필 절약: 페이지당 {full['kb'] - lean['kb']:.0f}KB, {full['seconds'] - lean['seconds']:.2f}초")
+
+
+def compare_profiles(urls):
+    """같은 URL들을 일반/경량 프로필로 열어 갤러리 추출 시간과 전송량 비교"""
+    from michelin_scraper_ultra_fast import UltraFastMichelinScraper
+
+    stats = None
+    for lean in (False, True):
+        scraper = UltraFastMichelinScraper(max_workers=1, driver_pool_size=1, lean_browser=lean)
+        if stats is None:
+            stats = scraper.browser_traffic
+        scraper.browser_traffic = stats
+        try:
+            for url in urls:
+                scraper.extract_gallery_urls_with_selenium_pool(url, url.rstrip('/').rsplit('/', 1)[-1])
+        finally:
+            scraper.image_pipeline.close()
+            scraper.page_parser.close()
+            scraper.driver_pool.close()
+    stats.print_summary()
+    return stats
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python browser_profile.py <음식점 URL> [<음식점 URL> ...]")
+        sys.exit(1)
+    started = time.time()
+    compare_profiles(sys.argv[1:])
+    print(f"⏱️ 비교 완료: {time.time() - started:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,135 +3,495 @@
 """
 이미지 파일 형식을 JPG로 통일하는 스크립트 (자동 실행 버전)
 restaurant_images 폴더의 모든 JPEG, PNG 파일을 JPG로 변환합니다.
+
+변환 매니페스트(<폴더>_conversion.json)에 원본 해시/크기/수정 시각과 결과 파일을 기록해서
+다시 실행하면 새로 생기거나 바뀐 파일만 처리합니다.
+원본 백업은 기본적으로 하드링크(같은 디스크가 아니면 복사)로 만들어 디스크 I/O 를 두 배로 늘리지 않습니다.
+
+이미 JPEG 인 파일(확장자가 아니라 매직 바이트로 판별)은 기본적으로 디코드하지 않고
+메타데이터(EXIF/XMP/IPTC/주석) 세그먼트만 걷어내 .jpg 로 저장합니다 (화질 손실 없음).
+jpegtran 이 설치되어 있으면 허프만 테이블 최적화까지 무손실로 적용합니다.
+전체 디코드/재인코드는 PNG·팔레트 등 JPEG 가 아닌 원본에만 사용합니다 (--jpeg-mode reencode 로 이전 방식).
+
+변환이 끝나면 michelin_restaurants.json(public/, src/data/)의 images[].filename/local_path 를
+변환된 파일명으로 바꾸고, 참조하는 파일이 모두 있는지 확인한 뒤 원자적으로 저장합니다.
+
+사용법:
+    python scrapers/convert_images_auto.py --source public/restaurant_images   (저장소 루트에서)
 """
 
+import argparse
+import hashlib
+import io
+import json
 import os
+import posixpath
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 import shutil
+import subprocess
+
+BACKUP_MODES = ('link', 'copy', 'none')
+JPEG_MODES = ('lossless', 'reencode')
+DATA_FILES = ('public/michelin_restaurants.json', 'src/data/michelin_restaurants.json')
+
+def manifest_path_for(source_path):
+    """변환 매니페스트 경로 (이미지 폴더 옆)"""
+    source_path = Path(source_path)
+    return source_path.parent / f"{source_path.name}_conversion.json"
+
+def load_manifest(path):
+    """원본 파일명 → 변환 기록"""
+    if not Path(path).exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('files', {})
+
+def save_manifest(path, files):
+    """임시 파일에 쓴 뒤 교체 (중간에 끊겨도 이전 매니페스트 유지)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'files': files}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+def backup_original(file_path, backup_dir, mode='link'):
+    """
+    원본 백업 (이미 같은 크기의 백업이 있으면 다시 만들지 않음)
+    link: 하드링크 (원본을 지운 뒤에도 데이터가 남음, 다른 디스크면 복사로 대체)
+    copy: 복사
+    """
+    backup_file = Path(backup_dir) / file_path.name
+    if backup_file.exists() and backup_file.stat().st_size == file_path.stat().st_size:
+        return 'existing'
+    if backup_file.exists():
+        backup_file.unlink()
+    if mode == 'link':
+        try:
+            os.link(file_path, backup_file)
+            return 'link'
+        except OSError:
+            pass  # 다른 파일 시스템이거나 링크를 지원하지 않으면 복사
+    shutil.copy2(file_path, backup_file)
+    return 'copy'
+
+def sniff_format(data):
+    """매직 바이트로 이미지 형식 판별 ('jpeg', 'png', 'gif', 'webp' 또는 None)"""
+    if data[:3] == b'\xff\xd8\xff':
+        return 'jpeg'
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+# 화면 표시에 필요한 세그먼트: APP0(JFIF), APP2(ICC 프로파일), APP14(Adobe 색 변환)
+KEEP_APP_MARKERS = (0xE0, 0xE2, 0xEE)
+
+def strip_jpeg_metadata(data, keep_exif=False):
+    """
+    JPEG 바이트에서 메타데이터 세그먼트(APP1 EXIF/XMP, APP13 IPTC, COM 등)만 제거 (디코드 없음)
 
-def convert_images_to_jpg(source_dir="restaurant_images", backup=True):
+    SOS 이후 압축 데이터는 그대로 복사하므로 픽셀은 바뀌지 않습니다.
+    keep_exif: 회전(Orientation) 정보가 있는 경우 APP1 을 유지
+    """
+    output = bytearray(data[:2])
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            raise ValueError(f"잘못된 JPEG 세그먼트 (offset {pos})")
+        marker = data[pos + 1]
+        if marker == 0xFF:  # 채움 바이트
+            pos += 1
+            continue
+        if marker == 0xDA:  # SOS: 이후는 엔트로피 코딩 데이터
+            output += data[pos:]
+            return bytes(output)
+        length = int.from_bytes(data[pos + 2:pos + 4], 'big')
+        segment = data[pos:pos + 2 + length]
+        is_app = 0xE0 <= marker <= 0xEF
+        if marker == 0xFE or (is_app and marker not in KEEP_APP_MARKERS and not (keep_exif and marker == 0xE1)):
+            pass
+        else:
+            output += segment
+        pos += 2 + length
+    raise ValueError("JPEG 에 SOS 세그먼트가 없습니다")
+
+def jpegtran_optimize(data):
+    """jpegtran 이 있으면 허프만 테이블 무손실 최적화 (없거나 실패하면 None)"""
+    jpegtran = shutil.which('jpegtran')
+    if not jpegtran:
+        return None
+    result = subprocess.run([jpegtran, '-copy', 'all', '-optimize'], input=data, capture_output=True)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
+
+def has_rotation(data):
+    """EXIF Orientation 이 기본값(1)이 아닌지 (헤더만 읽음)"""
+    with Image.open(io.BytesIO(data)) as img:
+        return img.getexif().get(0x0112, 1) != 1
+
+def lossless_jpeg(data):
+    """디코드 없이 메타데이터 제거 + (가능하면) 허프만 최적화한 JPEG 바이트"""
+    stripped = strip_jpeg_metadata(data, keep_exif=has_rotation(data))
+    optimized = jpegtran_optimize(stripped)
+    if optimized and len(optimized) < len(stripped):
+        return optimized
+    return stripped
+
+def convert_one(file_path, backup_dir=None, backup_mode='link', previous=None, jpeg_mode='lossless'):
+    """
+    파일 하나를 JPG로 변환 (프로세스 풀 워커에서도 실행되므로 예외는 결과로 돌려줌)
+
+    Args:
+        previous: 이 원본의 이전 매니페스트 기록 (해시가 같으면 변환 생략)
+        jpeg_mode: 'lossless' 면 JPEG 원본은 디코드 없이 메타데이터만 제거, 'reencode' 면 품질 95 로 재인코드
+    Returns:
+        (상태, 메시지, 매니페스트 기록): 상태는 'converted', 'skipped', 'error'
+    """
+    file_path = Path(file_path)
+    tmp_path = None
+    try:
+        # 새 파일명 생성 (확장자를 .jpg로 변경)
+        new_filename = file_path.stem + '.jpg'
+        new_file_path = file_path.parent / new_filename
+
+        # 원본은 한 번만 읽어서 해시와 디코드에 함께 사용
+        started = time.perf_counter()
+        data = file_path.read_bytes()
+        stat = file_path.stat()
+        record = {
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'output': new_filename,
+        }
+
+        # 이미 JPG 파일이 존재하고 원본이 바뀌지 않았으면 스킵
+        if new_file_path.exists():
+            if previous is None or previous.get('sha256') == record['sha256']:
+                record['output_size'] = new_file_path.stat().st_size
+                return 'skipped', f"{file_path.name} (이미 JPG 파일 존재)", record
+
+        # 백업 생성
+        if backup_dir:
+            record['backup'] = backup_original(file_path, backup_dir, backup_mode)
+
+        # 임시 파일에 다 쓴 뒤 교체 (변환이 실패해도 빈/깨진 .jpg 가 남아 다음 실행에서 스킵되지 않게)
+        tmp_path = new_file_path.with_name(f".{new_filename}.{os.getpid()}.tmp")
+        if jpeg_mode == 'lossless' and sniff_format(data) == 'jpeg':
+            # 이미 JPEG: 압축 데이터는 그대로 두고 파일명/메타데이터만 정리
+            output = lossless_jpeg(data)
+            with open(tmp_path, 'wb') as f:
+                f.write(output)
+            record['method'] = 'lossless'
+        else:
+            save_as_jpeg(data, tmp_path)
+            record['method'] = 'reencode'
+        os.replace(tmp_path, new_file_path)
+
+        # 원본 파일 삭제
+        file_path.unlink()
+        record['output_size'] = new_file_path.stat().st_size
+        record['seconds'] = round(time.perf_counter() - started, 4)
+        saved = record['size'] - record['output_size']
+        return 'converted', (f"{file_path.name} → {new_filename} [{record['method']}, "
+                             f"{saved / 1024:+.1f}KB 절감, {record['seconds'] * 1000:.0f}ms]"), record
+
+    except Exception as e:
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
+        return 'error', f"{file_path.name} - {str(e)}", None
+
+def save_as_jpeg(data, new_file_path):
+    """디코드 후 흰 배경 RGB 로 바꿔 JPEG(품질 95) 로 저장 (PNG/팔레트 원본용)"""
+    with Image.open(io.BytesIO(data)) as img:
+        # RGBA 모드인 경우 RGB로 변환 (투명도 제거)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # 흰색 배경으로 변환
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # JPG로 저장 (품질 95%)
+        img.save(new_file_path, 'JPEG', quality=95, optimize=True)
+
+def _convert_one_job(job):
+    """executor.map 용 (파일 경로, 백업 디렉토리, 백업 방식, 이전 기록, JPEG 모드) 언패킹"""
+    return convert_one(*job)
+
+def _with_collision_skips(files_to_convert, output_owner, results):
+    """워커 결과 사이에 출력 파일명이 겹쳐 보내지 않은 파일의 스킵 결과를 입력 순서대로 끼워 넣음"""
+    results = iter(results)
+    for file_path in files_to_convert:
+        owner = output_owner[file_path.stem + '.jpg']
+        if owner == file_path:
+            yield next(results)
+        else:
+            yield 'skipped', f"{file_path.name} (같은 이름으로 변환되는 {owner.name} 먼저 처리)", None
+
+def is_unchanged(file_path, stat, previous):
+    """매니페스트 기록과 크기/수정 시각이 같고 결과 파일이 있으면 해시 계산 없이 변경 없음으로 판단"""
+    if not previous:
+        return False
+    return (previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime
+            and (file_path.parent / previous['output']).exists())
+
+def convert_images_to_jpg(source_dir="restaurant_images", backup=True, workers=1, backup_mode='link',
+                          manifest_path=None, jpeg_mode='lossless'):
     """
     지정된 디렉토리의 모든 이미지를 JPG 형식으로 변환합니다.
-    
+
     Args:
         source_dir (str): 이미지가 있는 디렉토리 경로
         backup (bool): 원본 파일을 백업할지 여부
+        workers (int): 변환 프로세스 수 (1 이면 현재 프로세스에서 순차 변환)
+        backup_mode (str): 'link' (하드링크, 안 되면 복사), 'copy' (한 번만 복사), 'none'
+        manifest_path (str): 변환 매니페스트 경로 (기본: <source_dir>_conversion.json)
+        jpeg_mode (str): 'lossless' (JPEG 원본은 디코드 없이 정리) 또는 'reencode' (모두 재인코드)
+    Returns:
+        변환 매니페스트 (원본 파일명 → 기록)
     """
-    
+
     # 디렉토리 경로 설정
     source_path = Path(source_dir)
-    
+
     if not source_path.exists():
         print(f"❌ 디렉토리를 찾을 수 없습니다: {source_dir}")
-        return
-    
+        return {}
+
     # 백업 디렉토리 생성
-    if backup:
-        backup_dir = source_path.parent / f"{source_dir}_backup"
+    backup_dir = None
+    if backup and backup_mode != 'none':
+        backup_dir = source_path.parent / f"{source_path.name}_backup"
         backup_dir.mkdir(exist_ok=True)
-        print(f"📁 백업 디렉토리 생성: {backup_dir}")
-    
+        print(f"📁 백업 디렉토리: {backup_dir} ({backup_mode})")
+
+    manifest_path = Path(manifest_path) if manifest_path else manifest_path_for(source_path)
+    manifest = load_manifest(manifest_path)
+
     # 변환할 파일 확장자들
-    target_extensions = ['.jpeg', '.png']
-    
-    # 변환할 파일들 찾기
+    target_extensions = ('.jpeg', '.png')
+
+    # 변환할 파일들 찾기 (디렉토리 한 번만 읽고, 매니페스트와 크기/시각이 같은 파일은 제외)
     files_to_convert = []
-    for ext in target_extensions:
-        files_to_convert.extend(source_path.glob(f"*{ext}"))
-    
+    unchanged_count = 0
+    with os.scandir(source_path) as entries:
+        for entry in entries:
+            if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in target_extensions:
+                continue
+            file_path = source_path / entry.name
+            if is_unchanged(file_path, entry.stat(), manifest.get(entry.name)):
+                unchanged_count += 1
+                continue
+            files_to_convert.append(file_path)
+    files_to_convert.sort()
+
     if not files_to_convert:
-        print("✅ 변환할 파일이 없습니다.")
-        return
-    
-    print(f"🔍 변환할 파일 {len(files_to_convert)}개 발견")
-    
+        print(f"✅ 변환할 파일이 없습니다. (매니페스트 기준 변경 없음 {unchanged_count}개)")
+        return manifest
+
+    print(f"🔍 변환할 파일 {len(files_to_convert)}개 발견 (매니페스트 기준 변경 없음 {unchanged_count}개)")
+
     # 변환 통계
     converted_count = 0
     error_count = 0
     skipped_count = 0
-    
-    for i, file_path in enumerate(files_to_convert, 1):
-        try:
-            # 새 파일명 생성 (확장자를 .jpg로 변경)
-            new_filename = file_path.stem + '.jpg'
-            new_file_path = file_path.parent / new_filename
-            
-            # 이미 JPG 파일이 존재하는 경우 스킵
-            if new_file_path.exists():
-                print(f"⏭️  스킵 ({i}/{len(files_to_convert)}): {file_path.name} (이미 JPG 파일 존재)")
+    method_stats = {}  # 방식 → [파일 수, 원본 바이트, 결과 바이트, 초]
+    started = time.perf_counter()
+
+    # a.jpeg 와 a.png 처럼 같은 a.jpg 로 변환되는 파일은 첫 파일만 워커로 보냄
+    # (병렬 워커 둘이 동시에 a.jpg 존재 확인을 통과해 한쪽 이미지를 덮어쓰지 않도록, 나머지는 순차 실행과 같이 스킵)
+    output_owner = {}
+    for file_path in files_to_convert:
+        output_owner.setdefault(file_path.stem + '.jpg', file_path)
+    jobs = [(file_path, backup_dir, backup_mode, manifest.get(file_path.name), jpeg_mode)
+            for file_path in files_to_convert if output_owner[file_path.stem + '.jpg'] == file_path]
+    executor = None
+    if workers > 1:
+        # 디코드/인코드는 CPU 작업이므로 프로세스 풀에 나눠서 실행 (결과는 입력 순서대로 받음)
+        print(f"⚡ {workers}개 프로세스로 변환")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_convert_one_job, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+    else:
+        results = map(_convert_one_job, jobs)
+    results = _with_collision_skips(files_to_convert, output_owner, results)
+
+    try:
+        for i, (status, message, record) in enumerate(results, 1):
+            if record:
+                manifest[files_to_convert[i - 1].name] = record
+            if status == 'converted':
+                converted_count += 1
+                stats = method_stats.setdefault(record['method'], [0, 0, 0, 0.0])
+                stats[0] += 1
+                stats[1] += record['size']
+                stats[2] += record['output_size']
+                stats[3] += record['seconds']
+                print(f"✅ 완료 ({i}/{len(files_to_convert)}): {message}")
+            elif status == 'skipped':
                 skipped_count += 1
-                continue
-            
-            print(f"🔄 변환 중 ({i}/{len(files_to_convert)}): {file_path.name} → {new_filename}")
-            
-            # 백업 생성
-            if backup:
-                backup_file = backup_dir / file_path.name
-                shutil.copy2(file_path, backup_file)
-            
-            # 이미지 열기 및 변환
-            with Image.open(file_path) as img:
-                # RGBA 모드인 경우 RGB로 변환 (투명도 제거)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # 흰색 배경으로 변환
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # JPG로 저장 (품질 95%)
-                img.save(new_file_path, 'JPEG', quality=95, optimize=True)
-            
-            # 원본 파일 삭제
-            file_path.unlink()
-            
-            converted_count += 1
-            print(f"✅ 완료: {new_filename}")
-            
-        except Exception as e:
-            print(f"❌ 오류 ({i}/{len(files_to_convert)}): {file_path.name} - {str(e)}")
-            error_count += 1
-    
+                print(f"⏭️  스킵 ({i}/{len(files_to_convert)}): {message}")
+            else:
+                error_count += 1
+                print(f"❌ 오류 ({i}/{len(files_to_convert)}): {message}")
+    finally:
+        if executor:
+            executor.shutdown()
+        # 중간에 멈춰도 처리한 파일까지는 기록
+        save_manifest(manifest_path, manifest)
+
+    elapsed = time.perf_counter() - started
+
     # 결과 요약
     print("\n" + "="*50)
     print("📊 변환 결과 요약")
     print("="*50)
     print(f"✅ 성공적으로 변환: {converted_count}개")
-    print(f"⏭️  스킵된 파일: {skipped_count}개")
+    print(f"⏭️  스킵된 파일: {skipped_count + unchanged_count}개")
     print(f"❌ 오류 발생: {error_count}개")
     print(f"📁 총 처리된 파일: {len(files_to_convert)}개")
-    
-    if backup:
+    print(f"⏱️  소요 시간: {elapsed:.2f}초 ({len(files_to_convert) / elapsed:.1f}개/초)")
+    for method, (count, source_bytes, output_bytes, seconds) in method_stats.items():
+        print(f"📦 {method}: {count}개, {source_bytes / 1024 / 1024:.1f}MB → {output_bytes / 1024 / 1024:.1f}MB "
+              f"({(source_bytes - output_bytes) / 1024:+.0f}KB 절감), 파일당 {seconds / count * 1000:.1f}ms")
+    print(f"🗂️  매니페스트: {manifest_path}")
+
+    if backup_dir:
         print(f"💾 백업 위치: {backup_dir}")
-    
+
     print("\n🎉 이미지 변환이 완료되었습니다!")
+    return manifest
+
+def collect_renames(manifest):
+    """매니페스트의 원본 파일명 → 변환된 파일명"""
+    return {name: record['output'] for name, record in manifest.items() if record.get('output', name) != name}
+
+def rewrite_image_paths(restaurants, renames, image_dir):
+    """
+    음식점 목록을 한 번 순회하며 images[].filename/local_path 를 변환된 파일명으로 변경
+
+    매니페스트에 없는 예전 변환 결과도 원본이 없고 같은 이름의 .jpg 가 있으면 바꿉니다.
+    Returns:
+        (바뀐 이미지 수, 디스크에 없는 참조 목록)
+    """
+    image_dir = Path(image_dir)
+    changed = 0
+    missing = []
+    for restaurant in restaurants:
+        for image in restaurant.get('images', []):
+            filename = image.get('filename') or posixpath.basename(image.get('local_path', ''))
+            new_filename = renames.get(filename)
+            if new_filename is None and not (image_dir / filename).exists():
+                candidate = Path(filename).stem + '.jpg'
+                if (image_dir / candidate).exists():
+                    new_filename = candidate
+            if new_filename and new_filename != filename:
+                image['filename'] = new_filename
+                if 'local_path' in image:
+                    image['local_path'] = posixpath.join(posixpath.dirname(image['local_path']), new_filename)
+                filename = new_filename
+                changed += 1
+            if not (image_dir / filename).exists():
+                missing.append(f"{restaurant.get('name')}: {filename}")
+    return changed, missing
+
+def write_json_atomic(path, data):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 교체 (읽는 쪽은 이전/새 파일 중 하나만 봄)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def update_restaurant_data(data_paths, renames, image_dir):
+    """
+    음식점 JSON 들의 이미지 경로를 변환 결과에 맞게 갱신
+
+    내용이 같은 파일(public/ 과 src/data/ 사본)은 한 번만 파싱/수정해서 함께 저장하고,
+    참조하는 파일이 하나라도 없으면 아무것도 쓰지 않습니다.
+    Returns:
+        모든 참조가 존재하면 True
+    """
+    parsed = {}  # 파일 내용 → (음식점 목록, 바뀐 수, 누락 목록)
+    documents = []
+    for path in data_paths:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if raw not in parsed:
+            restaurants = json.loads(raw)
+            parsed[raw] = (restaurants, *rewrite_image_paths(restaurants, renames, image_dir))
+        documents.append((path, parsed[raw]))
+
+    ok = True
+    for path, (restaurants, changed, missing) in documents:
+        if missing:
+            ok = False
+            print(f"❌ {path}: 참조 이미지 {len(missing)}개가 {image_dir} 에 없습니다.")
+            for reference in missing[:20]:
+                print(f"   - {reference}")
+            if len(missing) > 20:
+                print(f"   ... 외 {len(missing) - 20}개")
+    if not ok:
+        print("⚠️  음식점 JSON 은 변경하지 않았습니다.")
+        return False
+
+    for path, (restaurants, changed, missing) in documents:
+        if changed:
+            write_json_atomic(path, restaurants)
+            print(f"📝 {path}: 이미지 경로 {changed}개 갱신")
+        else:
+            print(f"✅ {path}: 이미지 경로 변경 없음")
+    return True
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="restaurant_images 의 JPEG/PNG 를 JPG 로 변환")
+    parser.add_argument('--source', default='restaurant_images', help="변환할 이미지 디렉토리")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="변환 프로세스 수 (1 이면 순차 변환)")
+    parser.add_argument('--backup', default='link', choices=BACKUP_MODES,
+                        help="원본 백업 방식: link (하드링크, 안 되면 복사), copy (한 번만 복사), none")
+    parser.add_argument('--jpeg-mode', default='lossless', choices=JPEG_MODES,
+                        help="JPEG 원본 처리: lossless (디코드 없이 메타데이터 제거), reencode (품질 95 재인코드)")
+    parser.add_argument('--data', nargs='*', default=None,
+                        help=f"이미지 경로를 갱신할 음식점 JSON (기본: 있는 것만 {', '.join(DATA_FILES)})")
+    args = parser.parse_args()
+
     print("🖼️  이미지 파일을 JPG로 변환하는 스크립트 (자동 실행)")
     print("="*60)
-    
+
     # 현재 디렉토리에서 restaurant_images 폴더 찾기
     current_dir = Path.cwd()
-    restaurant_images_dir = current_dir / "restaurant_images"
-    
+    restaurant_images_dir = current_dir / args.source
+
     if not restaurant_images_dir.exists():
-        print("❌ restaurant_images 폴더를 찾을 수 없습니다.")
+        print(f"❌ {args.source} 폴더를 찾을 수 없습니다.")
         print("📁 현재 디렉토리:", current_dir)
         return
-    
+
     print(f"📁 대상 디렉토리: {restaurant_images_dir}")
     print("⚠️  이 작업은 원본 파일을 변경합니다.")
-    print("💾 원본 파일을 백업합니다.")
+    if args.backup != 'none':
+        print("💾 원본 파일을 백업합니다.")
     print("🚀 변환을 시작합니다...\n")
-    
-    # 변환 실행 (백업 활성화)
-    convert_images_to_jpg(str(restaurant_images_dir), backup=True)
+
+    # 변환 실행
+    manifest = convert_images_to_jpg(str(restaurant_images_dir), backup=args.backup != 'none', workers=args.workers,
+                                     backup_mode=args.backup, jpeg_mode=args.jpeg_mode)
+
+    # 음식점 JSON 의 이미지 경로 갱신
+    data_paths = args.data if args.data is not None else [path for path in DATA_FILES if Path(path).exists()]
+    if data_paths and not update_restaurant_data(data_paths, collect_renames(manifest), restaurant_images_dir):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크래시에 안전한 append-only 크롤 저널 (JSONL)
+음식점 하나, 이미지 하나가 끝날 때마다 한 줄씩 기록하고 fsync 합니다.
+--resume 으로 다시 실행하면 저널에 있는 URL은 건너뛰고,
+compact 단계에서 저널을 최종 michelin_restaurants.json 으로 정리합니다.
+
+사용법 (크래시 후 저널만으로 결과 만들기):
+    python crawl_journal.py crawl_journal.jsonl michelin_restaurants.json
+"""
+
+import json
+import os
+import sys
+import threading
+
+
+class CrawlJournal:
+    def __init__(self, path="crawl_journal.jsonl", resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.restaurants = {}  # url → 레코드 (뒤에 기록된 것이 우선)
+        self.images = {}       # 이미지 url → 로컬 경로
+
+        if resume:
+            self._load()
+        elif os.path.exists(path):
+            os.remove(path)  # 새 크롤은 빈 저널로 시작
+
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        """기존 저널 읽기 (크래시로 잘린 마지막 줄은 무시)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('type') == 'restaurant':
+                    self.restaurants[entry['url']] = entry['record']
+                elif entry.get('type') == 'image':
+                    self.images[entry['image_url']] = entry['local_path']
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def record_restaurant(self, record):
+        """완료된 음식점 레코드 기록"""
+        self.restaurants[record['url']] = record
+        self._append({'type': 'restaurant', 'url': record['url'], 'record': record})
+
+    def record_image(self, image_url, local_path):
+        """다운로드가 끝난 이미지 기록"""
+        self.images[image_url] = local_path
+        self._append({'type': 'image', 'image_url': image_url, 'local_path': local_path})
+
+    def downloaded_image(self, image_url):
+        """이전에 받은 이미지 파일이 남아있으면 경로 반환"""
+        local_path = self.images.get(image_url)
+        if local_path and os.path.exists(local_path):
+            return local_path
+        return None
+
+    def is_completed(self, url):
+        return url in self.restaurants
+
+    def completed_records(self):
+        """저널에 기록된 음식점 레코드 (처음 기록된 순서)"""
+        return list(self.restaurants.values())
+
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+def compact_journal(journal_path, output_path):
+    """저널을 URL 기준으로 정리해 최종 JSON 을 원자적으로 저장하고 레코드 수 반환"""
+    journal = CrawlJournal(journal_path, resume=True)
+    records = journal.completed_records()
+    journal.close()
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
+    print(f"🗜️ 저널 정리 완료: {len(records)}개 음식점 → {output_path}")
+    return len(records)
+
+
+def main():
+    if len(sys.argv) != 3:
+        print("사용법: python crawl_journal.py <저널.jsonl> <출력.json>")
+        sys.exit(1)
+    compact_journal(sys.argv[1], sys.argv[2])
+
+
+if __name__ == "__main__":
+    main()
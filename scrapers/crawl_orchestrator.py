@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 리전(도시/가이드)을 한 작업으로 수집하는 크롤 오케스트레이터
+- regions.json 매니페스트의 리전들을 동시에 수집
+- 전체 동시 작업 수(global cap)와 리전별 동시 작업 수(per-region cap)를 함께 적용
+- 스크래퍼 하나(HTTP 세션, 속도 제한기, Selenium 드라이버 풀, 이미지 다운로드 단계)를 모든 리전이 공유
+- 리전별 결과 샤드(michelin_restaurants_<리전>.json)와 합친 결과 + index.json 출력
+- --geocode 를 주면 저장 전에 레코드마다 카카오로 lat/lng 를 채움 (geocoding.py, 리전 시/도 기준 정규화, 주소 캐시)
+
+사용법:
+    python crawl_orchestrator.py --region seoul --region busan --max-concurrency 8
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from queue import Queue, Empty
+
+from requests.adapters import HTTPAdapter
+
+from crawl_journal import CrawlJournal
+from geocoding import DEFAULT_CACHE, GeocodeCache, create_geocoder, geocode_restaurants
+from http_cache import HttpCache, load_previous_records
+from michelin_scraper_ultra_fast import UltraFastMichelinScraper, scrape_single_restaurant_ultra
+from page_parser import BACKEND_NAMES, DEFAULT_BACKEND
+from regions import DEFAULT_MANIFEST, load_regions
+from run_metrics import configure_logging
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (중간에 죽어도 이전 파일이 깨지지 않음)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class RegionCrawl:
+    """리전 하나의 진행 상태: 찾은 URL 큐, 진행 중 작업 수, 결과"""
+
+    def __init__(self, region, max_concurrency):
+        self.region = region
+        self.name = region.name
+        self.max_concurrency = max_concurrency
+        self.url_queue = Queue()
+        self.discovery_done = threading.Event()
+        self.in_flight = 0
+        self.records = []
+        self.failed = 0
+
+    def discover(self, scraper, claim_url):
+        """목록 페이지를 돌며 이 리전이 처음 찾은 URL만 큐에 넣음 (별도 스레드)"""
+        try:
+            for url in scraper.iter_restaurant_urls(self.region.start_url):
+                if claim_url(url):
+                    self.url_queue.put(url)
+        except Exception as e:
+            print(f"❌ [{self.name}] 목록 수집 중 오류: {e}")
+        finally:
+            self.discovery_done.set()
+
+    def exhausted(self):
+        """목록 수집이 끝났고 남은 URL이 없으면 True"""
+        return self.discovery_done.is_set() and self.url_queue.empty()
+
+
+class CrawlOrchestrator:
+    def __init__(self, scraper, regions, max_concurrency=None, default_region_concurrency=None):
+        self.scraper = scraper
+        # 전체 동시 작업 수: 기본은 단일 리전 스케줄러와 같은 워커 수의 2배
+        self.max_concurrency = max_concurrency or scraper.max_workers * 2
+        default_region_concurrency = default_region_concurrency or self.max_concurrency
+        self.crawls = [
+            RegionCrawl(region, min(self.max_concurrency, region.max_concurrency or default_region_concurrency))
+            for region in regions
+        ]
+        self.claimed_urls = set()  # 리전 간 중복 URL 제거
+        self.claim_lock = threading.Lock()
+        self._share_http_pool()
+
+    def _share_http_pool(self):
+        """모든 리전의 목록/상세 요청이 쓸 수 있도록 공유 세션의 커넥션 풀 크기 조정"""
+        pool_size = self.max_concurrency + self.scraper.listing_workers * len(self.crawls)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.scraper.session.mount('https://', adapter)
+        self.scraper.session.mount('http://', adapter)
+
+    def _claim_url(self, url):
+        """처음 보는 URL이고 저널에 없으면 True (여러 리전 목록에 같은 음식점이 있어도 한 번만)"""
+        with self.claim_lock:
+            if url in self.claimed_urls:
+                return False
+            self.claimed_urls.add(url)
+        journal = self.scraper.journal
+        return not (journal and journal.is_completed(url))
+
+    def _restore_journaled_records(self):
+        """--resume: 저널에 있던 레코드를 리전별 결과로 되돌림"""
+        by_name = {crawl.name: crawl for crawl in self.crawls}
+        for record in self.scraper.restaurants:
+            crawl = by_name.get(record.get('region'))
+            if crawl:
+                crawl.records.append(record)
+                self.claimed_urls.add(record['url'])
+
+    def _refill(self, executor, in_flight):
+        """리전을 돌아가며 하나씩 작업을 넣어 전체/리전별 한도까지 채움"""
+        progressed = True
+        while progressed and len(in_flight) < self.max_concurrency:
+            progressed = False
+            for crawl in self.crawls:
+                if len(in_flight) >= self.max_concurrency:
+                    return
+                if crawl.in_flight >= crawl.max_concurrency:
+                    continue
+                try:
+                    url = crawl.url_queue.get_nowait()
+                except Empty:
+                    continue
+                crawl.in_flight += 1
+                in_flight[executor.submit(scrape_single_restaurant_ultra, (url, self.scraper))] = crawl
+                progressed = True
+
+    def _complete(self, crawl, result):
+        crawl.in_flight -= 1
+        if not result:
+            crawl.failed += 1
+            return
+        result['region'] = crawl.name
+        crawl.records.append(result)
+        self.scraper.restaurants.append(result)
+        if self.scraper.journal:
+            self.scraper.journal.record_restaurant(result)
+
+    def run(self):
+        """모든 리전을 수집하고 리전별 (성공, 실패) 반환"""
+        self._restore_journaled_records()
+        for crawl in self.crawls:
+            print(f"🗺️ [{crawl.name}] 시작: {crawl.region.start_url} (동시 작업 최대 {crawl.max_concurrency}개)")
+            threading.Thread(target=crawl.discover, args=(self.scraper, self._claim_url),
+                             name=f"discover-{crawl.name}", daemon=True).start()
+
+        completed = 0
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while True:
+                self._refill(executor, in_flight)
+                if not in_flight:
+                    if all(crawl.exhausted() for crawl in self.crawls):
+                        break
+                    time.sleep(0.1)  # 목록 수집이 다음 URL을 찾을 때까지 대기
+                    continue
+
+                done, _ = wait(in_flight, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._complete(in_flight.pop(future), future.result())
+                    completed += 1
+                    if completed % 10 == 0:
+                        progress = ", ".join(f"{crawl.name} {len(crawl.records)}/{crawl.failed}" for crawl in self.crawls)
+                        print(f"📊 진행 상황: {completed}개 완료 (리전별 성공/실패: {progress}, 진행 중: {len(in_flight)})")
+
+        return {crawl.name: (len(crawl.records), crawl.failed) for crawl in self.crawls}
+
+    def geocode(self, geocoder, cache):
+        """모든 리전 레코드에 좌표 기록 (리전 시/도 기준 정규화, 같은 주소는 캐시로 한 번만 조회)"""
+        located = not_found = errors = 0
+        for crawl in self.crawls:
+            counts = geocode_restaurants(crawl.records, geocoder, cache, crawl.region.city)
+            located, not_found, errors = located + counts[0], not_found + counts[1], errors + counts[2]
+        cache.save()
+        print(f"📍 지오코딩: 좌표 {located}개, 못 찾음 {not_found}개, 오류 {errors}개 "
+              f"(캐시 적중 {cache.stats['hits']}, 백엔드 호출 {cache.stats['misses']})")
+
+    def write_outputs(self, output_dir):
+        """리전별 샤드, 합친 결과, index.json 저장 후 index 반환"""
+        os.makedirs(output_dir, exist_ok=True)
+        merged = {}
+        index = {'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'regions': []}
+
+        for crawl in self.crawls:
+            shard = f"michelin_restaurants_{crawl.name}.json"
+            write_json_atomic(os.path.join(output_dir, shard), crawl.records)
+            for record in crawl.records:
+                merged.setdefault(record['url'], record)
+            index['regions'].append({
+                'name': crawl.name,
+                'start_url': crawl.region.start_url,
+                'shard': shard,
+                'count': len(crawl.records),
+                'failed': crawl.failed
+            })
+
+        index['merged'] = 'michelin_restaurants.json'
+        index['total'] = len(merged)
+        write_json_atomic(os.path.join(output_dir, index['merged']), list(merged.values()))
+        write_json_atomic(os.path.join(output_dir, 'index.json'), index)
+        print(f"💾 {len(self.crawls)}개 리전 샤드 + 합친 결과 {len(merged)}개 저장: {output_dir}")
+        return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 리전 미슐랭 크롤 오케스트레이터")
+    parser.add_argument('--regions-file', default=DEFAULT_MANIFEST, help="리전 매니페스트 경로")
+    parser.add_argument('--region', action='append', help="수집할 리전 이름 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument('--max-concurrency', type=int, default=None, help="전체 최대 동시 상세 수집 수")
+    parser.add_argument('--max-workers', type=int, default=4, help="스크래퍼 워커 수")
+    parser.add_argument('--driver-pool-size', type=int, default=4, help="공유 Selenium 드라이버 수")
+    parser.add_argument('--no-images', action='store_true', help="이미지 수집 생략")
+    parser.add_argument('--output-dir', default='michelin_regions', help="샤드/인덱스 출력 디렉토리")
+    parser.add_argument('--since', default=None, help="이전 합친 결과 JSON 에서 변경 없는(304) 레코드를 가져옴")
+    parser.add_argument('--cache-dir', default='.http_cache', help="HTTP 캐시 디렉토리")
+    parser.add_argument('--no-cache', action='store_true', help="조건부 요청 캐시 사용 안 함")
+    parser.add_argument('--image-workers', type=int, default=8, help="이미지 다운로드 워커 수")
+    parser.add_argument('--journal', default='crawl_journal_regions.jsonl', help="크롤 저널 경로")
+    parser.add_argument('--resume', action='store_true', help="저널에 기록된 음식점은 건너뛰고 이어서 수집")
+    parser.add_argument('--parser', default=DEFAULT_BACKEND, choices=BACKEND_NAMES, help="HTML 파서 백엔드")
+    parser.add_argument('--parse-processes', type=int, default=2, help="파싱 프로세스 수 (0 이면 워커 스레드에서 파싱)")
+    parser.add_argument('--metrics-json', default='run_metrics_regions.json', help="실행 지표 JSON 경로")
+    parser.add_argument('--metrics-prom', default=None, help="실행 중 주기적으로 갱신할 Prometheus 텍스트 파일 경로")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="로그 레벨 (DEBUG 면 이미지 단위 로그까지 출력)")
+    parser.add_argument('--geocode', action='store_true',
+                        help="저장 전에 카카오 지오코딩으로 주소 좌표를 채움 (KAKAO_MAP_API_KEY 필요)")
+    parser.add_argument('--geocode-cache', default=DEFAULT_CACHE, help="정규화 주소 → 좌표 캐시 파일")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    geocoder = None
+    if args.geocode:
+        try:
+            geocoder = create_geocoder('kakao')  # 운영 출력에는 stub 좌표를 쓰지 않음
+        except ValueError as e:
+            parser.error(str(e))
+
+    regions = load_regions(args.regions_file, args.region)
+    scraper = UltraFastMichelinScraper(
+        max_workers=args.max_workers,
+        driver_pool_size=args.driver_pool_size,
+        scrape_images=not args.no_images,
+        http_cache=None if args.no_cache else HttpCache(args.cache_dir),
+        previous_records=load_previous_records(args.since) if args.since else {},
+        image_workers=args.image_workers,
+        parser_backend=args.parser,
+        parse_processes=args.parse_processes
+    )
+    journal = CrawlJournal(args.journal, resume=args.resume)
+    scraper.attach_journal(journal)
+    orchestrator = CrawlOrchestrator(scraper, regions, max_concurrency=args.max_concurrency)
+    if args.metrics_prom:
+        scraper.metrics.start_live(args.metrics_prom)
+
+    try:
+        start_time = time.time()
+        results = orchestrator.run()
+        elapsed_time = time.time() - start_time
+
+        print(f"\n🎉 리전 {len(regions)}개 수집 완료! ({elapsed_time:.2f}초)")
+        for name, (successful_count, failed_count) in results.items():
+            print(f"  🗺️ {name}: 성공 {successful_count}개, 실패 {failed_count}개")
+        if geocoder:
+            orchestrator.geocode(geocoder, GeocodeCache(args.geocode_cache, geocoder.name))
+        orchestrator.write_outputs(args.output_dir)
+
+        scraper.image_resolver.print_summary()
+        if scraper.http_cache:
+            scraper.http_cache.print_summary()
+        scraper.rate_limiter.print_summary()
+        scraper.driver_pool.print_summary()
+        if scraper.image_store:
+            scraper.image_store.print_summary()
+        scraper.image_pipeline.counter.print_summary()
+        scraper.metrics.print_summary()
+
+    except KeyboardInterrupt:
+        print("\n\n스크래핑이 중단되었습니다. 지금까지의 결과를 저장합니다.")
+        orchestrator.write_outputs(args.output_dir)
+        print(f"📒 --resume 으로 이어서 수집할 수 있습니다: {args.journal}")
+
+    finally:
+        scraper.image_pipeline.close()
+        scraper.page_parser.close()
+        journal.close()
+        scraper.driver_pool.close()
+        scraper.metrics.stop_live()
+        scraper.metrics.write_json(args.metrics_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실제 미슐랭 가이드 응답을 녹화해서 오프라인으로 재생하는 픽스처 아카이브
+- record: 목록 페이지 → 상세 페이지 → (정적 HTML 에 있는) 갤러리 이미지 응답을 아카이브 디렉토리에 저장
+- serve: 아카이브를 로컬 HTTP 서버(fixture_server.FixtureServer)로 재생 (지연/오류 주입 가능)
+
+아카이브 구조:
+    <archive>/index.json      경로 → {status, content_type, body}, 시작 경로/쿼리
+    <archive>/bodies/<sha256> 응답 본문 (같은 본문은 한 번만 저장)
+
+guide.michelin.com 응답은 경로 그대로, 다른 호스트(cloudimg.io 이미지)는 /<호스트>/<경로> 로 저장하고,
+재생할 때 HTML 안의 절대 URL 을 재생 서버 주소로 바꿔서 스크래퍼가 외부로 나가지 않게 합니다.
+
+사용법:
+    python fixture_archive.py record --region seoul --max-pages 2 --output fixtures/seoul
+    python fixture_archive.py serve fixtures/seoul --port 8800 --latency 0.1 --error-rate 0.02
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from page_parser import parse_detail, parse_listing
+from rate_limiter import HostRateLimiter, RateLimitedSession, RetryPolicy
+from regions import DEFAULT_REGION, resolve_start_url
+
+ORIGIN = "https://guide.michelin.com"
+CLOUDIMG_URL = re.compile(rb'https://([a-z0-9-]+\.cloudimg\.io)')
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def archive_path(url):
+    """URL → 아카이브 키 (쿼리 제외 경로, 미슐랭 외 호스트는 /<호스트> 접두사)"""
+    parsed = urlparse(url)
+    if f"{parsed.scheme}://{parsed.netloc}" == ORIGIN:
+        return parsed.path or '/'
+    return f"/{parsed.netloc}{parsed.path}"
+
+
+def listing_page_url(start_url, page):
+    """시작 URL을 기준으로 목록 페이지 URL 생성 (스크래퍼의 _page_url 과 동일 규칙)"""
+    if page == 1:
+        return start_url
+    parsed = urlparse(start_url)
+    path = re.sub(r'/page/\d+/?$', '', parsed.path.rstrip('/'))
+    return parsed._replace(path=f"{path}/page/{page}").geturl()
+
+
+class FixtureArchive:
+    def __init__(self, path):
+        self.path = path
+        self.bodies_dir = os.path.join(path, 'bodies')
+        self.index_path = os.path.join(path, 'index.json')
+        self.start_path = None
+        self.start_query = ''
+        self.responses = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self.start_path = index.get('start_path')
+            self.start_query = index.get('start_query', '')
+            self.responses = index.get('responses', {})
+
+    def add(self, url, status, content_type, body):
+        """응답 하나 저장 (본문은 SHA-256 이름으로 한 번만)"""
+        digest = hashlib.sha256(body).hexdigest()
+        os.makedirs(self.bodies_dir, exist_ok=True)
+        body_path = os.path.join(self.bodies_dir, digest)
+        if not os.path.exists(body_path):
+            with open(body_path, 'wb') as f:
+                f.write(body)
+        self.responses[archive_path(url)] = {'status': status, 'content_type': content_type, 'body': digest}
+
+    def __contains__(self, url):
+        return archive_path(url) in self.responses
+
+    def load_body(self, path):
+        """아카이브 키 → (상태 코드, content-type, 본문) (없으면 None)"""
+        entry = self.responses.get(path)
+        if entry is None:
+            return None
+        with open(os.path.join(self.bodies_dir, entry['body']), 'rb') as f:
+            return entry['status'], entry['content_type'], f.read()
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'start_path': self.start_path, 'start_query': self.start_query, 'responses': self.responses},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def summary(self):
+        """본문 종류별 응답 수"""
+        counts = {}
+        for entry in self.responses.values():
+            kind = 'image' if entry['content_type'].startswith('image/') else 'html'
+            counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+
+class ArchiveSite:
+    """FixtureServer 에 꽂아 쓰는 아카이브 재생 사이트 (resolve/base/start_url 은 FixtureSite 와 동일)"""
+
+    def __init__(self, archive):
+        self.archive = archive if isinstance(archive, FixtureArchive) else FixtureArchive(archive)
+        self.base = ""
+        self.cache = {}
+
+    @property
+    def start_url(self):
+        query = f"?{self.archive.start_query}" if self.archive.start_query else ''
+        return f"{self.base}{self.archive.start_path}{query}"
+
+    @property
+    def restaurant_count(self):
+        return sum(1 for path in self.archive.responses if '/restaurant/' in path)
+
+    def _rewrite(self, body):
+        """HTML 안의 미슐랭/cloudimg 절대 URL 을 재생 서버 주소로 변경"""
+        base = self.base.encode()
+        body = body.replace(ORIGIN.encode(), base)
+        return CLOUDIMG_URL.sub(lambda m: base + b'/' + m.group(1), body)
+
+    def resolve(self, path):
+        """요청 경로 → (상태 코드, content-type, 본문 바이트)"""
+        if path not in self.cache:
+            response = self.archive.load_body(path)
+            if response is None:
+                return 404, 'text/plain', b'not found'
+            status, content_type, body = response
+            if content_type.startswith('text/html'):
+                body = self._rewrite(body)
+            self.cache[path] = (status, content_type, body)
+        return self.cache[path]
+
+
+def record(start_url, output, max_pages=1, images=True, parser_backend='html.parser'):
+    """start_url 부터 max_pages 개 목록 페이지와 거기 링크된 상세 페이지/이미지를 녹화"""
+    archive = FixtureArchive(output)
+    archive.start_path = archive_path(start_url)
+    archive.start_query = urlparse(start_url).query
+    session = RateLimitedSession(requests.Session(), HostRateLimiter(), RetryPolicy())
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    def fetch(url):
+        if url in archive:
+            return archive.load_body(archive_path(url))[2]
+        response = session.get(url, timeout=30)
+        archive.add(url, response.status_code, response.headers.get('Content-Type', 'application/octet-stream'),
+                    response.content)
+        return response.content if response.ok else None
+
+    restaurant_urls = []
+    page = 1
+    last_page = max_pages
+    while page <= last_page:
+        url = listing_page_url(start_url, page)
+        print(f"📼 목록 페이지 {page} 녹화: {url}")
+        content = fetch(url)
+        if not content:
+            break
+        page_urls, max_page = parse_listing(content, ORIGIN, parser_backend)
+        if not page_urls:
+            break
+        restaurant_urls.extend(url for url in page_urls if url not in restaurant_urls)
+        if max_page:
+            last_page = min(max_pages, max_page)
+        page += 1
+
+    image_count = 0
+    for i, url in enumerate(restaurant_urls, 1):
+        print(f"📼 ({i}/{len(restaurant_urls)}) 상세 페이지 녹화: {url}")
+        content = fetch(url)
+        if not content or not images:
+            continue
+        for image_url in parse_detail(content, parser_backend)['gallery_urls']:
+            if fetch(image_url) is not None:
+                image_count += 1
+
+    archive.save()
+    print(f"💾 아카이브 저장: {output} (음식점 {len(restaurant_urls)}개, 이미지 {image_count}개, "
+          f"응답 {len(archive.responses)}개)")
+    return archive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미슐랭 가이드 응답 녹화/재생")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="실제 사이트 응답을 아카이브로 녹화")
+    record_parser.add_argument('--region', default=DEFAULT_REGION, help="regions.json 에 정의된 리전 이름")
+    record_parser.add_argument('--start-url', default=None, help="리전 대신 직접 지정할 시작 URL")
+    record_parser.add_argument('--max-pages', type=int, default=1, help="녹화할 목록 페이지 수")
+    record_parser.add_argument('--no-images', action='store_true', help="이미지 응답은 녹화하지 않음")
+    record_parser.add_argument('--output', required=True, help="아카이브 디렉토리")
+
+    serve_parser = subparsers.add_parser('serve', help="아카이브를 로컬 HTTP 서버로 재생")
+    serve_parser.add_argument('archive', help="아카이브 디렉토리")
+    serve_parser.add_argument('--port', type=int, default=8800)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help="요청당 고정 지연 (초)")
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help="503 을 돌려줄 요청 비율 (0~1)")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(resolve_start_url(args.region, args.start_url), args.output, max_pages=args.max_pages,
+               images=not args.no_images)
+        return
+
+    from fixture_server import FixtureServer
+
+    site = ArchiveSite(args.archive)
+    with FixtureServer(site, latency=args.latency, port=args.port, jitter=args.jitter,
+                       error_rate=args.error_rate) as server:
+        print(f"▶️ 재생 서버: {server.base_url} (응답 {len(site.archive.responses)}개, {site.archive.summary()})")
+        print(f"   시작 URL: {site.start_url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"\n⏹️ 재생 종료 (요청 {server.faults.requests}개, 주입 오류 {server.faults.errors}개)")
+
+
+if __name__ == "__main__":
+    main()
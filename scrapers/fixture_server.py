@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 로컬 미슐랭 가이드 픽스처 HTTP 서버
+실제 guide.michelin.com 과 같은 마크업(목록 카드, 페이지네이션, data-sheet 블록)을
+합성해서 제공하므로 스크래퍼를 외부 네트워크 없이 실행할 수 있습니다.
+resolve(path) 와 base 속성을 가진 사이트면 무엇이든 서빙하므로
+녹화한 아카이브(fixture_archive.ArchiveSite)도 같은 서버로 재생합니다.
+요청 지연(고정 + 무작위 지터)과 오류(503) 주입을 지원합니다.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+REGION_PATH = "/kr/ko/fixture-region/fixture-city"
+# 스크래퍼는 cloudimg.io URL만 음식점 이미지로 인정하므로 CDN 호스트를 경로에 그대로 둠
+IMAGE_PATH = "/axwwgrkdco.cloudimg.io/v7/__gmpics3__"
+PAGE_SIZE = 20
+
+RATINGS = ['한 개의 별: 요리가 훌륭한 레스토랑', '두 개의 별: 요리가 탁월한 레스토랑', '빕 구르망: 합리적인 가격의 좋은 음식']
+PRICES = ['₩', '₩₩', '₩₩₩', '₩₩₩₩']
+CATEGORIES = ['한식', '냉면', '이노베이티브', '멕시칸']
+
+
+def image_hash(restaurant_index, image_index):
+    """픽스처 이미지의 cloudimg 스타일 해시 id"""
+    return hashlib.md5(f"{restaurant_index}-{image_index}".encode()).hexdigest()
+
+
+class FixtureSite:
+    """합성 음식점 목록/상세 페이지 생성기"""
+
+    def __init__(self, restaurant_count=60, images_per_restaurant=4, page_size=PAGE_SIZE):
+        self.restaurant_count = restaurant_count
+        self.images_per_restaurant = images_per_restaurant
+        self.page_size = page_size
+        self.base = ""
+
+    @property
+    def page_count(self):
+        return max(1, (self.restaurant_count + self.page_size - 1) // self.page_size)
+
+    @property
+    def start_url(self):
+        return f"{self.base}{REGION_PATH}/restaurants?sort=distance"
+
+    def image_urls(self, index):
+        return [
+            f"{self.base}{IMAGE_PATH}/{image_hash(index, i)}.jpeg"
+            for i in range(1, self.images_per_restaurant + 1)
+        ]
+
+    def listing_page(self, page):
+        """목록 페이지 HTML (범위를 벗어나면 빈 목록)"""
+        start = (page - 1) * self.page_size
+        end = min(start + self.page_size, self.restaurant_count)
+        cards = []
+        for index in range(start, end):
+            gallery = ','.join(self.image_urls(index))
+            cards.append(f"""
+<div class="card__menu selection-card js-restaurant__list_item js-map" data-index="{index}" data-id="{index}">
+  <div class="card__menu-image"><img data-gallery-image="{gallery}" data-gallery-label="픽스처 {index}"></div>
+  <div class="card__menu-content">
+    <h3 class="card__menu-content--title"><a href="{self.base}{REGION_PATH}/restaurant/r-{index}">픽스처 {index}</a></h3>
+  </div>
+</div>""")
+        page_links = ''.join(
+            f'<a href="{self.base}{REGION_PATH}/restaurants/page/{p}">{p}</a>'
+            for p in range(1, self.page_count + 1)
+        )
+        return f"""<html><body>
+<div class="row restaurant__list-row js-restaurant__list_items">{''.join(cards)}</div>
+<nav aria-label="pagination">{page_links}</nav>
+</body></html>"""
+
+    def detail_page(self, index):
+        """상세 페이지 HTML"""
+        images = ''.join(
+            f'<div class="modal__gallery-image"><img ci-src="{url}?width=1000"></div>'
+            for url in self.image_urls(index)
+        )
+        return f"""<html><body>
+<h1 class="data-sheet__title">픽스처 {index}</h1>
+<div class="data-sheet__block--text">중구 픽스처로 {index}, Seoul, 04500, 한국</div>
+<div class="data-sheet__block--text">{PRICES[index % len(PRICES)]} · {CATEGORIES[index % len(CATEGORIES)]}</div>
+<div class="data-sheet__classification-item">
+  <div class="data-sheet__classification-item--content">{RATINGS[index % len(RATINGS)]}</div>
+</div>
+<button class="masthead__gallery-open js-gallery-button">갤러리</button>
+{images}
+</body></html>"""
+
+    def image_body(self, path):
+        """이미지 경로별로 고정된 가짜 JPEG 바이트"""
+        digest = hashlib.sha256(path.encode()).digest()
+        return b'\xff\xd8\xff\xe0' + digest * 256 + b'\xff\xd9'
+
+    def resolve(self, path):
+        """요청 경로 → (상태 코드, content-type, 본문 바이트)"""
+        if path.startswith(f"{IMAGE_PATH}/"):
+            return 200, 'image/jpeg', self.image_body(path)
+
+        if path.startswith(f"{REGION_PATH}/restaurants"):
+            page = 1
+            if '/page/' in path:
+                try:
+                    page = int(path.rstrip('/').rsplit('/', 1)[1])
+                except ValueError:
+                    return 404, 'text/plain', b'not found'
+            return 200, 'text/html; charset=utf-8', self.listing_page(page).encode('utf-8')
+
+        if path.startswith(f"{REGION_PATH}/restaurant/r-"):
+            try:
+                index = int(path.rsplit('r-', 1)[1])
+            except ValueError:
+                return 404, 'text/plain', b'not found'
+            if 0 <= index < self.restaurant_count:
+                return 200, 'text/html; charset=utf-8', self.detail_page(index).encode('utf-8')
+
+        return 404, 'text/plain', b'not found'
+
+
+def _make_handler(site, latency, faults):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            delay, inject_error = faults.next_request(latency)
+            if delay:
+                time.sleep(delay)
+            if inject_error:
+                body = b'injected error'
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                self.send_header('Content-Type', 'text/plain')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            status, content_type, body = site.resolve(urlparse(self.path).path)
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if status == 200 and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            if status == 200:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+class FaultInjector:
+    """요청마다 지연 시간과 오류 주입 여부 결정 (seed 를 주면 재현 가능)"""
+
+    def __init__(self, jitter=0.0, error_rate=0.0, seed=None):
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def next_request(self, latency):
+        """(지연 초, 오류 주입 여부)"""
+        with self.lock:
+            self.requests += 1
+            delay = latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            inject_error = bool(self.error_rate) and self.random.random() < self.error_rate
+            if inject_error:
+                self.errors += 1
+        return delay, inject_error
+
+
+class FixtureServer:
+    """백그라운드 스레드에서 실행되는 픽스처 서버 (with 문 지원)"""
+
+    def __init__(self, site=None, latency=0.05, host='127.0.0.1', port=0, jitter=0.0, error_rate=0.0, seed=None):
+        """
+        Args:
+            site: resolve(path) → (상태 코드, content-type, 본문) 와 base 속성을 가진 객체 (기본: 합성 FixtureSite)
+            latency: 요청당 고정 지연 (초)
+            jitter: 0 ~ jitter 초의 무작위 추가 지연
+            error_rate: 503 응답을 돌려줄 요청 비율 (0~1)
+        """
+        self.site = site or FixtureSite()
+        self.latency = latency
+        self.faults = FaultInjector(jitter=jitter, error_rate=error_rate, seed=seed)
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self.site, latency, self.faults))
+        self.httpd.daemon_threads = True
+        self.thread = None
+        self.site.base = f"http://{host}:{self.httpd.server_address[1]}"
+
+    @property
+    def base_url(self):
+        return self.site.base
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Selenium 갤러리 대기 도우미 (MichelinScraper / UltraFastMichelinScraper 공용)
+- 갤러리 버튼 선택자 8개를 순서대로 5초씩 기다리던 것을 한 번의 대기로 합침
+  (폴링할 때마다 우선순위 순으로 모든 선택자를 확인하고 처음 클릭 가능한 것을 반환)
+- 모달을 연 뒤 고정 sleep 대신 img[ci-src] 개수가 잠시 변하지 않을 때까지 대기
+- 단계별 소요 시간을 PhaseTimer 로 기록해 결과 레코드의 'timings' 에 남김
+"""
+
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+GALLERY_SELECTORS = [
+    "button.masthead__gallery-open.js-gallery-button",  # 우래옥에서 발견된 갤러리 버튼
+    "button[data-target='#js-gallery-masthead']",
+    "button[data-target='#js-modal-gallery']",
+    ".js-modal-gallery-trigger",
+    "button[aria-label*='gallery']",
+    "button[aria-label*='Gallery']",
+    ".gallery-trigger",
+    ".image-gallery-trigger"
+]
+GALLERY_IMAGE_SELECTOR = "img[ci-src]"
+
+
+class PhaseTimer:
+    """단계 이름 → 누적 소요 시간(초) 기록"""
+
+    def __init__(self, timings=None):
+        self.timings = timings if timings is not None else {}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(self.timings.get(name, 0.0) + time.perf_counter() - started, 3)
+
+
+def first_clickable(selectors):
+    """WebDriverWait 조건: 우선순위 순으로 처음 클릭 가능한 (선택자, 요소), 없으면 False"""
+    def condition(driver):
+        for selector in selectors:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        return selector, element
+                except StaleElementReferenceException:
+                    continue
+        return False
+    return condition
+
+
+def wait_for_gallery_button(driver, timeout=5, selectors=GALLERY_SELECTORS):
+    """모든 갤러리 선택자를 한 번에 기다려 (선택자, 버튼) 반환 (없으면 (None, None))"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(first_clickable(selectors))
+    except TimeoutException:
+        return None, None
+
+
+def wait_for_stable_count(driver, selector=GALLERY_IMAGE_SELECTOR, quiet_period=0.3, timeout=5, poll_interval=0.1):
+    """selector 요소 수가 quiet_period 초 동안 변하지 않을 때까지 기다려 개수 반환 (최대 timeout 초)"""
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    stable_since = time.monotonic()
+    while True:
+        count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+        now = time.monotonic()
+        if count != last_count:
+            last_count = count
+            stable_since = now
+        elif now - stable_since >= quiet_period:
+            return count
+        if now >= deadline:
+            return count
+        time.sleep(poll_interval)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음식점 주소 → 좌표 변환 (오프라인 지오코딩 단계)
+수집한 레코드마다 lat/lng 를 미리 넣어 두면 프론트엔드가 방문할 때마다
+/api/geocode (카카오 프록시) 를 음식점 수만큼 호출하지 않아도 됩니다.
+
+- normalize_address: 서울은 src/utils/geocoding.js 의 normalizeAddress 와 같은 규칙 (캐시 키도 같은 문자열),
+  다른 리전은 영문 도시/우편번호/국가 꼬리를 떼고 regions.json 의 시/도 이름을 붙임 (서울특별시를 붙이지 않음)
+- 백엔드: kakao (카카오 로컬 주소 검색, KAKAO_MAP_API_KEY), stub (네트워크 없이 주소 해시로 만든 고정 좌표, 테스트용)
+- 백엔드별로 나뉜 정규화 주소 디스크 캐시 (찾지 못한 주소도 기록, stub 좌표가 kakao 결과로 쓰이지 않음)
+- 좌표를 찾지 못한 레코드는 lat/lng 없이 두어 프론트엔드가 기존처럼 직접 변환하게 함
+
+사용법:
+    KAKAO_MAP_API_KEY=... python geocoding.py ../public/michelin_restaurants.json ../src/data/michelin_restaurants.json
+    python geocoding.py michelin_regions/michelin_restaurants_busan.json --region busan
+    python geocoding.py michelin_restaurants.json --backend stub --cache /tmp/geocode_cache.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+import requests
+
+from rate_limiter import HostRateLimiter, RateLimitedSession, RetryPolicy
+from regions import DEFAULT_MANIFEST, load_regions
+
+KAKAO_ADDRESS_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+SEOUL_CENTER = (37.5665, 126.9780)
+SEOUL_CITY = '서울특별시'
+DEFAULT_CACHE = 'geocode_cache.json'
+
+
+def normalize_address(address, city=SEOUL_CITY):
+    """
+    미슐랭 주소("성동구 성덕정길 63, Seoul, 04775, 한국") → 카카오 검색용 주소
+
+    city 가 서울특별시면 프론트엔드 normalizeAddress 를 그대로 포팅한 규칙 (캐시 키가 프론트엔드 질의와 같음),
+    다른 시/도면 영문 꼬리만 떼고 그 시/도 이름을 붙임 (None 이면 붙이지 않음)
+    """
+    if not address:
+        return None
+    if city != SEOUL_CITY:
+        return _normalize_regional_address(address, city)
+
+    # 영어 주소 꼬리(도시/우편번호/국가) 제거
+    normalized = re.sub(r'Seoul, \d+, 한국', '', address)
+    normalized = normalized.replace('Seoul', '')
+    normalized = re.sub(r', \d{5}, 한국', '', normalized)
+    normalized = normalized.replace(', 한국', '').strip()
+
+    # 서울이 앞에 없는 경우 추가
+    if '서울' not in normalized and 'Seoul' not in normalized:
+        normalized = '서울특별시 ' + normalized
+
+    # 이미 서울특별시가 포함된 경우 중복 제거
+    if '서울특별시' in normalized and len(normalized.split('서울특별시')) > 2:
+        normalized = re.sub(r'서울특별시\s*', '', normalized, count=1).strip()
+        normalized = '서울특별시 ' + normalized
+
+    return normalized
+
+
+def _normalize_regional_address(address, city):
+    """"중구 중앙대로 1, Busan, 48950, 한국" → "부산광역시 중구 중앙대로 1" (서울 외 리전)"""
+    normalized = re.sub(r',\s*\d{5}\s*,\s*한국\s*$', '', address.strip())
+    normalized = re.sub(r',\s*한국\s*$', '', normalized)
+    normalized = re.sub(r',\s*[A-Za-z][A-Za-z .-]*$', '', normalized).strip().rstrip(',').strip()
+    if city and city[:2] not in normalized:  # "부산" 이 이미 있으면 그대로
+        normalized = f"{city} {normalized}"
+    return normalized
+
+
+class KakaoGeocoder:
+    """카카오 로컬 주소 검색 API (api/geocode.js 가 프록시하는 것과 같은 엔드포인트)"""
+
+    name = 'kakao'
+
+    def __init__(self, api_key, session=None):
+        self.session = session or RateLimitedSession(requests.Session(), HostRateLimiter(), RetryPolicy())
+        self.session.headers.update({'Authorization': f"KakaoAK {api_key}"})
+
+    def geocode(self, query):
+        """주소 → (lat, lng), 결과가 없으면 None (HTTP 오류는 예외)"""
+        response = self.session.get(KAKAO_ADDRESS_URL, params={'query': query, 'page': 1, 'size': 10}, timeout=10)
+        response.raise_for_status()
+        documents = response.json().get('documents') or []
+        if not documents:
+            return None
+
+        # 도로명 주소에 건물 이름이 있는 결과 우선 (프론트엔드와 같은 선택 규칙)
+        best = documents[0]
+        for document in documents:
+            if (document.get('road_address') or {}).get('building_name'):
+                best = document
+                break
+        return float(best['y']), float(best['x'])
+
+
+class StubGeocoder:
+    """네트워크 없이 주소 해시로 서울 중심 근처의 고정 좌표를 만드는 백엔드 (테스트/개발용)"""
+
+    name = 'stub'
+
+    def __init__(self, known=None, spread=0.1):
+        self.known = known or {}  # 정규화 주소 → (lat, lng) 를 직접 지정
+        self.spread = spread
+
+    def geocode(self, query):
+        if query in self.known:
+            return self.known[query]
+        digest = hashlib.sha256(query.encode('utf-8')).digest()
+        offset_lat = (int.from_bytes(digest[:4], 'big') / 0xFFFFFFFF - 0.5) * self.spread
+        offset_lng = (int.from_bytes(digest[4:8], 'big') / 0xFFFFFFFF - 0.5) * self.spread
+        return round(SEOUL_CENTER[0] + offset_lat, 6), round(SEOUL_CENTER[1] + offset_lng, 6)
+
+
+GEOCODERS = {
+    'kakao': lambda: KakaoGeocoder(os.environ['KAKAO_MAP_API_KEY']),
+    'stub': StubGeocoder,
+}
+
+
+def create_geocoder(backend):
+    """백엔드 이름 → 지오코더 (kakao 는 KAKAO_MAP_API_KEY 환경 변수 필요)"""
+    if backend == 'kakao' and not os.environ.get('KAKAO_MAP_API_KEY'):
+        raise ValueError("kakao 백엔드에는 KAKAO_MAP_API_KEY 환경 변수가 필요합니다")
+    return GEOCODERS[backend]()
+
+
+class GeocodeCache:
+    """
+    백엔드 이름 → 정규화 주소 → {lat, lng} (찾지 못한 주소는 None) 디스크 캐시
+
+    조회는 지정한 백엔드 칸에서만 하므로 stub 으로 채운 가짜 좌표가 kakao 실행에서 쓰이지 않습니다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE, backend='kakao'):
+        self.path = path
+        self.backend = backend
+        self.stats = {'hits': 0, 'misses': 0}
+        self.backends = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.backends = json.load(f)
+        self.entries = self.backends.setdefault(backend, {})
+
+    def __contains__(self, query):
+        return query in self.entries
+
+    def get(self, query):
+        self.stats['hits'] += 1
+        return self.entries[query]
+
+    def put(self, query, coordinates):
+        self.stats['misses'] += 1
+        self.entries[query] = None if coordinates is None else {'lat': coordinates[0], 'lng': coordinates[1]}
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.backends, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def geocode_restaurants(restaurants, geocoder, cache, city=SEOUL_CITY):
+    """
+    레코드마다 정규화 주소로 좌표를 찾아 lat/lng 기록 (캐시에 없는 주소만 백엔드 호출)
+
+    Args:
+        city: 레코드들이 속한 리전의 시/도 (regions.json 의 city, 서울특별시면 프론트엔드와 같은 정규화)
+
+    Returns:
+        (좌표를 넣은 수, 찾지 못한 수, 백엔드 오류 수)
+    """
+    if cache.backend != geocoder.name:
+        raise ValueError(f"캐시 백엔드({cache.backend})와 지오코더({geocoder.name})가 다릅니다")
+    located = not_found = errors = 0
+    for restaurant in restaurants:
+        query = normalize_address(restaurant.get('address'), city)
+        if not query:
+            not_found += 1
+            continue
+        if query in cache:
+            entry = cache.get(query)
+        else:
+            try:
+                coordinates = geocoder.geocode(query)
+            except Exception as e:
+                # 일시적인 오류는 캐시하지 않고 다음 실행에서 다시 시도
+                print(f"❌ 지오코딩 오류: {restaurant.get('name')} ({query}) - {e}")
+                errors += 1
+                continue
+            cache.put(query, coordinates)
+            entry = cache.entries[query]
+        if entry is None:
+            not_found += 1
+            restaurant.pop('lat', None)
+            restaurant.pop('lng', None)
+            continue
+        restaurant['lat'] = entry['lat']
+        restaurant['lng'] = entry['lng']
+        located += 1
+    return located, not_found, errors
+
+
+def region_cities(manifest=DEFAULT_MANIFEST):
+    """리전 이름 → 시/도 이름 (regions.json)"""
+    return {region.name: region.city for region in load_regions(manifest)}
+
+
+def geocode_files(paths, geocoder, cache, region='seoul', cities=None):
+    """
+    음식점 JSON 파일들에 lat/lng 를 넣어 원자적으로 다시 저장
+
+    레코드에 region 필드(url_frontier 결과 등)가 있으면 그 리전의 시/도로, 없으면 region 인자의 시/도로 정규화
+    """
+    cities = cities if cities is not None else region_cities()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            restaurants = json.load(f)
+        groups = {}
+        for restaurant in restaurants:
+            groups.setdefault(restaurant.get('region') or region, []).append(restaurant)
+        located = not_found = errors = 0
+        for name, records in groups.items():
+            counts = geocode_restaurants(records, geocoder, cache, cities.get(name))
+            located, not_found, errors = located + counts[0], not_found + counts[1], errors + counts[2]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(restaurants, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        print(f"📍 {path}: 좌표 {located}개, 못 찾음 {not_found}개, 오류 {errors}개")
+    cache.save()
+    print(f"🗂️  지오코드 캐시: {cache.path} (적중 {cache.stats['hits']}, 백엔드 호출 {cache.stats['misses']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음식점 JSON 에 주소 좌표(lat/lng) 미리 계산해 넣기")
+    parser.add_argument('paths', nargs='+', help="음식점 JSON 파일")
+    parser.add_argument('--backend', default='kakao', choices=list(GEOCODERS), help="지오코딩 백엔드")
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help="백엔드별 정규화 주소 → 좌표 캐시 파일")
+    parser.add_argument('--region', default='seoul', help="region 필드가 없는 레코드의 리전 (regions.json 이름)")
+    args = parser.parse_args()
+
+    cities = region_cities()
+    if args.region not in cities:
+        parser.error(f"regions.json 에 없는 리전: {args.region} (사용 가능: {', '.join(cities)})")
+    try:
+        geocoder = create_geocoder(args.backend)
+    except ValueError as e:
+        parser.error(str(e))
+    geocode_files(args.paths, geocoder, GeocodeCache(args.cache, geocoder.name), region=args.region, cities=cities)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 단위 디스크 HTTP 캐시
+응답 본문과 ETag / Last-Modified 를 저장해 두었다가 다음 실행에서
+If-None-Match / If-Modified-Since 조건부 요청을 보내고,
+304 응답이면 저장된 본문을 그대로 돌려줍니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class CachedResponse:
+    """캐시를 거친 응답 (changed=False 면 304 로 저장된 본문을 재사용한 것)"""
+
+    def __init__(self, url, content, status_code, changed):
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self.changed = changed
+
+
+class HttpCache:
+    def __init__(self, cache_dir=".http_cache"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, url):
+        """URL → (메타데이터 경로, 본문 경로)"""
+        key = self._key(url)
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.json", directory / f"{key}.body"
+
+    def get_entry(self, url):
+        """저장된 메타데이터 (없거나 본문이 사라졌으면 None)"""
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load_body(self, url):
+        """저장된 본문 바이트"""
+        _, body_path = self._paths(url)
+        return body_path.read_bytes()
+
+    def conditional_headers(self, url):
+        """조건부 요청 헤더 (캐시에 없으면 빈 dict)"""
+        entry = self.get_entry(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, headers, content):
+        """200 응답 본문과 검증자 저장 (임시 파일 → rename 으로 원자적 교체)"""
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(exist_ok=True)
+        entry = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': time.time(),
+            'size': len(content)
+        }
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        body_tmp = body_path.with_name(body_path.name + suffix)
+        meta_tmp = meta_path.with_name(meta_path.name + suffix)
+        body_tmp.write_bytes(content)
+        os.replace(body_tmp, body_path)
+        with open(meta_tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(meta_tmp, meta_path)
+
+    def record(self, url, status_code, headers, content):
+        """응답 결과를 캐시에 반영하고 CachedResponse 반환"""
+        if status_code == 304:
+            with self.lock:
+                self.stats['hits'] += 1
+            return CachedResponse(url, self.load_body(url), 304, changed=False)
+
+        self.store(url, headers, content)
+        with self.lock:
+            self.stats['misses'] += 1
+        return CachedResponse(url, content, status_code, changed=True)
+
+    def fetch(self, session, url, **kwargs):
+        """requests.Session 으로 조건부 GET (4xx/5xx 는 예외)"""
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.update(self.conditional_headers(url))
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return self.record(url, response.status_code, response.headers, response.content)
+
+    def print_summary(self):
+        """캐시 적중 통계 출력"""
+        print(f"🗄️ HTTP 캐시: 304 재사용 {self.stats['hits']}개, 새로 받은 페이지 {self.stats['misses']}개")
+
+
+def load_previous_records(path):
+    """이전 실행 결과 JSON 을 url → 레코드 dict 로 로드"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    return {record['url']: record for record in records if record.get('url')}
+
+
+def images_present(record):
+    """레코드가 가리키는 로컬 이미지가 모두 남아있는지 확인"""
+    return all(os.path.exists(image.get('local_path', '')) for image in record.get('images', []))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+반응형 이미지 파생본(derivative) 생성기
+restaurant_images 의 원본마다 여러 폭(thumb/card/full)의 WebP/AVIF + JPEG 대체본을 만들고
+원본 파일명 → 파생본 경로를 적은 manifest.json 을 출력합니다.
+지도 마커/카드는 thumb/card 만 받으면 되므로 원본 전체를 내려보내지 않아도 됩니다.
+
+- JPEG 는 draft() 로 DCT 단계에서 축소 디코드, 그 외는 reduce() 로 정수배 축소 후 LANCZOS 리사이즈
+- EXIF Orientation 은 디코드 직후 픽셀에 적용 (파생본은 EXIF 없이 저장되므로 바로 선 방향으로)
+- 원본보다 큰 폭으로는 확대하지 않음
+- 파생본이 원본보다 최신이면 건너뜀 (재실행은 새 이미지만 처리)
+- 프로세스 풀에서 병렬 생성
+
+사용법:
+    python image_derivatives.py --source ../public/restaurant_images --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+
+# 변형 이름 → 최대 폭 (px)
+VARIANT_WIDTHS = {
+    'thumb': 120,
+    'card': 480,
+    'full': 1200,
+}
+FORMAT_OPTIONS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'avif': ('AVIF', {'quality': 60, 'speed': 8}),
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+# 90/270도 회전이 들어가 폭과 높이가 바뀌는 EXIF Orientation 값
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def available_formats(requested=('avif', 'webp', 'jpg')):
+    """Pillow 빌드에서 인코딩 가능한 형식만 (JPEG 대체본은 항상 포함)"""
+    formats = [fmt for fmt in requested if fmt == 'jpg' or features.check(fmt)]
+    if 'jpg' not in formats:
+        formats.append('jpg')
+    return formats
+
+
+def load_scaled(path, max_width):
+    """max_width 이하로 빠르게 축소 디코드하고 EXIF 회전을 적용한 RGB 이미지 (원본 파일은 닫음)"""
+    with Image.open(path) as source:
+        if source.format == 'JPEG':
+            # DCT 스케일링으로 1/2, 1/4, 1/8 크기로 바로 디코드 (목표 크기 이상은 유지)
+            width, height = source.size
+            if source.getexif().get(0x0112, 1) in TRANSPOSED_ORIENTATIONS:
+                # 90/270도 회전: 저장된 높이가 화면 폭이 됨
+                source.draft('RGB', (max(1, round(width * max_width / height)), max_width))
+            else:
+                source.draft('RGB', (max_width, max(1, round(height * max_width / width))))
+        img = ImageOps.exif_transpose(source)  # 디코드 + 회전 (항상 새 이미지)
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # 투명 배경은 흰색으로 (JPEG 대체본과 같은 모양이 되도록)
+        rgba = img.convert('RGBA')
+        img = Image.new('RGB', rgba.size, (255, 255, 255))
+        img.paste(rgba, mask=rgba.split()[-1])
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    factor = img.width // (max_width * 2)
+    if factor >= 2:
+        img = img.reduce(factor)  # 박스 필터 정수배 축소 (LANCZOS 전에 픽셀 수를 먼저 줄임)
+    return img
+
+
+def resize_to_width(img, width):
+    """폭 width 로 비율 유지 축소 (원본보다 크게 만들지 않음)"""
+    if img.width <= width:
+        return img
+    height = max(1, round(img.height * width / img.width))
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def derive_one(source_path, output_dir, formats, widths=VARIANT_WIDTHS):
+    """
+    원본 하나의 파생본 생성 (프로세스 풀 워커에서도 실행되므로 예외는 결과로 돌려줌)
+
+    Returns:
+        (상태, 원본 파일명, 매니페스트 항목 또는 오류 메시지): 상태는 'generated', 'skipped', 'error'
+    """
+    source_path = Path(source_path)
+    target_dir = Path(output_dir) / source_path.stem
+    try:
+        source_mtime = source_path.stat().st_mtime
+        img = None
+        generated = False
+        entry = {'variants': {}}
+        with Image.open(source_path) as header:  # 헤더만 읽음
+            entry['width'], entry['height'] = header.size
+            if header.getexif().get(0x0112, 1) in TRANSPOSED_ORIENTATIONS:
+                entry['width'], entry['height'] = header.height, header.width
+        for name, max_width in sorted(widths.items(), key=lambda item: -item[1]):
+            variant = {}
+            paths = {fmt: target_dir / f"{name}.{fmt}" for fmt in formats}
+            fresh = all(p.exists() and p.stat().st_mtime >= source_mtime for p in paths.values())
+            if fresh:
+                with Image.open(paths['jpg']) as existing:
+                    variant['width'], variant['height'] = existing.size
+            else:
+                if img is None:
+                    img = load_scaled(source_path, max(widths.values()))
+                resized = resize_to_width(img, max_width)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                for fmt, path in paths.items():
+                    pil_format, options = FORMAT_OPTIONS[fmt]
+                    resized.save(path, pil_format, **options)
+                variant['width'], variant['height'] = resized.size
+                generated = True
+            for fmt, path in paths.items():
+                variant[fmt] = path.relative_to(Path(output_dir).parent).as_posix()
+                variant[f"{fmt}_bytes"] = path.stat().st_size
+            entry['variants'][name] = variant
+        entry['bytes'] = source_path.stat().st_size
+        return ('generated' if generated else 'skipped'), source_path.name, entry
+    except Exception as e:
+        return 'error', source_path.name, str(e)
+
+
+def _derive_one_job(job):
+    return derive_one(*job)
+
+
+def generate_derivatives(source_dir="restaurant_images", output_dir=None, workers=1, formats=None):
+    """
+    source_dir 의 모든 이미지에 대해 파생본과 manifest.json 생성
+
+    Args:
+        source_dir: 원본 이미지 디렉토리
+        output_dir: 파생본 디렉토리 (기본: <source_dir>_variants)
+        workers: 생성 프로세스 수
+        formats: 출력 형식 목록 (기본: 사용 가능한 avif, webp + jpg)
+    Returns:
+        매니페스트 dict (원본 파일명 → 항목)
+    """
+    source_path = Path(source_dir)
+    output_path = Path(output_dir) if output_dir else source_path.parent / f"{source_path.name}_variants"
+    formats = formats or available_formats()
+    if not source_path.exists():
+        print(f"❌ 디렉토리를 찾을 수 없습니다: {source_dir}")
+        return {}
+
+    sources = sorted(p for p in source_path.iterdir() if p.suffix.lower() in SOURCE_EXTENSIONS)
+    print(f"🔍 원본 {len(sources)}개, 형식 {', '.join(formats)}, "
+          f"폭 {', '.join(f'{name}={width}' for name, width in VARIANT_WIDTHS.items())}")
+
+    jobs = [(path, output_path, formats) for path in sources]
+    started = time.perf_counter()
+    manifest = {}
+    counts = {'generated': 0, 'skipped': 0, 'error': 0}
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = executor.map(_derive_one_job, jobs, chunksize=max(1, len(jobs) // (workers * 8))) \
+            if executor else map(_derive_one_job, jobs)
+        for i, (status, name, entry) in enumerate(results, 1):
+            counts[status] += 1
+            if status == 'error':
+                print(f"❌ 오류 ({i}/{len(jobs)}): {name} - {entry}")
+                continue
+            manifest[name] = entry
+            if i % 100 == 0 or i == len(jobs):
+                print(f"📐 진행 ({i}/{len(jobs)}): 생성 {counts['generated']}, 스킵 {counts['skipped']}")
+    finally:
+        if executor:
+            executor.shutdown()
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_path / 'manifest.json'
+    tmp_path = output_path / 'manifest.json.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'widths': VARIANT_WIDTHS, 'formats': formats, 'images': manifest}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+    elapsed = time.perf_counter() - started
+    print_summary(manifest, formats, counts, elapsed)
+    print(f"💾 매니페스트: {manifest_path}")
+    return manifest
+
+
+def print_summary(manifest, formats, counts, elapsed):
+    original_bytes = sum(entry['bytes'] for entry in manifest.values())
+    print("\n" + "=" * 50)
+    print("📊 파생본 생성 결과")
+    print("=" * 50)
+    print(f"✅ 생성: {counts['generated']}개, ⏭️  스킵: {counts['skipped']}개, ❌ 오류: {counts['error']}개 "
+          f"({elapsed:.2f}초)")
+    print(f"📦 원본 합계: {original_bytes / 1024 / 1024:.1f}MB")
+    for name in VARIANT_WIDTHS:
+        sizes = ', '.join(
+            f"{fmt} {sum(entry['variants'][name][f'{fmt}_bytes'] for entry in manifest.values()) / 1024 / 1024:.1f}MB"
+            for fmt in formats
+        )
+        print(f"   {name}: {sizes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="반응형 이미지 파생본(thumb/card/full, WebP/AVIF/JPEG) 생성")
+    parser.add_argument('--source', default='restaurant_images', help="원본 이미지 디렉토리")
+    parser.add_argument('--output', default=None, help="파생본 디렉토리 (기본: <source>_variants)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="생성 프로세스 수")
+    parser.add_argument('--formats', default=None, help="출력 형식 (쉼표 구분: avif,webp,jpg)")
+    args = parser.parse_args()
+
+    formats = available_formats(tuple(args.formats.split(','))) if args.formats else None
+    generate_derivatives(args.source, args.output, workers=args.workers, formats=formats)
+
+
+if __name__ == "__main__":
+    main()
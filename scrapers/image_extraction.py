@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+정적 HTML 갤러리 이미지 추출과 단계별(정적 → 브라우저) 이미지 URL 해석
+scrape_restaurant_detail 이 이미 받아온 상세 페이지에서
+ci-src / .modal__gallery-image / data-gallery-image / JSON-LD 이미지를 먼저 읽고,
+결과가 부족할 때만 Selenium 으로 폴백합니다.
+"""
+
+import json
+import re
+import threading
+
+MICHELIN_BASE_URL = "https://guide.michelin.com"
+
+# 여러 음식점에서 반복 사용되는 공통 이미지 (MichelinScraper.is_restaurant_image 와 동일)
+COMMON_IMAGE_PATTERNS = [
+    '0b9dfd084d714be0ad8666feb11efbb3',
+    'a15ac7eea1c6420f9025ce233045161e',
+    'cab8a8283cd146cda6ca584be6e992c6',
+]
+
+
+def normalize_image_url(url):
+    """상대 URL을 절대 URL로 바꾸고 크기 조정 파라미터 제거"""
+    url = url.strip()
+    if url.startswith('//'):
+        url = f"https:{url}"
+    elif url.startswith('/'):
+        url = f"{MICHELIN_BASE_URL}{url}"
+    return url.split('?')[0]
+
+
+def is_gallery_image_url(url):
+    """cloudimg.io 음식점 이미지인지 확인 (공통 이미지 제외)"""
+    if 'cloudimg.io' not in url:
+        return False
+    return not any(pattern in url for pattern in COMMON_IMAGE_PATTERNS)
+
+
+def json_ld_image_urls(script_texts):
+    """JSON-LD 스크립트 본문들의 image 필드에서 URL 목록 추출"""
+    urls = []
+    for text in script_texts:
+        try:
+            data = json.loads(text or '')
+        except (ValueError, TypeError):
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            image = item.get('image')
+            if isinstance(image, str):
+                urls.append(image)
+            elif isinstance(image, list):
+                urls.extend(value for value in image if isinstance(value, str))
+    return urls
+
+
+def filter_gallery_candidates(candidates):
+    """후보 문자열을 정규화해 갤러리 이미지 URL만 남김 (문서 순서 유지, 중복 제거)"""
+    image_urls = []
+    processed_urls = set()
+    for candidate in candidates:
+        if not candidate or not candidate.strip():
+            continue
+        url = normalize_image_url(candidate)
+        if url not in processed_urls and is_gallery_image_url(url):
+            image_urls.append(url)
+            processed_urls.add(url)
+    return image_urls
+
+
+def gallery_count_hint(slot_count, button_texts):
+    """
+    페이지가 알려주는 갤러리 이미지 수 (모르면 0)
+    모달 슬롯 수와 갤러리 버튼 글자("사진 12장")의 숫자 중 큰 값 — 지연 로딩 갤러리는 정적 HTML 에
+    첫 이미지 주소만 있어도 슬롯/버튼에는 전체 수가 드러남
+    """
+    numbers = [int(number) for text in button_texts for number in re.findall(r'\d+', text or '')]
+    return max([slot_count] + numbers)
+
+
+def expected_gallery_count(soup):
+    """BeautifulSoup 상세 페이지 → 기대 갤러리 이미지 수 (TieredImageResolver.resolve 의 expected_count)"""
+    if soup is None:
+        return 0
+    buttons = soup.select('.js-gallery-button, .masthead__gallery-open')
+    return gallery_count_hint(len(soup.select('.modal__gallery-image')),
+                              [button.get_text(' ', strip=True) for button in buttons])
+
+
+def extract_static_gallery_urls(soup):
+    """정적 HTML에서 갤러리 이미지 URL 추출 (문서 순서 유지, 중복 제거)"""
+    candidates = []
+
+    # 1. 모달 갤러리 / ci-src 이미지 (Selenium 경로와 같은 속성)
+    for img in soup.select('.modal__gallery-image img'):
+        for attr in ('ci-src', 'data-src', 'src'):
+            if img.get(attr):
+                candidates.append(img.get(attr))
+    for img in soup.find_all('img', {'ci-src': True}):
+        candidates.append(img.get('ci-src'))
+
+    # 2. data-gallery-image 속성에 쉼표로 들어있는 갤러리 목록
+    for element in soup.find_all(attrs={'data-gallery-image': True}):
+        candidates.extend(element.get('data-gallery-image', '').split(','))
+
+    # 3. 임베디드 JSON-LD
+    candidates.extend(json_ld_image_urls(
+        script.string for script in soup.find_all('script', {'type': 'application/ld+json'})
+    ))
+
+    return filter_gallery_candidates(candidates)
+
+
+class TieredImageResolver:
+    """정적 HTML → 브라우저 순으로 이미지 URL을 해석하고 단계별 처리 수를 집계"""
+
+    TIERS = ('static', 'browser', 'none')
+
+    def __init__(self, min_static_images=1):
+        self.min_static_images = min_static_images
+        self.counts = {tier: 0 for tier in self.TIERS}
+        self.lock = threading.Lock()
+
+    def is_short(self, image_urls, expected_count=0):
+        """정적 결과가 부족한지 판단 (최소 개수 또는 기대 개수 미만)"""
+        return len(image_urls) < max(self.min_static_images, expected_count)
+
+    def resolve(self, soup, browser_fetch=None, expected_count=0, static_urls=None):
+        """
+        이미지 URL 목록과 해석한 단계를 반환합니다.
+
+        Args:
+            soup: 이미 받아온 상세 페이지 BeautifulSoup
+            browser_fetch: 정적 결과가 부족할 때 호출할 함수 (URL 목록 반환), None 이면 폴백 없음
+            expected_count: 페이지가 알려주는 갤러리 이미지 수 (expected_gallery_count / parse_detail 의 gallery_count)
+            static_urls: 파싱 단계(page_parser)에서 이미 추출한 정적 URL 목록 (있으면 soup 대신 사용)
+        """
+        if static_urls is not None:
+            image_urls = list(static_urls)
+        else:
+            image_urls = extract_static_gallery_urls(soup) if soup is not None else []
+        tier = 'static'
+
+        if browser_fetch and self.is_short(image_urls, expected_count):
+            browser_urls = browser_fetch() or []
+            if len(browser_urls) > len(image_urls):
+                image_urls = browser_urls
+                tier = 'browser'
+
+        if not image_urls:
+            tier = 'none'
+
+        with self.lock:
+            self.counts[tier] += 1
+        return image_urls, tier
+
+    def print_summary(self):
+        """단계별 처리 결과 출력"""
+        total = sum(self.counts.values())
+        print(f"🧩 이미지 단계별 처리: 정적 HTML {self.counts['static']}개, "
+              f"브라우저 {self.counts['browser']}개, 이미지 없음 {self.counts['none']}개 (총 {total}개)")
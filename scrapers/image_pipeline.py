@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 다운로드 파이프라인 단계
+Selenium 드라이버와 분리된 전용 워커 풀 + 크기 제한 큐로 이미지를 내려받습니다.
+본문은 response.content 로 한 번에 버퍼링하지 않고 청크 단위로 디스크에 스트리밍하며,
+단계별 처리량 카운터(StageCounter)를 제공합니다.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Queue
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import RateLimitedSession
+
+logger = logging.getLogger(__name__)
+
+
+class StageCounter:
+    """파이프라인 단계별 처리 수/실패 수/바이트/처리량 집계"""
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.items = 0
+        self.failures = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+
+    def record(self, started, ok=True, nbytes=0):
+        """started(time.perf_counter) 부터 지금까지 한 건 처리한 결과 기록"""
+        ended = time.perf_counter()
+        with self.lock:
+            if ok:
+                self.items += 1
+            else:
+                self.failures += 1
+            self.bytes += nbytes
+            self.busy_seconds += ended - started
+            self.first_start = started if self.first_start is None else min(self.first_start, started)
+            self.last_end = ended if self.last_end is None else max(self.last_end, ended)
+
+    def snapshot(self):
+        """현재 카운터 값 (dict)"""
+        with self.lock:
+            wall = (self.last_end - self.first_start) if self.first_start is not None else 0.0
+            return {
+                'stage': self.name,
+                'items': self.items,
+                'failures': self.failures,
+                'bytes': self.bytes,
+                'busy_seconds': round(self.busy_seconds, 3),
+                'wall_seconds': round(wall, 3),
+                'items_per_second': round(self.items / wall, 2) if wall > 0 else 0.0,
+                'mb_per_second': round(self.bytes / wall / 1024 / 1024, 2) if wall > 0 else 0.0
+            }
+
+    def print_summary(self):
+        stats = self.snapshot()
+        print(f"📈 [{stats['stage']}] {stats['items']}개 성공, {stats['failures']}개 실패, "
+              f"{stats['items_per_second']}개/초, {stats['mb_per_second']}MB/초 "
+              f"(작업 {stats['busy_seconds']}초 / 경과 {stats['wall_seconds']}초)")
+
+
+class ImageDownloadPipeline:
+    def __init__(self, images_dir, headers=None, image_store=None, workers=8, queue_size=64,
+                 chunk_size=64 * 1024, timeout=20, rate_limiter=None, retry_policy=None, metrics=None):
+        self.images_dir = Path(images_dir)
+        self.images_dir.mkdir(exist_ok=True)
+        self.image_store = image_store
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.counter = StageCounter('image_download')
+        self.metrics = metrics  # RunMetrics (image_download / disk_write 단계)
+        self.journal = None  # CrawlJournal 이 연결되면 이미지마다 기록
+
+        # 이미지 호스트(cloudimg.io) 전용 세션, 워커 수만큼 커넥션 유지
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if rate_limiter:
+            self.session = RateLimitedSession(self.session, rate_limiter, retry_policy)
+
+        self.queue = Queue(maxsize=queue_size)
+        self.threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"image-download-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _worker(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                self.queue.task_done()
+                break
+            future, image_url, restaurant_name, image_index = job
+            try:
+                future.set_result(self.download(image_url, restaurant_name, image_index))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                self.queue.task_done()
+
+    def _legacy_path(self, image_url, restaurant_name, image_index):
+        """저장소를 쓰지 않을 때의 {이름}_{번호}.ext 경로"""
+        safe_name = re.sub(r'[^\w\-_\.]', '_', restaurant_name)[:50]
+        file_extension = os.path.splitext(urlparse(image_url).path)[1] or '.jpg'
+        return self.images_dir / f"{safe_name}_{image_index:02d}{file_extension}"
+
+    def download(self, image_url, restaurant_name, image_index):
+        """이미지 하나를 청크 단위로 받아 저장하고 경로 반환 (실패 시 None)"""
+        started = time.perf_counter()
+        tmp_path = None
+        try:
+            if self.journal:
+                journaled_path = self.journal.downloaded_image(image_url)
+                if journaled_path:
+                    self.counter.record(started)
+                    if self.metrics:
+                        self.metrics.increment('images_reused')
+                    return journaled_path
+
+            if self.image_store:
+                stored_path = self.image_store.lookup(image_url)
+                if stored_path:
+                    self.counter.record(started)
+                    if self.metrics:
+                        self.metrics.increment('images_reused')
+                    return str(stored_path)
+
+            target = self._legacy_path(image_url, restaurant_name, image_index)
+            tmp_path = self.images_dir / f".{target.name}.{os.getpid()}.{threading.get_ident()}.part"
+            digest = hashlib.sha256()
+            head = b''
+            size = 0
+            write_seconds = 0.0
+
+            with self.session.get(image_url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        if not chunk:
+                            continue
+                        if len(head) < 16:
+                            head += chunk[:16]
+                        digest.update(chunk)
+                        size += len(chunk)
+                        write_started = time.perf_counter()
+                        f.write(chunk)
+                        write_seconds += time.perf_counter() - write_started
+
+            write_started = time.perf_counter()
+            if self.image_store:
+                filepath = self.image_store.put_file(image_url, tmp_path, digest.hexdigest(), size, head)
+            else:
+                os.replace(tmp_path, target)
+                filepath = target
+            write_seconds += time.perf_counter() - write_started
+
+            if self.journal:
+                self.journal.record_image(image_url, str(filepath))
+            self.counter.record(started, nbytes=size)
+            if self.metrics:
+                self.metrics.observe('image_download', time.perf_counter() - started, nbytes=size)
+                self.metrics.observe('disk_write', write_seconds)
+            return str(filepath)
+
+        except Exception as e:
+            logger.warning(f"  ❌ 이미지 다운로드 실패: {e}")
+            self.counter.record(started, ok=False)
+            if self.metrics:
+                self.metrics.observe('image_download', time.perf_counter() - started, ok=False)
+            if tmp_path and tmp_path.exists():
+                tmp_path.unlink()
+            return None
+
+    def submit(self, image_url, restaurant_name, image_index):
+        """다운로드 작업을 큐에 넣고 Future 반환 (큐가 가득 차면 대기)"""
+        future = Future()
+        self.queue.put((future, image_url, restaurant_name, image_index))
+        return future
+
+    def download_all(self, image_urls, restaurant_name):
+        """URL 목록을 병렬로 받아 images 레코드 목록을 원래 순서대로 반환"""
+        futures = [
+            (image_url, self.submit(image_url, restaurant_name, i))
+            for i, image_url in enumerate(image_urls, 1)
+        ]
+        downloaded_images = []
+        for image_url, future in futures:
+            filepath = future.result()
+            if filepath:
+                downloaded_images.append({
+                    'url': image_url,
+                    'local_path': filepath,
+                    'filename': os.path.basename(filepath)
+                })
+        return downloaded_images
+
+    def close(self):
+        """남은 작업을 마치고 워커 종료"""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.session.close()
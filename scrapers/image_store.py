@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 주소 기반 이미지 저장소
+cloudimg.io 경로의 해시 id(__gmpics3__/<id>.jpeg)와 바이트 SHA-256 으로 이미지를 관리합니다.
+- 같은 source id 가 이미 저장되어 있으면 다운로드하지 않음 (음식점/실행 간 공유)
+- 바이트가 같은 이미지는 하나의 파일(blob)만 유지
+파일은 프론트엔드가 읽는 restaurant_images/ 에 <sha256 앞 32자>.<확장자> 로 평평하게 저장되고,
+인덱스는 append-only JSONL(.image_store.jsonl)에 기록됩니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+
+GMPICS_ID_PATTERN = re.compile(r'__gmpics\d*__/([0-9a-fA-F]+)\.')
+INDEX_FILENAME = '.image_store.jsonl'
+
+
+def image_source_id(image_url):
+    """cloudimg 경로의 해시 id (없으면 URL 경로의 SHA-256)"""
+    match = GMPICS_ID_PATTERN.search(image_url)
+    if match:
+        return match.group(1).lower()
+    path = urlparse(image_url).path
+    return hashlib.sha256(path.encode('utf-8')).hexdigest()
+
+
+def sniff_extension(content, default='.jpg'):
+    """매직 바이트로 확장자 결정"""
+    if content.startswith(b'\xff\xd8\xff'):
+        return '.jpg'
+    if content.startswith(b'\x89PNG\r\n\x1a\n'):
+        return '.png'
+    if content[:4] == b'RIFF' and content[8:12] == b'WEBP':
+        return '.webp'
+    if content[:6] in (b'GIF87a', b'GIF89a'):
+        return '.gif'
+    return default
+
+
+class ImageStore:
+    def __init__(self, root="restaurant_images"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / INDEX_FILENAME
+        self.lock = threading.Lock()
+        self.by_source = {}   # source id → {'sha256', 'filename', 'size'}
+        self.by_sha256 = {}   # sha256 → filename
+        self.stats = {'reused': 0, 'downloaded': 0, 'deduplicated': 0}
+        self._load_index()
+
+    def _load_index(self):
+        """JSONL 인덱스 로드 (뒤에 나온 항목이 우선)"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 중단된 마지막 줄
+                self.by_source[entry['source_id']] = entry
+                self.by_sha256[entry['sha256']] = entry['filename']
+
+    def blob_path(self, filename):
+        return self.root / filename
+
+    def lookup(self, image_url):
+        """이미 저장된 이미지면 blob 경로, 아니면 None"""
+        entry = self.by_source.get(image_source_id(image_url))
+        if entry and self.blob_path(entry['filename']).exists():
+            with self.lock:
+                self.stats['reused'] += 1
+            return self.blob_path(entry['filename'])
+        return None
+
+    def put(self, image_url, content):
+        """바이트를 저장하고 blob 경로 반환 (같은 내용이면 기존 blob 재사용)"""
+        tmp = self.root / f".{image_source_id(image_url)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_bytes(content)
+        return self.put_file(image_url, tmp, hashlib.sha256(content).hexdigest(), len(content), content[:16])
+
+    def put_file(self, image_url, tmp_path, sha256, size, head=b''):
+        """스트리밍으로 받은 임시 파일을 blob 으로 옮기고 경로 반환 (중복이면 임시 파일 삭제)"""
+        source_id = image_source_id(image_url)
+
+        with self.lock:
+            filename = self.by_sha256.get(sha256)
+            if filename and self.blob_path(filename).exists():
+                os.unlink(tmp_path)
+                self.stats['deduplicated'] += 1
+            else:
+                filename = f"{sha256[:32]}{sniff_extension(head)}"
+                os.replace(tmp_path, self.blob_path(filename))
+                self.stats['downloaded'] += 1
+
+            entry = {'source_id': source_id, 'sha256': sha256, 'filename': filename, 'size': size}
+            self.by_source[source_id] = entry
+            self.by_sha256[sha256] = filename
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+        return self.blob_path(filename)
+
+    def print_summary(self):
+        """저장소 통계 출력"""
+        print(f"🗃️ 이미지 저장소: 재사용 {self.stats['reused']}개, 새로 저장 {self.stats['downloaded']}개, "
+              f"내용 중복 제거 {self.stats['deduplicated']}개")
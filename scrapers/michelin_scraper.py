@@ -1,6 +1,5 @@
 import requests
 from bs4 import BeautifulSoup
-import time
 import json
 import csv
 from urllib.parse import urljoin, urlparse
@@ -15,11 +14,27 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
+from image_extraction import TieredImageResolver, expected_gallery_count
+from http_cache import HttpCache, CachedResponse, load_previous_records, images_present
+from image_store import ImageStore
+from crawl_journal import CrawlJournal, compact_journal
+from rate_limiter import HostRateLimiter, RetryPolicy, RateLimitedSession
+from regions import DEFAULT_REGION, resolve_start_url
+from gallery_waits import GALLERY_IMAGE_SELECTOR, PhaseTimer, wait_for_gallery_button, wait_for_stable_count
+import argparse
+import logging
+from run_metrics import RunMetrics, configure_logging
+
+logger = logging.getLogger(__name__)
 
 class MichelinScraper:
-    def __init__(self):
+    def __init__(self, min_static_images=1, http_cache=None, previous_records=None, dedup_images=True,
+                 rate_limiter=None):
         self.base_url = "https://guide.michelin.com"
-        self.session = requests.Session()
+        # 모든 HTTP 요청은 호스트별 적응형 속도 제한기와 재시도 정책을 거침
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.retry_policy = RetryPolicy()
+        self.session = RateLimitedSession(requests.Session(), self.rate_limiter, self.retry_policy)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -27,6 +42,52 @@ class MichelinScraper:
         self.images_dir = Path("restaurant_images")
         self.images_dir.mkdir(exist_ok=True)
         self.driver = None
+        # 정적 HTML → Selenium 단계별 이미지 해석
+        self.image_resolver = TieredImageResolver(min_static_images=min_static_images)
+        # 조건부 요청 캐시와 --since 로 넘겨받은 이전 결과 (url → 레코드)
+        self.http_cache = http_cache
+        self.previous_records = previous_records or {}
+        self.carried_forward_urls = []
+        # source id / SHA-256 기반 이미지 저장소 (끄면 기존 {이름}_{번호} 파일명 사용)
+        self.image_store = ImageStore(self.images_dir) if dedup_images else None
+        # 완료된 음식점/이미지를 한 줄씩 기록하는 크롤 저널 (main 에서 설정)
+        self.journal = None
+        # 단계별 지연 시간/바이트/재시도 지표
+        self.metrics = RunMetrics()
+        self.metrics.register_source('retries', lambda: {'retries': self.retry_policy.retries,
+                                                         'requests': self.retry_policy.requests})
+    
+    def attach_journal(self, journal):
+        """크롤 저널 연결: 이미 완료된 레코드를 불러옴"""
+        self.journal = journal
+        self.restaurants.extend(journal.completed_records())
+    
+    def _get_page(self, url):
+        """페이지 가져오기 (캐시가 있으면 조건부 요청, 304 면 저장된 본문 재사용)"""
+        if self.http_cache:
+            return self.http_cache.fetch(self.session, url)
+        response = self.session.get(url)
+        response.raise_for_status()
+        return CachedResponse(url, response.content, response.status_code, changed=True)
+    
+    def _carry_forward(self, url, page):
+        """변경되지 않은 페이지면 이전 실행의 레코드를 그대로 반환"""
+        if page.changed:
+            return None
+        previous = self.previous_records.get(url)
+        if previous and images_present(previous):
+            self.carried_forward_urls.append(url)
+            print(f"  ♻️ 변경 없음, 이전 결과 재사용: {previous['name']}")
+            return previous
+        return None
+        
+    def _page_url(self, start_url, page):
+        """시작 URL을 기준으로 목록 페이지 URL 생성"""
+        if page == 1:
+            return start_url
+        parsed = urlparse(start_url)
+        path = re.sub(r'/page/\d+/?$', '', parsed.path.rstrip('/'))
+        return parsed._replace(path=f"{path}/page/{page}").geturl()
         
     def get_restaurant_urls(self, start_url):
         """메인 페이지에서 모든 음식점 URL 수집"""
@@ -37,16 +98,14 @@ class MichelinScraper:
         
         while consecutive_empty_pages < 2:  # 연속으로 2페이지가 비어있으면 중단
             try:
-                # 페이지별로 URL 생성 (미슐랭 가이드 URL 패턴에 맞게 수정)
-                if page == 1:
-                    url = start_url
-                else:
-                    # 실제 미슐랭 가이드의 페이지네이션 패턴 확인
-                    url = f"https://guide.michelin.com/kr/ko/seoul-capital-area/kr-seoul/restaurants/page/{page}?sort=distance"
+                # 페이지별로 URL 생성 (시작 URL 경로 뒤에 /page/N)
+                url = self._page_url(start_url, page)
                     
                 print(f"페이지 {page} 처리 중: {url}")
-                response = self.session.get(url)
-                response.raise_for_status()
+                with self.metrics.timed('listing_fetch'):
+                    response = self._get_page(url)
+                if response.changed:
+                    self.metrics.add_bytes('listing_fetch', len(response.content))
                 
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -109,7 +168,6 @@ class MichelinScraper:
                         break
                 
                 page += 1
-                time.sleep(1)  # 요청 간격
                 
             except Exception as e:
                 print(f"페이지 {page} 처리 중 오류: {e}")
@@ -151,70 +209,54 @@ class MichelinScraper:
             self.driver = None
             print("✅ Selenium 드라이버 종료 완료")
     
-    def scrape_images_with_selenium(self, url, restaurant_name):
-        """Selenium을 사용해서 모달을 열고 모든 이미지 수집"""
+    def scrape_images_with_selenium(self, url, restaurant_name, timings=None):
+        """Selenium을 사용해서 모달을 열고 모든 이미지 수집 (단계별 시간은 timings 에 기록)"""
         if not self.setup_selenium_driver():
             return []
         
+        timer = PhaseTimer(timings)
         try:
-            print(f"    🌐 Selenium으로 {restaurant_name} 페이지 로드 중...")
-            self.driver.get(url)
-            
-            # 페이지 로드 대기
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # 이미지 갤러리 버튼 찾기 및 클릭
-            gallery_selectors = [
-                "button.masthead__gallery-open.js-gallery-button",  # 우래옥에서 발견된 갤러리 버튼
-                "button[data-target='#js-gallery-masthead']",  # data-target으로 찾기
-                "button[data-target='#js-modal-gallery']",
-                ".js-modal-gallery-trigger",
-                "button[aria-label*='gallery']",
-                "button[aria-label*='Gallery']",
-                ".gallery-trigger",
-                ".image-gallery-trigger"
-            ]
-            
-            gallery_button = None
-            for selector in gallery_selectors:
-                try:
-                    gallery_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    print(f"    ✅ 갤러리 버튼 발견: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            logger.debug(f"    🌐 Selenium으로 {restaurant_name} 페이지 로드 중...")
+            with timer.phase('browser_load'):
+                self.driver.get(url)
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+            
+            # 이미지 갤러리 버튼: 모든 선택자를 한 번의 대기로 확인
+            with timer.phase('gallery_button'):
+                selector, gallery_button = wait_for_gallery_button(self.driver)
             
             if gallery_button:
+                logger.debug(f"    ✅ 갤러리 버튼 발견: {selector}")
                 # 갤러리 버튼 클릭
                 self.driver.execute_script("arguments[0].click();", gallery_button)
-                print(f"    🖼️ 갤러리 모달 열기 시도...")
+                logger.debug(f"    🖼️ 갤러리 모달 열기 시도...")
                 
                 # 모달이 열릴 때까지 대기
                 try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".modal__gallery-image"))
-                    )
-                    print(f"    ✅ 갤러리 모달 열림 확인")
+                    with timer.phase('modal_open'):
+                        WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, ".modal__gallery-image"))
+                        )
+                    logger.debug(f"    ✅ 갤러리 모달 열림 확인")
                     
-                    # 모든 이미지가 로드될 때까지 잠시 대기
-                    time.sleep(3)
+                    # 이미지 수가 더 이상 늘지 않을 때까지 대기
+                    with timer.phase('image_stabilize'):
+                        wait_for_stable_count(self.driver)
                     
                 except TimeoutException:
-                    print(f"    ⚠️ 갤러리 모달 열기 실패, 기본 이미지만 수집")
+                    logger.debug(f"    ⚠️ 갤러리 모달 열기 실패, 기본 이미지만 수집")
             else:
-                print(f"    ⚠️ 갤러리 버튼을 찾을 수 없음, 기본 이미지만 수집")
+                logger.debug(f"    ⚠️ 갤러리 버튼을 찾을 수 없음, 기본 이미지만 수집")
             
             # 현재 페이지의 모든 이미지 URL 추출
             image_urls = []
             processed_urls = set()
             
             # ci-src 속성이 있는 모든 이미지 찾기
-            ci_images = self.driver.find_elements(By.CSS_SELECTOR, "img[ci-src]")
-            print(f"    📸 ci-src 속성이 있는 이미지: {len(ci_images)}개")
+            ci_images = self.driver.find_elements(By.CSS_SELECTOR, GALLERY_IMAGE_SELECTOR)
+            logger.debug(f"    📸 ci-src 속성이 있는 이미지: {len(ci_images)}개")
             
             for img in ci_images:
                 try:
@@ -235,15 +277,15 @@ class MichelinScraper:
                             if 'cloudimg.io' in original_url:
                                 image_urls.append(original_url)
                                 processed_urls.add(original_url)
-                                print(f"      ✓ 이미지 발견: {original_url[:60]}...")
+                                logger.debug(f"      ✓ 이미지 발견: {original_url[:60]}...")
                 except Exception as e:
                     continue
             
-            print(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출 (Selenium)")
+            logger.debug(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출 (Selenium)")
             return image_urls
             
         except Exception as e:
-            print(f"    ❌ Selenium 이미지 수집 실패: {e}")
+            logger.warning(f"    ❌ Selenium 이미지 수집 실패: {e}")
             return []
     
     def extract_image_urls(self, soup, restaurant_name):
@@ -251,7 +293,7 @@ class MichelinScraper:
         image_urls = []
         processed_urls = set()  # 중복 방지를 위한 set
         
-        print(f"    🔍 {restaurant_name} 이미지 추출 시작...")
+        logger.debug(f"    🔍 {restaurant_name} 이미지 추출 시작...")
         
         # 음식점별 고유 이미지 선택자 (우선순위 순)
         selectors = [
@@ -266,7 +308,7 @@ class MichelinScraper:
         
         for selector in selectors:
             image_elements = soup.select(selector)
-            print(f"    선택자 '{selector}': {len(image_elements)}개 이미지 발견")
+            logger.debug(f"    선택자 '{selector}': {len(image_elements)}개 이미지 발견")
             
             for img in image_elements:
                 # 다양한 속성에서 URL 추출
@@ -293,14 +335,14 @@ class MichelinScraper:
                         if self.is_restaurant_image(original_url, img, restaurant_name):
                             image_urls.append(original_url)
                             processed_urls.add(original_url)
-                            print(f"      ✓ 고유 이미지 발견: {original_url[:60]}...")
+                            logger.debug(f"      ✓ 고유 이미지 발견: {original_url[:60]}...")
                         else:
-                            print(f"      ❌ 필터링됨: {original_url[:60]}...")
+                            logger.debug(f"      ❌ 필터링됨: {original_url[:60]}...")
         
         # 추가: 모든 img 태그에서 ci-src 속성만 따로 찾기 (JavaScript로 동적 로드된 이미지들)
-        print(f"    🔍 추가 검색: 모든 img 태그에서 ci-src 속성 찾기...")
+        logger.debug(f"    🔍 추가 검색: 모든 img 태그에서 ci-src 속성 찾기...")
         all_ci_images = soup.find_all('img', {'ci-src': True})
-        print(f"    ci-src 속성이 있는 이미지: {len(all_ci_images)}개")
+        logger.debug(f"    ci-src 속성이 있는 이미지: {len(all_ci_images)}개")
         
         for img in all_ci_images:
             url = img.get('ci-src')
@@ -323,11 +365,11 @@ class MichelinScraper:
                 if self.is_restaurant_image(original_url, img, restaurant_name):
                     image_urls.append(original_url)
                     processed_urls.add(original_url)
-                    print(f"      ✓ ci-src 이미지 발견: {original_url[:60]}...")
+                    logger.debug(f"      ✓ ci-src 이미지 발견: {original_url[:60]}...")
                 else:
-                    print(f"      ❌ ci-src 이미지 필터링됨: {original_url[:60]}...")
+                    logger.debug(f"      ❌ ci-src 이미지 필터링됨: {original_url[:60]}...")
         
-        print(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출")
+        logger.debug(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출")
         return image_urls
     
     def is_restaurant_image(self, url, img_element, restaurant_name):
@@ -337,13 +379,13 @@ class MichelinScraper:
         # 'modal__gallery-image' 클래스를 가진 부모 div 안에 있는 이미지는 갤러리 이미지로 간주
         parent_div = img_element.find_parent('div', class_='modal__gallery-image')
         if parent_div:
-            print(f"      ✅ 갤러리 이미지로 확인되어 통과: {url[:60]}...")
+            logger.debug(f"      ✅ 갤러리 이미지로 확인되어 통과: {url[:60]}...")
             return True
         
         # 2. owl-item 내부의 이미지도 갤러리 이미지로 간주
         owl_item = img_element.find_parent('div', class_='owl-item')
         if owl_item:
-            print(f"      ✅ 캐러셀 이미지로 확인되어 통과: {url[:60]}...")
+            logger.debug(f"      ✅ 캐러셀 이미지로 확인되어 통과: {url[:60]}...")
             return True
         
         # 3. 제외할 이미지 패턴들 (갤러리 이미지가 아닌 경우에만 적용)
@@ -357,20 +399,20 @@ class MichelinScraper:
         # URL에서 제외 패턴 확인
         for pattern in exclude_patterns:
             if pattern in url.lower():
-                print(f"      ❌ URL 패턴 제외: {pattern}")
+                logger.debug(f"      ❌ URL 패턴 제외: {pattern}")
                 return False
         
         # 클래스에서 제외 패턴 확인
         classes = img_element.get('class', [])
         for cls in classes:
             if any(pattern in cls.lower() for pattern in exclude_patterns):
-                print(f"      ❌ 클래스 패턴 제외: {cls}")
+                logger.debug(f"      ❌ 클래스 패턴 제외: {cls}")
                 return False
         
         # alt 텍스트에서 제외 패턴 확인
         alt_text = img_element.get('alt', '').lower()
         if any(pattern in alt_text for pattern in exclude_patterns):
-            print(f"      ❌ alt 텍스트 제외: {alt_text}")
+            logger.debug(f"      ❌ alt 텍스트 제외: {alt_text}")
             return False
         
         # 4. 공통 이미지 URL 패턴들 (여러 음식점에서 반복 사용되는 이미지)
@@ -383,12 +425,12 @@ class MichelinScraper:
         # 공통 이미지 패턴 확인
         for pattern in common_image_patterns:
             if pattern in url:
-                print(f"      ❌ 공통 이미지 제외: {pattern}")
+                logger.debug(f"      ❌ 공통 이미지 제외: {pattern}")
                 return False
         
         # 5. cloudimg.io 도메인의 이미지는 음식점 이미지일 가능성이 높음
         if 'cloudimg.io' in url:
-            print(f"      ✅ cloudimg.io 이미지로 통과: {url[:60]}...")
+            logger.debug(f"      ✅ cloudimg.io 이미지로 통과: {url[:60]}...")
             return True
         
         # 6. 크기가 작은 이미지들 제외 (아이콘일 가능성)
@@ -398,17 +440,31 @@ class MichelinScraper:
             try:
                 w, h = int(width), int(height)
                 if w < 100 or h < 100:  # 100px 미만은 아이콘으로 간주
-                    print(f"      ❌ 크기 너무 작음 ({w}x{h}): {url[:60]}...")
+                    logger.debug(f"      ❌ 크기 너무 작음 ({w}x{h}): {url[:60]}...")
                     return False
             except ValueError:
                 pass
         
-        print(f"      ✅ 모든 필터 통과: {url[:60]}...")
+        logger.debug(f"      ✅ 모든 필터 통과: {url[:60]}...")
         return True
     
     def download_image(self, image_url, restaurant_name, image_index):
         """이미지 다운로드 및 저장"""
         try:
+            # 중단 전에 이미 받아둔 이미지면 다운로드 생략
+            if self.journal:
+                journaled_path = self.journal.downloaded_image(image_url)
+                if journaled_path:
+                    logger.debug(f"  ♻️ 이미지 재사용: {os.path.basename(journaled_path)}")
+                    return journaled_path
+            
+            # 이미 저장된 source id 면 다운로드 생략
+            if self.image_store:
+                stored_path = self.image_store.lookup(image_url)
+                if stored_path:
+                    logger.debug(f"  ♻️ 이미지 재사용: {stored_path.name}")
+                    return str(stored_path)
+            
             # 안전한 파일명 생성
             safe_name = re.sub(r'[^\w\-_\.]', '_', restaurant_name)
             safe_name = safe_name[:50]  # 파일명 길이 제한
@@ -423,27 +479,36 @@ class MichelinScraper:
             filepath = self.images_dir / filename
             
             # 이미지 다운로드
-            response = self.session.get(image_url, timeout=30)
-            response.raise_for_status()
+            with self.metrics.timed('image_download'):
+                response = self.session.get(image_url, timeout=30)
+                response.raise_for_status()
+            self.metrics.add_bytes('image_download', len(response.content))
+            
+            with self.metrics.timed('disk_write'):
+                if self.image_store:
+                    filepath = self.image_store.put(image_url, response.content)
+                else:
+                    # 파일 저장
+                    with open(filepath, 'wb') as f:
+                        f.write(response.content)
             
-            # 파일 저장
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            if self.journal:
+                self.journal.record_image(image_url, str(filepath))
             
-            print(f"  ✓ 이미지 저장: {filename}")
+            logger.debug(f"  ✓ 이미지 저장: {filepath.name}")
             return str(filepath)
             
         except Exception as e:
-            print(f"  ❌ 이미지 다운로드 실패: {e}")
+            logger.warning(f"  ❌ 이미지 다운로드 실패: {e}")
             return None
     
     def debug_html_structure(self, soup, restaurant_name):
         """HTML 구조 디버깅을 위한 함수"""
-        print(f"    🔍 {restaurant_name} HTML 구조 분석:")
+        logger.debug(f"    🔍 {restaurant_name} HTML 구조 분석:")
         
         # 모든 img 태그 찾기
         all_images = soup.find_all('img')
-        print(f"    - 전체 img 태그: {len(all_images)}개")
+        logger.debug(f"    - 전체 img 태그: {len(all_images)}개")
         
         # 클래스별 이미지 분석
         image_classes = {}
@@ -454,78 +519,88 @@ class MichelinScraper:
                     image_classes[cls] = 0
                 image_classes[cls] += 1
         
-        print(f"    - 이미지 클래스 분포: {image_classes}")
+        logger.debug(f"    - 이미지 클래스 분포: {image_classes}")
         
         # 속성별 분석
         attributes = ['ci-src', 'data-src', 'src', 'data-srcset']
         for attr in attributes:
             count = len(soup.find_all('img', {attr: True}))
             if count > 0:
-                print(f"    - {attr} 속성: {count}개")
+                logger.debug(f"    - {attr} 속성: {count}개")
         
         # 갤러리 관련 요소 찾기
         gallery_selectors = ['.gallery', '.image-gallery', '.restaurant-image', '.photo-gallery', '.carousel']
         for selector in gallery_selectors:
             elements = soup.select(selector)
             if elements:
-                print(f"    - {selector}: {len(elements)}개 발견")
+                logger.debug(f"    - {selector}: {len(elements)}개 발견")
     
-    def scrape_restaurant_images(self, url, restaurant_name):
-        """음식점 이미지들 스크래핑 및 다운로드 (Selenium 사용)"""
+    def scrape_restaurant_images(self, url, restaurant_name, soup=None, timings=None):
+        """음식점 이미지들 스크래핑 및 다운로드 (정적 HTML 우선, 부족하면 Selenium)"""
         try:
-            print(f"  🖼️ {restaurant_name} 이미지 수집 중...")
-            
-            # 먼저 Selenium으로 모달을 열고 모든 이미지 수집 시도
-            selenium_image_urls = self.scrape_images_with_selenium(url, restaurant_name)
+            logger.debug(f"  🖼️ {restaurant_name} 이미지 수집 중...")
             
-            if selenium_image_urls:
-                print(f"  📸 {restaurant_name}: Selenium으로 {len(selenium_image_urls)}개 이미지 발견")
-                image_urls = selenium_image_urls
-            else:
-                # Selenium 실패 시 기존 방식으로 폴백
-                print(f"  🔄 Selenium 실패, 기존 방식으로 폴백...")
+            if soup is None:
                 response = self.session.get(url)
                 response.raise_for_status()
-                
                 soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 디버깅 정보 출력 (처음 몇 개만)
-                if len(self.restaurants) < 3:
-                    self.debug_html_structure(soup, restaurant_name)
-                
-                # 이미지 URL들 추출
-                image_urls = self.extract_image_urls(soup, restaurant_name)
-                
-                if not image_urls:
-                    print(f"  ⚠️ {restaurant_name}: 이미지를 찾을 수 없습니다.")
-                    return []
-                
-                print(f"  📸 {restaurant_name}: 기존 방식으로 {len(image_urls)}개 이미지 발견")
+            
+            # 디버깅 정보 출력 (처음 몇 개만)
+            if len(self.restaurants) < 3:
+                self.debug_html_structure(soup, restaurant_name)
+            
+            # 이미 받아온 HTML에서 먼저 찾고, 부족할 때만 Selenium으로 모달을 열어 수집
+            timer = PhaseTimer(timings)
+            with timer.phase('gallery_urls'):
+                image_urls, tier = self.image_resolver.resolve(
+                    soup, lambda: self.scrape_images_with_selenium(url, restaurant_name, timer.timings),
+                    expected_count=expected_gallery_count(soup)
+                )
+            
+            if not image_urls:
+                logger.debug(f"  ⚠️ {restaurant_name}: 이미지를 찾을 수 없습니다.")
+                return []
+            
+            if tier == 'browser':
+                logger.debug(f"  📸 {restaurant_name}: Selenium으로 {len(image_urls)}개 이미지 발견")
+            else:
+                logger.debug(f"  📸 {restaurant_name}: 정적 HTML에서 {len(image_urls)}개 이미지 발견")
             
             # 이미지들 다운로드
             downloaded_images = []
-            for i, image_url in enumerate(image_urls, 1):
-                filepath = self.download_image(image_url, restaurant_name, i)
-                if filepath:
-                    downloaded_images.append({
-                        'url': image_url,
-                        'local_path': filepath,
-                        'filename': os.path.basename(filepath)
-                    })
+            with timer.phase('image_download'):
+                for i, image_url in enumerate(image_urls, 1):
+                    filepath = self.download_image(image_url, restaurant_name, i)
+                    if filepath:
+                        downloaded_images.append({
+                            'url': image_url,
+                            'local_path': filepath,
+                            'filename': os.path.basename(filepath)
+                        })
             
             return downloaded_images
             
         except Exception as e:
-            print(f"  ❌ {restaurant_name} 이미지 스크래핑 실패: {e}")
+            logger.warning(f"  ❌ {restaurant_name} 이미지 스크래핑 실패: {e}")
             return []
     
     def scrape_restaurant_detail(self, url):
         """개별 음식점 상세 정보 스크래핑"""
+        timer = PhaseTimer()
         try:
-            response = self.session.get(url)  
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with timer.phase('detail_fetch'):
+                response = self._get_page(url)
+            if response.changed:
+                self.metrics.add_bytes('detail_fetch', len(response.content))
+            
+            # 304 이고 이전 결과가 있으면 파싱/이미지 수집 생략
+            previous = self._carry_forward(url, response)
+            if previous:
+                self.metrics.observe_timings(timer.timings)
+                return previous
+            
+            with timer.phase('parse'):
+                soup = BeautifulSoup(response.content, 'html.parser')
             
             # 음식점 이름 - data-sheet__title 클래스 사용
             name_element = soup.find('h1', class_='data-sheet__title')
@@ -621,9 +696,8 @@ class MichelinScraper:
             
             rating = ', '.join(rating_parts) if rating_parts else "0 Star, 추천 레스토랑"
             
-            # 이미지 스크래핑
-            print(f"  🖼️ {name} 이미지 수집 중...")
-            images = self.scrape_restaurant_images(url, name)
+            # 이미지 스크래핑 (이미 받은 soup 재사용)
+            images = self.scrape_restaurant_images(url, name, soup, timer.timings)
             
             restaurant_data = {
                 'name': name,
@@ -633,19 +707,23 @@ class MichelinScraper:
                 'rating': rating,
                 'url': url,
                 'images': images,
-                'image_count': len(images)
+                'image_count': len(images),
+                'timings': timer.timings
             }
+            self.metrics.observe_timings(timer.timings)
             
             return restaurant_data
             
         except Exception as e:
-            print(f"URL {url} 처리 중 오류: {e}")
+            logger.warning(f"URL {url} 처리 중 오류: {e}")
             return None
     
     def scrape_all_restaurants(self, start_url):
         """모든 음식점 정보 수집"""
-        # 1단계: 음식점 URL들 수집
+        # 1단계: 음식점 URL들 수집 (저널에 있는 URL 제외)
         restaurant_urls = self.get_restaurant_urls(start_url)
+        if self.journal:
+            restaurant_urls = [url for url in restaurant_urls if not self.journal.is_completed(url)]
         
         # 2단계: 각 음식점 상세 정보 수집
         print("\n상세 정보 수집 시작...")
@@ -653,27 +731,29 @@ class MichelinScraper:
         failed_count = 0
         
         for i, url in enumerate(restaurant_urls, 1):
-            print(f"\n({i}/{len(restaurant_urls)}) {url} 처리 중...")
+            logger.debug(f"\n({i}/{len(restaurant_urls)}) {url} 처리 중...")
             
             try:
                 restaurant_data = self.scrape_restaurant_detail(url)
                 if restaurant_data:
                     self.restaurants.append(restaurant_data)
+                    if self.journal:
+                        self.journal.record_restaurant(restaurant_data)
                     successful_count += 1
-                    print(f"✓ {restaurant_data['name']} 수집 완료 (이미지 {restaurant_data.get('image_count', 0)}개)")
+                    self.metrics.increment('restaurants_ok')
+                    logger.info(f"✓ {restaurant_data['name']} 수집 완료 (이미지 {restaurant_data.get('image_count', 0)}개)")
                 else:
                     failed_count += 1
-                    print(f"❌ {url} 수집 실패")
+                    self.metrics.increment('restaurants_failed')
+                    logger.warning(f"❌ {url} 수집 실패")
             except Exception as e:
                 failed_count += 1
-                print(f"❌ {url} 처리 중 오류: {e}")
+                self.metrics.increment('restaurants_failed')
+                logger.warning(f"❌ {url} 처리 중 오류: {e}")
             
             # 진행 상황 출력
             if i % 10 == 0:
                 print(f"\n📊 진행 상황: {i}/{len(restaurant_urls)} (성공: {successful_count}, 실패: {failed_count})")
-            
-            # 요청 간격 (서버 부하 방지)
-            time.sleep(2)  # 이미지 다운로드로 인해 간격 증가
         
         return self.restaurants
     
@@ -734,11 +814,41 @@ URL: {restaurant['url']}
 """)
 
 def main():
+    parser = argparse.ArgumentParser(description="미슐랭 가이드 스크래퍼")
+    parser.add_argument('--since', nargs='?', const='michelin_restaurants.json', default=None,
+                        help="이전 결과 JSON 에서 변경 없는(304) 음식점 레코드를 그대로 가져옴")
+    parser.add_argument('--cache-dir', default='.http_cache', help="HTTP 캐시 디렉토리")
+    parser.add_argument('--no-cache', action='store_true', help="조건부 요청 캐시 사용 안 함")
+    parser.add_argument('--legacy-image-names', action='store_true',
+                        help="이미지 저장소 대신 {이름}_{번호} 파일명으로 매번 다운로드")
+    parser.add_argument('--journal', default='crawl_journal.jsonl', help="크롤 저널 경로")
+    parser.add_argument('--resume', action='store_true', help="저널에 기록된 음식점은 건너뛰고 이어서 수집")
+    parser.add_argument('--region', default=DEFAULT_REGION, help="regions.json 에 정의된 리전 이름")
+    parser.add_argument('--start-url', default=None, help="리전 대신 직접 지정할 시작 URL")
+    parser.add_argument('--metrics-json', default='run_metrics.json', help="실행 지표 JSON 경로")
+    parser.add_argument('--metrics-prom', default=None, help="실행 중 주기적으로 갱신할 Prometheus 텍스트 파일 경로")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="로그 레벨 (DEBUG 면 이미지 단위 로그까지 출력)")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+    
+    http_cache = None if args.no_cache else HttpCache(args.cache_dir)
+    previous_records = load_previous_records(args.since) if args.since else {}
+    if args.since:
+        print(f"♻️ 이전 결과 {len(previous_records)}개 로드: {args.since}")
+    
     # 스크래퍼 초기화
-    scraper = MichelinScraper()
+    scraper = MichelinScraper(http_cache=http_cache, previous_records=previous_records,
+                              dedup_images=not args.legacy_image_names)
+    journal = CrawlJournal(args.journal, resume=args.resume)
+    scraper.attach_journal(journal)
+    if args.resume:
+        print(f"📒 저널에서 {len(journal.restaurants)}개 음식점, {len(journal.images)}개 이미지 복원")
     
-    # 시작 URL
-    start_url = "https://guide.michelin.com/kr/ko/seoul-capital-area/kr-seoul/restaurants?sort=distance"
+    # 시작 URL (리전 매니페스트 또는 --start-url)
+    start_url = resolve_start_url(args.region, args.start_url)
+    if args.metrics_prom:
+        scraper.metrics.start_live(args.metrics_prom)
     
     try:
         # 데이터 수집
@@ -747,8 +857,9 @@ def main():
         # 결과 출력
         scraper.print_results()
         
-        # 파일로 저장
-        scraper.save_to_json()
+        # 저널 정리 → 최종 JSON, CSV 저장
+        journal.close()
+        compact_journal(args.journal, 'michelin_restaurants.json')
         scraper.save_to_csv()
         
         # 최종 통계
@@ -757,6 +868,15 @@ def main():
         print(f"📊 총 음식점: {len(scraper.restaurants)}개")
         print(f"🖼️ 총 이미지: {total_images}개")
         print(f"📁 이미지 저장 위치: {scraper.images_dir.absolute()}")
+        scraper.image_resolver.print_summary()
+        if scraper.http_cache:
+            scraper.http_cache.print_summary()
+        print(f"♻️ 이전 결과 재사용: {len(scraper.carried_forward_urls)}개")
+        scraper.rate_limiter.print_summary()
+        print(f"🔁 재시도: {scraper.retry_policy.retries}회 / 요청 {scraper.retry_policy.requests}개")
+        if scraper.image_store:
+            scraper.image_store.print_summary()
+        scraper.metrics.print_summary()
         
     except KeyboardInterrupt:
         print("\n\n스크래핑이 중단되었습니다.")
@@ -766,6 +886,13 @@ def main():
         if scraper.restaurants:
             scraper.save_to_json('michelin_restaurants_partial.json')
             scraper.save_to_csv('michelin_restaurants_partial.csv')
+        print(f"📒 --resume 으로 이어서 수집할 수 있습니다: {args.journal}")
+    
+    finally:
+        journal.close()
+        scraper.close_selenium_driver()
+        scraper.metrics.stop_live()
+        scraper.metrics.write_json(args.metrics_json)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
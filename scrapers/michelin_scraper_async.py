@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio/aiohttp 기반 미슐랭 스크래퍼
+목록 페이지와 상세 페이지를 커넥션 풀을 공유하는 비동기 HTTP 클라이언트로 동시에 가져오고,
+호스트별 동시 요청 수는 --per-host-limit 으로 제한합니다.
+파싱/이미지 수집/저장은 UltraFastMichelinScraper 와 동일하므로
+michelin_restaurants_ultra.json 과 같은 스키마로 저장됩니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+from crawl_journal import CrawlJournal, compact_journal
+from http_cache import HttpCache, CachedResponse, load_previous_records
+from michelin_scraper_ultra_fast import UltraFastMichelinScraper
+from page_parser import BACKEND_NAMES, DEFAULT_BACKEND
+from rate_limiter import RETRY_STATUSES, parse_retry_after
+from gallery_waits import PhaseTimer
+from regions import DEFAULT_REGION, resolve_start_url
+from run_metrics import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMichelinScraper(UltraFastMichelinScraper):
+    def __init__(self, max_workers=4, driver_pool_size=4, scrape_images=True,
+                 per_host_limit=8, total_limit=64, request_timeout=30,
+                 http_cache=None, previous_records=None, dedup_images=True, image_workers=8,
+                 rate_limiter=None, parser_backend='html.parser', parse_processes=0):
+        super().__init__(max_workers=max_workers, driver_pool_size=driver_pool_size,
+                         scrape_images=scrape_images, http_cache=http_cache,
+                         previous_records=previous_records, dedup_images=dedup_images,
+                         image_workers=image_workers, rate_limiter=rate_limiter,
+                         parser_backend=parser_backend, parse_processes=parse_processes)
+        self.per_host_limit = per_host_limit
+        self.total_limit = total_limit
+        self.request_timeout = request_timeout
+
+        # 이미지 수집(Selenium 폴백 + 다운로드 대기)은 블로킹 API 이므로 스레드에서 실행
+        self.image_executor = ThreadPoolExecutor(max_workers=max(1, driver_pool_size, max_workers))
+
+        print(f"⚡ 비동기 모드: 호스트당 최대 {per_host_limit}개, 전체 최대 {total_limit}개 동시 요청")
+
+    def _create_http_session(self):
+        """호스트별 동시 요청 제한이 걸린 aiohttp 세션 생성"""
+        connector = aiohttp.TCPConnector(limit=self.total_limit, limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={'User-Agent': self.session.headers['User-Agent']}
+        )
+
+    async def _fetch(self, http, url):
+        """URL 응답 가져오기 (속도 제한 + 재시도, 캐시가 있으면 조건부 요청, 4xx/5xx 는 예외)"""
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async(url)
+            self.retry_policy.note_request()
+            headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+            try:
+                async with http.get(url, headers=headers) as response:
+                    if response.status in RETRY_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        self.rate_limiter.on_throttle(url, retry_after)
+                        if self.retry_policy.try_spend(attempt):
+                            await asyncio.sleep(self.retry_policy.backoff(attempt, retry_after))
+                            attempt += 1
+                            continue
+                    if response.status != 304:
+                        response.raise_for_status()
+                    content = await response.read()
+                    self.rate_limiter.on_success(url)
+                    if self.http_cache:
+                        return self.http_cache.record(url, response.status, response.headers, content)
+                    return CachedResponse(url, content, response.status, changed=True)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.rate_limiter.on_throttle(url)
+                if not self.retry_policy.try_spend(attempt):
+                    raise
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+
+    async def _fetch_listing_page(self, http, start_url, page):
+        """목록 페이지 하나를 가져와 (상세 URL 목록, 최대 페이지) 반환"""
+        url = self._page_url(start_url, page)
+        logger.info(f"페이지 {page} 처리 중: {url}")
+        started = time.perf_counter()
+        try:
+            response = await self._fetch(http, url)
+        except Exception as e:
+            logger.warning(f"페이지 {page} 처리 중 오류: {e}")
+            self.metrics.observe('listing_fetch', time.perf_counter() - started, ok=False)
+            return [], 0
+        self.metrics.observe('listing_fetch', time.perf_counter() - started,
+                             nbytes=len(response.content) if response.changed else 0)
+        return await self.page_parser.parse_listing_async(response.content, self.base_url)
+
+    async def get_restaurant_urls_async(self, http, start_url):
+        """목록 페이지 수집: 1페이지에서 최대 페이지를 알면 나머지를 동시에 가져옴"""
+        print("음식점 URL 수집 중... (비동기)")
+        first_urls, max_page = await self._fetch_listing_page(http, start_url, 1)
+        pages = [first_urls]
+
+        if max_page > 1:
+            rest = await asyncio.gather(*[
+                self._fetch_listing_page(http, start_url, page)
+                for page in range(2, max_page + 1)
+            ])
+            pages.extend(page_urls for page_urls, _ in rest)
+        else:
+            # 페이지네이션이 없으면 기존처럼 연속 빈 페이지 2개까지 순차 탐색
+            page = 2
+            consecutive_empty_pages = 0 if first_urls else 1
+            while consecutive_empty_pages < 2:
+                page_urls, _ = await self._fetch_listing_page(http, start_url, page)
+                consecutive_empty_pages = 0 if page_urls else consecutive_empty_pages + 1
+                pages.append(page_urls)
+                page += 1
+
+        # 페이지 순서를 유지하면서 중복 제거
+        restaurant_urls = list(dict.fromkeys(url for page_urls in pages for url in page_urls))
+        print(f"총 {len(restaurant_urls)}개 음식점 URL 수집 완료")
+        return restaurant_urls
+
+    async def scrape_restaurant_detail_async(self, http, url):
+        """개별 음식점 상세 정보 스크래핑 (비동기 HTTP + 스레드에서 Selenium)"""
+        timer = PhaseTimer()
+        try:
+            with timer.phase('detail_fetch'):
+                response = await self._fetch(http, url)
+            if response.changed:
+                self.metrics.add_bytes('detail_fetch', len(response.content))
+            previous = self._carry_forward(url, response)
+            if previous:
+                self.metrics.observe_timings(timer.timings)
+                self.metrics.increment('carried_forward')
+                if self.journal:
+                    self.journal.record_restaurant(previous)
+                return previous
+
+            # 파싱은 이벤트 루프를 막지 않도록 프로세스 풀(설정 시)에서 실행
+            with timer.phase('parse'):
+                parsed = await self.page_parser.parse_detail_async(response.content)
+            info = parsed['info']
+
+            images = []
+            if self.scrape_images:
+                logger.debug(f"  🖼️ {info['name']} 이미지 수집 중...")
+                loop = asyncio.get_running_loop()
+                images = await loop.run_in_executor(
+                    self.image_executor, self.collect_images, url, info['name'], None, parsed['gallery_urls'],
+                    timer.timings, parsed['gallery_count']
+                )
+
+            logger.info(f"✓ {info['name']} 수집 완료 (이미지 {len(images)}개)")
+            self.metrics.observe_timings(timer.timings)
+            self.metrics.increment('restaurants_ok')
+            restaurant_data = self.build_restaurant_data(info, url, images, timer.timings)
+            if self.journal:
+                self.journal.record_restaurant(restaurant_data)
+            return restaurant_data
+
+        except Exception as e:
+            logger.warning(f"URL {url} 처리 중 오류: {e}")
+            self.metrics.increment('restaurants_failed')
+            return None
+
+    async def crawl(self, start_url):
+        """목록 → 상세 전체 수집, (성공 수, 실패 수) 반환"""
+        async with self._create_http_session() as http:
+            restaurant_urls = await self.get_restaurant_urls_async(http, start_url)
+            if self.journal:
+                restaurant_urls = [url for url in restaurant_urls if not self.journal.is_completed(url)]
+
+            print(f"\n상세 정보 수집 시작... (비동기: {len(restaurant_urls)}개)")
+            results = await asyncio.gather(*[
+                self.scrape_restaurant_detail_async(http, url) for url in restaurant_urls
+            ])
+
+        successful = [result for result in results if result]
+        self.restaurants.extend(successful)
+        return len(successful), len(results) - len(successful)
+
+    def close(self):
+        """이미지 스레드와 드라이버 풀 정리"""
+        self.image_executor.shutdown(wait=True)
+        self.image_pipeline.close()
+        self.page_parser.close()
+        self.driver_pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="asyncio/aiohttp 기반 미슐랭 스크래퍼")
+    parser.add_argument('--region', default=DEFAULT_REGION, help="regions.json 에 정의된 리전 이름")
+    parser.add_argument('--start-url', default=None, help="리전 대신 직접 지정할 시작 URL")
+    parser.add_argument('--parser', default=DEFAULT_BACKEND, choices=BACKEND_NAMES, help="HTML 파서 백엔드")
+    parser.add_argument('--parse-processes', type=int, default=2, help="파싱 프로세스 수 (0 이면 이벤트 루프에서 파싱)")
+    parser.add_argument('--per-host-limit', type=int, default=8, help="호스트당 최대 동시 요청 수")
+    parser.add_argument('--total-limit', type=int, default=64, help="전체 최대 동시 요청 수")
+    parser.add_argument('--driver-pool-size', type=int, default=4, help="Selenium 드라이버 수")
+    parser.add_argument('--no-images', action='store_true', help="이미지 수집 생략")
+    parser.add_argument('--output', default='michelin_restaurants_ultra.json')
+    parser.add_argument('--since', nargs='?', const='michelin_restaurants_ultra.json', default=None,
+                        help="이전 결과 JSON 에서 변경 없는(304) 음식점 레코드를 그대로 가져옴")
+    parser.add_argument('--cache-dir', default='.http_cache', help="HTTP 캐시 디렉토리")
+    parser.add_argument('--no-cache', action='store_true', help="조건부 요청 캐시 사용 안 함")
+    parser.add_argument('--legacy-image-names', action='store_true',
+                        help="이미지 저장소 대신 {이름}_{번호} 파일명으로 매번 다운로드")
+    parser.add_argument('--image-workers', type=int, default=8, help="이미지 다운로드 워커 수")
+    parser.add_argument('--journal', default='crawl_journal_ultra.jsonl', help="크롤 저널 경로")
+    parser.add_argument('--resume', action='store_true', help="저널에 기록된 음식점은 건너뛰고 이어서 수집")
+    parser.add_argument('--metrics-json', default='run_metrics_async.json', help="실행 지표 JSON 경로")
+    parser.add_argument('--metrics-prom', default=None, help="실행 중 주기적으로 갱신할 Prometheus 텍스트 파일 경로")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="로그 레벨 (DEBUG 면 이미지 단위 로그까지 출력)")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+
+    scraper = AsyncMichelinScraper(
+        driver_pool_size=args.driver_pool_size,
+        scrape_images=not args.no_images,
+        per_host_limit=args.per_host_limit,
+        total_limit=args.total_limit,
+        http_cache=None if args.no_cache else HttpCache(args.cache_dir),
+        previous_records=load_previous_records(args.since) if args.since else {},
+        dedup_images=not args.legacy_image_names,
+        image_workers=args.image_workers,
+        parser_backend=args.parser,
+        parse_processes=args.parse_processes
+    )
+    journal = CrawlJournal(args.journal, resume=args.resume)
+    scraper.attach_journal(journal)
+    if args.metrics_prom:
+        scraper.metrics.start_live(args.metrics_prom)
+
+    try:
+        start_time = time.time()
+        successful_count, failed_count = asyncio.run(scraper.crawl(resolve_start_url(args.region, args.start_url)))
+        elapsed_time = time.time() - start_time
+
+        print(f"\n🎉 비동기 스크래핑 완료!")
+        print(f"⏱️ 총 소요 시간: {elapsed_time:.2f}초")
+        print(f"✅ 성공: {successful_count}개")
+        print(f"❌ 실패: {failed_count}개")
+        scraper.image_resolver.print_summary()
+        if scraper.http_cache:
+            scraper.http_cache.print_summary()
+        print(f"♻️ 이전 결과 재사용: {len(scraper.carried_forward_urls)}개")
+        scraper.rate_limiter.print_summary()
+        print(f"🔁 재시도: {scraper.retry_policy.retries}회 / 요청 {scraper.retry_policy.requests}개")
+        if scraper.image_store:
+            scraper.image_store.print_summary()
+        scraper.page_parser.counter.print_summary()
+        scraper.driver_pool.print_summary()
+        scraper.browser_traffic.print_summary()
+        scraper.gallery_counter.print_summary()
+        scraper.image_pipeline.counter.print_summary()
+        scraper.metrics.print_summary()
+
+        journal.close()
+        compact_journal(args.journal, args.output)
+        scraper.save_to_csv(args.output.replace('.json', '.csv'))
+
+    except KeyboardInterrupt:
+        print("\n\n스크래핑이 중단되었습니다.")
+        if scraper.restaurants:
+            scraper.save_to_json('michelin_restaurants_ultra_partial.json')
+        print(f"📒 --resume 으로 이어서 수집할 수 있습니다: {args.journal}")
+
+    finally:
+        scraper.close()
+        journal.close()
+        scraper.metrics.stop_live()
+        scraper.metrics.write_json(args.metrics_json)
+
+
+if __name__ == "__main__":
+    main()
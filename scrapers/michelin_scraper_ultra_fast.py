@@ -1,9 +1,8 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import json
 import csv
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import re
 import os
 from pathlib import Path
@@ -15,14 +14,36 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import threading
-from queue import Queue
+from image_extraction import TieredImageResolver
+from http_cache import HttpCache, CachedResponse, load_previous_records, images_present
+from image_store import ImageStore
+from image_pipeline import ImageDownloadPipeline, StageCounter
+from browser_pool import BrowserPool
+from tab_sessions import TabPipeline
+from gallery_waits import GALLERY_IMAGE_SELECTOR, PhaseTimer, wait_for_gallery_button, wait_for_stable_count
+from browser_profile import BrowserTrafficStats, apply_lean_profile, configure_chrome_options, drain_traffic
+from page_parser import BACKEND_NAMES, DEFAULT_BACKEND, PageParser, detail_fields_from_soup, listing_urls_from_soup, max_page_from_soup, restaurant_info
+from crawl_journal import CrawlJournal, compact_journal
+from rate_limiter import HostRateLimiter, RetryPolicy, RateLimitedSession
+from regions import DEFAULT_REGION, resolve_start_url
+import argparse
+import logging
+from run_metrics import RunMetrics, configure_logging
+
+logger = logging.getLogger(__name__)
 
 class UltraFastMichelinScraper:
-    def __init__(self, max_workers=4, driver_pool_size=4):
+    def __init__(self, max_workers=4, driver_pool_size=4, scrape_images=True, min_static_images=1,
+                 http_cache=None, previous_records=None, dedup_images=True, image_workers=8,
+                 rate_limiter=None, listing_workers=4, parser_backend='html.parser', parse_processes=0,
+                 driver_max_pages=50, driver_max_rss_mb=1500, lean_browser=True, tab_sessions=False):
         self.base_url = "https://guide.michelin.com"
-        self.session = requests.Session()
+        # 모든 HTTP 요청은 호스트별 적응형 속도 제한기와 재시도 정책을 거침
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.retry_policy = RetryPolicy()
+        self.session = RateLimitedSession(requests.Session(), self.rate_limiter, self.retry_policy)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -32,30 +53,75 @@ class UltraFastMichelinScraper:
         
         # 워커 수 설정
         self.max_workers = max_workers
+        self.listing_workers = listing_workers
         self.driver_pool_size = driver_pool_size
+        self.scrape_images = scrape_images
+        
+        # 정적 HTML 결과가 min_static_images 개 미만일 때만 Selenium 사용
+        self.image_resolver = TieredImageResolver(min_static_images=min_static_images)
+        
+        # 조건부 요청 캐시와 --since 로 넘겨받은 이전 결과 (url → 레코드)
+        self.http_cache = http_cache
+        self.previous_records = previous_records or {}
+        self.carried_forward_urls = []
+        # source id / SHA-256 기반 이미지 저장소 (끄면 기존 {이름}_{번호} 파일명 사용)
+        self.image_store = ImageStore(self.images_dir) if dedup_images else None
+        
+        # 단계별 지연 시간/바이트/재시도 지표 (실행이 끝나면 JSON, 선택적으로 Prometheus 텍스트 파일)
+        self.metrics = RunMetrics()
+        
+        # 이미지 다운로드는 드라이버와 분리된 별도 워커 풀에서 처리
+        self.image_pipeline = ImageDownloadPipeline(
+            self.images_dir, headers=dict(self.session.headers),
+            image_store=self.image_store, workers=image_workers,
+            rate_limiter=self.rate_limiter, retry_policy=self.retry_policy, metrics=self.metrics
+        )
+        self.gallery_counter = StageCounter('gallery_urls')
+        self.metrics.register_source('retries', lambda: {'retries': self.retry_policy.retries,
+                                                         'requests': self.retry_policy.requests})
+        
+        # 목록/상세 페이지 파싱 (parse_processes > 0 이면 프로세스 풀에서 실행해 GIL 회피)
+        self.page_parser = PageParser(backend=parser_backend, processes=parse_processes)
+        
+        # 완료된 음식점/이미지를 한 줄씩 기록하는 크롤 저널 (main 에서 설정)
+        self.journal = None
+        
+        # 갤러리 URL만 읽으므로 기본은 이미지/폰트/트래커를 막은 경량 브라우저 프로필
+        self.lean_browser = lean_browser
+        self.browser_traffic = BrowserTrafficStats()
+        self.metrics.register_source('browser_traffic', lambda: {
+            profile: self.browser_traffic.per_page(profile) for profile in ('full', 'lean')
+        })
         
-        # Selenium 드라이버 풀
-        self.driver_pool = Queue(maxsize=driver_pool_size)
-        self.driver_lock = threading.Lock()
+        # Selenium 드라이버 풀 (상태 확인, N 페이지/메모리 초과 시 교체, 최대 driver_pool_size 개)
+        self.driver_path = None
+        self.driver_path_lock = threading.Lock()
+        self.driver_pool = BrowserPool(self._create_driver, size=driver_pool_size,
+                                       max_pages=driver_max_pages, max_rss_mb=driver_max_rss_mb)
+        self.metrics.register_source('browser_pool', self.driver_pool.snapshot)
         
-        # 드라이버 풀 초기화
-        self._initialize_driver_pool()
+        # 드라이버 풀 초기화 (이미지 수집을 끈 경우 Chrome을 띄우지 않음)
+        if self.scrape_images:
+            self._initialize_driver_pool()
+        
+        # 드라이버마다 탭 두 개를 번갈아 쓰며 다음 음식점 페이지를 미리 로드 (선택)
+        self.tab_pipeline = None
+        if self.scrape_images and tab_sessions:
+            self.tab_pipeline = TabPipeline(self.driver_pool, self._extract_gallery_urls, warm_url=self.base_url)
         
         print(f"🚀 울트라 빠른 스크래퍼 설정: {max_workers}개 워커, {driver_pool_size}개 드라이버 풀")
     
+    def attach_journal(self, journal):
+        """크롤 저널 연결: 이미 완료된 레코드를 불러오고 이미지 다운로드도 기록"""
+        self.journal = journal
+        self.image_pipeline.journal = journal
+        self.restaurants.extend(journal.completed_records())
+    
     def _initialize_driver_pool(self):
-        """Selenium 드라이버 풀 초기화"""
+        """Selenium 드라이버 풀 초기화 (드라이버를 병렬로 띄움)"""
         print("🔧 Selenium 드라이버 풀 초기화 중...")
-        
-        for i in range(self.driver_pool_size):
-            driver = self._create_driver()
-            if driver:
-                self.driver_pool.put(driver)
-                print(f"  ✅ 드라이버 {i+1}/{self.driver_pool_size} 초기화 완료")
-            else:
-                print(f"  ❌ 드라이버 {i+1}/{self.driver_pool_size} 초기화 실패")
-        
-        print(f"🎯 총 {self.driver_pool.qsize()}개 드라이버 풀 준비 완료")
+        ready = self.driver_pool.start()
+        print(f"🎯 총 {ready}개 드라이버 풀 준비 완료")
     
     def _create_driver(self):
         """새로운 Selenium 드라이버 생성"""
@@ -66,174 +132,205 @@ class UltraFastMichelinScraper:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        configure_chrome_options(chrome_options, lean=self.lean_browser)
         
         try:
-            service = Service(ChromeDriverManager().install())
+            # 병렬로 드라이버를 띄울 때 chromedriver 설치가 겹치지 않도록 경로는 한 번만 구함
+            with self.driver_path_lock:
+                if self.driver_path is None:
+                    self.driver_path = ChromeDriverManager().install()
+            service = Service(self.driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            if self.lean_browser:
+                apply_lean_profile(driver)
             return driver
         except Exception as e:
             print(f"❌ Selenium 드라이버 생성 실패: {e}")
             return None
     
     def _get_driver_from_pool(self):
-        """드라이버 풀에서 드라이버 가져오기"""
-        try:
-            driver = self.driver_pool.get(timeout=10)  # 10초 대기
-            return driver
-        except:
-            # 풀이 비어있으면 새로 생성
-            return self._create_driver()
+        """드라이버 풀에서 살아있는 드라이버 가져오기 (모두 사용 중이면 반납될 때까지 대기)"""
+        return self.driver_pool.checkout()
     
     def _return_driver_to_pool(self, driver):
-        """드라이버를 풀에 반환"""
-        if driver:
-            try:
-                self.driver_pool.put_nowait(driver)
-            except:
-                # 풀이 가득 차면 드라이버 종료
-                try:
-                    driver.quit()
-                except:
-                    pass
+        """드라이버를 풀에 반환 (한도를 넘은 드라이버는 풀이 교체)"""
+        self.driver_pool.checkin(driver)
     
-    def get_restaurant_urls(self, start_url):
-        """메인 페이지에서 모든 음식점 URL 수집"""
-        print("음식점 URL 수집 중...")
-        restaurant_urls = set()
-        page = 1
-        consecutive_empty_pages = 0
+    def _get_page(self, url):
+        """페이지 가져오기 (캐시가 있으면 조건부 요청, 304 면 저장된 본문 재사용)"""
+        if self.http_cache:
+            return self.http_cache.fetch(self.session, url)
+        response = self.session.get(url)
+        response.raise_for_status()
+        return CachedResponse(url, response.content, response.status_code, changed=True)
+    
+    def _carry_forward(self, url, page):
+        """변경되지 않은 페이지면 이전 실행의 레코드를 그대로 반환"""
+        if page.changed:
+            return None
+        previous = self.previous_records.get(url)
+        if previous and images_present(previous):
+            self.carried_forward_urls.append(url)
+            logger.info(f"  ♻️ 변경 없음, 이전 결과 재사용: {previous['name']}")
+            return previous
+        return None
+    
+    def _page_url(self, start_url, page):
+        """시작 URL을 기준으로 목록 페이지 URL 생성"""
+        if page == 1:
+            return start_url
+        parsed = urlparse(start_url)
+        path = re.sub(r'/page/\d+/?$', '', parsed.path.rstrip('/'))
+        page_url = parsed._replace(path=f"{path}/page/{page}").geturl()
+        return page_url
+    
+    def extract_listing_urls(self, soup):
+        """목록 페이지에서 음식점 상세 URL 추출 (페이지 내 순서 유지)"""
+        return listing_urls_from_soup(soup, self.base_url)
+    
+    def parse_max_page(self, soup):
+        """페이지네이션에서 최대 페이지 번호 추출 (없으면 0)"""
+        return max_page_from_soup(soup)
+    
+    def _fetch_listing_page(self, start_url, page):
+        """목록 페이지 하나를 가져와 (상세 URL 목록, 최대 페이지) 반환"""
+        url = self._page_url(start_url, page)
+        logger.info(f"페이지 {page} 처리 중: {url}")
+        with self.metrics.timed('listing_fetch'):
+            response = self._get_page(url)
+        if response.changed:
+            self.metrics.add_bytes('listing_fetch', len(response.content))
+        page_urls, max_page = self.page_parser.parse_listing(response.content, self.base_url)
+        logger.debug(f"카드에서 추출한 제목 링크: {len(page_urls)}개")
+        return page_urls, max_page
+    
+    def iter_restaurant_urls(self, start_url):
+        """
+        음식점 URL을 찾는 대로 하나씩 내보내는 제너레이터
+        1페이지에서 최대 페이지 번호를 알면 나머지 페이지는 동시에 가져오고
+        결과는 페이지 순서대로 합칩니다. 상세 수집은 목록 수집이 끝나기 전에 시작할 수 있습니다.
+        """
+        seen_urls = set()
         
-        while consecutive_empty_pages < 2:
-            try:
-                if page == 1:
-                    url = start_url
-                else:
-                    url = f"https://guide.michelin.com/kr/ko/seoul-capital-area/kr-seoul/restaurants/page/{page}?sort=distance"
-                    
-                print(f"페이지 {page} 처리 중: {url}")
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 음식점 카드 찾기
-                restaurant_cards = soup.select('.js-restaurant__list_item')
-                print(f"선택자 '.js-restaurant__list_item'로 {len(restaurant_cards)}개 카드 발견")
-                
-                restaurant_links = []
-                for card in restaurant_cards:
-                    title_link = card.select_one('.card__menu-content--title a[href*="/restaurant/"]')
-                    if title_link:
-                        restaurant_links.append(title_link)
-                
-                print(f"카드에서 추출한 제목 링크: {len(restaurant_links)}개")
-                
-                if not restaurant_links:
-                    consecutive_empty_pages += 1
-                    print(f"페이지 {page}에서 음식점을 찾을 수 없습니다. (연속 빈 페이지: {consecutive_empty_pages})")
-                    page += 1
-                    continue
-                
-                consecutive_empty_pages = 0
-                page_urls = []
-                
-                for link in restaurant_links:
-                    href = link.get('href')
-                    if href and '/restaurant/' in href:
-                        full_url = urljoin(self.base_url, href)
-                        if full_url not in restaurant_urls:
-                            restaurant_urls.add(full_url)
-                            page_urls.append(full_url)
-                
-                print(f"페이지 {page}에서 {len(page_urls)}개 레스토랑 발견")
-                
-                # 페이지네이션 확인
-                pagination = soup.find('nav', {'aria-label': 'pagination'}) or soup.find('div', class_=re.compile(r'pagination'))
-                if pagination:
-                    all_page_links = pagination.find_all('a')
-                    max_page_num = 0
-                    for link in all_page_links:
+        def fresh_urls(page, page_urls):
+            new_urls = [url for url in page_urls if url not in seen_urls]
+            seen_urls.update(new_urls)
+            logger.info(f"페이지 {page}에서 {len(new_urls)}개 레스토랑 발견")
+            return new_urls
+        
+        try:
+            first_urls, max_page = self._fetch_listing_page(start_url, 1)
+        except Exception as e:
+            logger.warning(f"페이지 1 처리 중 오류: {e}")
+            first_urls, max_page = [], 0
+        yield from fresh_urls(1, first_urls)
+        
+        if max_page > 1:
+            # 페이지네이션이 일부만 보이는 경우를 대비해 뒤 페이지에서 더 큰 번호가 나오면 계속 확장
+            next_page = 2
+            with ThreadPoolExecutor(max_workers=self.listing_workers) as executor:
+                while next_page <= max_page:
+                    pages = range(next_page, max_page + 1)
+                    futures = [executor.submit(self._fetch_listing_page, start_url, page) for page in pages]
+                    next_page = max_page + 1
+                    for page, future in zip(pages, futures):
                         try:
-                            page_num = int(link.get_text(strip=True))
-                            max_page_num = max(max_page_num, page_num)
-                        except ValueError:
+                            page_urls, page_max = future.result()
+                        except Exception as e:
+                            logger.warning(f"페이지 {page} 처리 중 오류: {e}")
                             continue
-                    
-                    if max_page_num > 0 and page >= max_page_num:
-                        print(f"페이지네이션에서 최대 페이지 {max_page_num}에 도달했습니다.")
-                        break
-                
-                page += 1
-                time.sleep(0.3)  # 요청 간격 더 단축
-                
+                        max_page = max(max_page, page_max)
+                        yield from fresh_urls(page, page_urls)
+            print(f"페이지네이션에서 최대 페이지 {max_page}에 도달했습니다.")
+            return
+        
+        # 페이지네이션이 없으면 연속 빈 페이지 2개가 나올 때까지 순차 탐색
+        page = 2
+        consecutive_empty_pages = 0 if first_urls else 1
+        while consecutive_empty_pages < 2:
+            try:
+                page_urls, _ = self._fetch_listing_page(start_url, page)
             except Exception as e:
-                print(f"페이지 {page} 처리 중 오류: {e}")
+                logger.warning(f"페이지 {page} 처리 중 오류: {e}")
+                page_urls = []
+            if page_urls:
+                consecutive_empty_pages = 0
+                yield from fresh_urls(page, page_urls)
+            else:
                 consecutive_empty_pages += 1
-                page += 1
-                if consecutive_empty_pages >= 2:
-                    break
-        
-        restaurant_urls_list = list(restaurant_urls)
+                logger.info(f"페이지 {page}에서 음식점을 찾을 수 없습니다. (연속 빈 페이지: {consecutive_empty_pages})")
+            page += 1
+    
+    def get_restaurant_urls(self, start_url):
+        """메인 페이지에서 모든 음식점 URL 수집"""
+        print("음식점 URL 수집 중...")
+        restaurant_urls_list = list(self.iter_restaurant_urls(start_url))
         print(f"총 {len(restaurant_urls_list)}개 음식점 URL 수집 완료")
         return restaurant_urls_list
     
-    def scrape_images_with_selenium_pool(self, url, restaurant_name):
-        """드라이버 풀을 사용해서 이미지 수집"""
-        driver = self._get_driver_from_pool()
+    def extract_gallery_urls_with_selenium_pool(self, url, restaurant_name, timings=None):
+        """드라이버 풀을 사용해서 갤러리 이미지 URL 추출 (추출이 끝나면 드라이버 반환, 단계별 시간은 timings 에 기록)"""
+        if self.tab_pipeline:
+            # 드라이버별 워커가 탭을 재사용하고 다음 음식점을 미리 로드
+            return self.tab_pipeline.extract_gallery_urls(url, restaurant_name, timings)
+        
+        timer = PhaseTimer(timings)
+        with timer.phase('driver_checkout'):
+            driver = self._get_driver_from_pool()
         if not driver:
             return []
         
         try:
-            print(f"    🌐 Selenium으로 {restaurant_name} 페이지 로드 중...")
-            driver.get(url)
-            
-            # 페이지 로드 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # 갤러리 버튼 찾기 및 클릭
-            gallery_selectors = [
-                "button.masthead__gallery-open.js-gallery-button",
-                "button[data-target='#js-gallery-masthead']",
-                "button[data-target='#js-modal-gallery']",
-                ".js-modal-gallery-trigger",
-                "button[aria-label*='gallery']",
-                "button[aria-label*='Gallery']",
-                ".gallery-trigger",
-                ".image-gallery-trigger"
-            ]
+            return self._extract_gallery_urls(driver, url, restaurant_name, timings,
+                                              lambda: self._load_gallery_page(driver, url))
+        finally:
+            # 드라이버를 풀에 반환
+            self._return_driver_to_pool(driver)
+    
+    def _load_gallery_page(self, driver, url):
+        """현재 탭에서 페이지 로드 (탭 세션을 쓰지 않을 때)"""
+        driver.get(url)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+    
+    def _extract_gallery_urls(self, driver, url, restaurant_name, timings, load_page):
+        """load_page() 로 페이지를 띄운 뒤 갤러리 모달을 열어 이미지 URL 추출"""
+        timer = PhaseTimer(timings)
+        drain_traffic(driver)  # 이전 페이지의 네트워크 로그 비우기
+        page_started = time.perf_counter()
+        try:
+            logger.debug(f"    🌐 Selenium으로 {restaurant_name} 페이지 로드 중...")
+            with timer.phase('browser_load'):
+                load_page()
             
-            gallery_button = None
-            for selector in gallery_selectors:
-                try:
-                    gallery_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    print(f"    ✅ 갤러리 버튼 발견: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+            # 갤러리 버튼: 모든 선택자를 한 번의 대기로 확인 (없는 페이지도 최대 5초)
+            with timer.phase('gallery_button'):
+                selector, gallery_button = wait_for_gallery_button(driver)
             
             if gallery_button:
+                logger.debug(f"    ✅ 갤러리 버튼 발견: {selector}")
                 driver.execute_script("arguments[0].click();", gallery_button)
-                print(f"    🖼️ 갤러리 모달 열기 시도...")
                 
                 try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".modal__gallery-image"))
-                    )
-                    print(f"    ✅ 갤러리 모달 열림 확인")
-                    time.sleep(1.5)  # 이미지 로드 대기 단축
+                    with timer.phase('modal_open'):
+                        WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, ".modal__gallery-image"))
+                        )
+                    # 고정 대기 대신 이미지 수가 안정될 때까지만 대기
+                    with timer.phase('image_stabilize'):
+                        wait_for_stable_count(driver)
                 except TimeoutException:
-                    print(f"    ⚠️ 갤러리 모달 열기 실패, 기본 이미지만 수집")
+                    logger.debug(f"    ⚠️ 갤러리 모달 열기 실패, 기본 이미지만 수집")
+            else:
+                logger.debug(f"    ⚠️ 갤러리 버튼을 찾을 수 없음, 기본 이미지만 수집")
             
             # 이미지 URL 추출
             image_urls = []
             processed_urls = set()
             
-            ci_images = driver.find_elements(By.CSS_SELECTOR, "img[ci-src]")
-            print(f"    📸 ci-src 속성이 있는 이미지: {len(ci_images)}개")
+            ci_images = driver.find_elements(By.CSS_SELECTOR, GALLERY_IMAGE_SELECTOR)
+            logger.debug(f"    📸 ci-src 속성이 있는 이미지: {len(ci_images)}개")
             
             for img in ci_images:
                 try:
@@ -251,146 +348,108 @@ class UltraFastMichelinScraper:
                             if 'cloudimg.io' in original_url:
                                 image_urls.append(original_url)
                                 processed_urls.add(original_url)
-                                print(f"      ✓ 이미지 발견: {original_url[:60]}...")
+                                logger.debug("      ✓ 이미지 발견: %s...", original_url[:60])
                 except Exception as e:
                     continue
             
-            print(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출 (Selenium)")
-            
-            # 이미지 다운로드
-            downloaded_images = []
-            for i, image_url in enumerate(image_urls, 1):
-                filepath = self.download_image(image_url, restaurant_name, i)
-                if filepath:
-                    downloaded_images.append({
-                        'url': image_url,
-                        'local_path': filepath,
-                        'filename': os.path.basename(filepath)
-                    })
-            
-            return downloaded_images
+            logger.debug(f"    📸 총 {len(image_urls)}개 고유 이미지 URL 추출 (Selenium)")
+            return image_urls
             
         except Exception as e:
-            print(f"    ❌ Selenium 이미지 수집 실패: {e}")
+            logger.warning(f"    ❌ Selenium 이미지 수집 실패: {e}")
             return []
         finally:
-            # 드라이버를 풀에 반환
-            self._return_driver_to_pool(driver)
+            self.browser_traffic.record('lean' if self.lean_browser else 'full',
+                                        time.perf_counter() - page_started, drain_traffic(driver))
+    
+    def download_images(self, image_urls, restaurant_name):
+        """이미지 다운로드 단계에 URL 목록을 넘기고 images 레코드 목록 반환"""
+        downloaded_images = self.image_pipeline.download_all(image_urls, restaurant_name)
+        logger.info(f"  ✓ {restaurant_name}: 이미지 {len(downloaded_images)}/{len(image_urls)}개 저장")
+        return downloaded_images
+    
+    def scrape_images_with_selenium_pool(self, url, restaurant_name):
+        """드라이버 풀을 사용해서 이미지 수집 및 다운로드"""
+        image_urls = self.extract_gallery_urls_with_selenium_pool(url, restaurant_name)
+        return self.download_images(image_urls, restaurant_name)
+    
+    def collect_images(self, url, restaurant_name, soup=None, static_urls=None, timings=None, expected_count=0):
+        """정적 HTML 우선, 부족할 때만 Selenium 으로 이미지 수집 후 다운로드"""
+        timer = PhaseTimer(timings)
+        browser_fetch = None
+        if self.driver_pool_size > 0:
+            browser_fetch = lambda: self.extract_gallery_urls_with_selenium_pool(url, restaurant_name, timer.timings)
+        
+        started = time.perf_counter()
+        with timer.phase('gallery_urls'):
+            image_urls, tier = self.image_resolver.resolve(soup, browser_fetch, expected_count=expected_count,
+                                                           static_urls=static_urls)
+        self.gallery_counter.record(started, ok=bool(image_urls))
+        logger.debug(f"    📸 {restaurant_name}: {len(image_urls)}개 이미지 URL ({tier})")
+        with timer.phase('image_download'):
+            return self.download_images(image_urls, restaurant_name)
     
     def download_image(self, image_url, restaurant_name, image_index):
-        """이미지 다운로드 및 저장"""
-        try:
-            safe_name = re.sub(r'[^\w\-_\.]', '_', restaurant_name)
-            safe_name = safe_name[:50]
-            
-            parsed_url = urlparse(image_url)
-            file_extension = os.path.splitext(parsed_url.path)[1]
-            if not file_extension:
-                file_extension = '.jpg'
-            
-            filename = f"{safe_name}_{image_index:02d}{file_extension}"
-            filepath = self.images_dir / filename
-            
-            # 이미지 다운로드
-            response = self.session.get(image_url, timeout=20)  # 타임아웃 단축
-            response.raise_for_status()
-            
-            # 파일 저장
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"  ✓ 이미지 저장: {filename}")
-            return str(filepath)
-            
-        except Exception as e:
-            print(f"  ❌ 이미지 다운로드 실패: {e}")
-            return None
+        """이미지 다운로드 및 저장 (청크 스트리밍)"""
+        filepath = self.image_pipeline.download(image_url, restaurant_name, image_index)
+        if filepath:
+            logger.debug("  ✓ 이미지 저장: %s", os.path.basename(filepath))
+        return filepath
+    
+    def parse_restaurant_info(self, soup):
+        """상세 페이지 soup에서 이름/주소/가격/카테고리/등급 추출"""
+        return restaurant_info(**detail_fields_from_soup(soup))
+    
+    def build_restaurant_data(self, info, url, images, timings=None):
+        """저장 스키마에 맞춰 음식점 레코드 생성 (timings 가 있으면 단계별 소요 시간 포함)"""
+        restaurant_data = {
+            'name': info['name'],
+            'address': info['address'],
+            'price': info['price'],
+            'category': info['category'],
+            'rating': info['rating'],
+            'url': url,
+            'images': images,
+            'image_count': len(images)
+        }
+        if timings:
+            restaurant_data['timings'] = timings
+        return restaurant_data
     
     def scrape_restaurant_detail(self, url):
         """개별 음식점 상세 정보 스크래핑"""
+        timer = PhaseTimer()
         try:
-            response = self.session.get(url)  
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 음식점 이름
-            name_element = soup.find('h1', class_='data-sheet__title')
-            name = name_element.get_text(strip=True) if name_element else "정보 없음"
-            
-            # 주소
-            address = "정보 없음"
-            data_blocks = soup.find_all('div', class_='data-sheet__block--text')
-            for block in data_blocks:
-                text = block.get_text(strip=True)
-                if text and not text.startswith('₩') and not text.startswith('·') and len(text) > 5:
-                    address = text
-                    break
-            
-            # 가격대와 카테고리
-            price = "정보 없음"
-            category = "정보 없음"
-            for block in data_blocks:
-                text = block.get_text(strip=True)
-                if '₩' in text and '·' in text:
-                    parts = text.split('·')
-                    if len(parts) >= 2:
-                        price_raw = parts[0].strip()
-                        category = parts[1].strip()
-                        
-                        if price_raw == '₩':
-                            price = '₩ (저렴)'
-                        elif price_raw == '₩₩':
-                            price = '₩₩ (보통)'
-                        elif price_raw == '₩₩₩':
-                            price = '₩₩₩ (다소 고가)'
-                        elif price_raw == '₩₩₩₩':
-                            price = '₩₩₩₩ (고가)'
-                        else:
-                            price = price_raw
-                    break
-            
-            # 미슐랭 등급
-            rating_parts = []
-            classification_items = soup.find_all('div', class_='data-sheet__classification-item')
-            for item in classification_items:
-                content_divs = item.find_all('div', class_='data-sheet__classification-item--content')
-                for content_div in content_divs:
-                    text = content_div.get_text(strip=True)
-                    if '한 개의 별' in text and '1 Star' not in rating_parts:
-                        rating_parts.append('1 Star')
-                    elif '두 개의 별' in text and '2 Stars' not in rating_parts:
-                        rating_parts.append('2 Stars')
-                    elif '세 개의 별' in text and '3 Stars' not in rating_parts:
-                        rating_parts.append('3 Stars')
-                    elif '빕 구르망' in text and 'Bib Gourmand' not in rating_parts:
-                        rating_parts.append('Bib Gourmand')
-                    elif text == 'New' and 'New' not in rating_parts:
-                        rating_parts.append('New')
-                    elif '스몰 숍' in text and 'Small Shop' not in rating_parts:
-                        rating_parts.append('Small Shop')
-            
-            rating = ', '.join(rating_parts) if rating_parts else "0 Star, 추천 레스토랑"
-            
-            # 이미지 스크래핑 (드라이버 풀 사용)
-            print(f"  🖼️ {name} 이미지 수집 중...")
-            images = self.scrape_images_with_selenium_pool(url, name)
-            
-            restaurant_data = {
-                'name': name,
-                'address': address,
-                'price': price,
-                'category': category,
-                'rating': rating,
-                'url': url,
-                'images': images,
-                'image_count': len(images)
-            }
-            
-            return restaurant_data
+            with timer.phase('detail_fetch'):
+                response = self._get_page(url)
+            if response.changed:
+                self.metrics.add_bytes('detail_fetch', len(response.content))
+            
+            # 304 이고 이전 결과가 있으면 파싱/이미지 수집 생략
+            previous = self._carry_forward(url, response)
+            if previous:
+                self.metrics.observe_timings(timer.timings)
+                self.metrics.increment('carried_forward')
+                return previous
+            
+            with timer.phase('parse'):
+                parsed = self.page_parser.parse_detail(response.content)
+            info = parsed['info']
+            
+            # 이미지 스크래핑 (정적 HTML → 드라이버 풀 순)
+            images = []
+            if self.scrape_images:
+                logger.debug(f"  🖼️ {info['name']} 이미지 수집 중...")
+                images = self.collect_images(url, info['name'], static_urls=parsed['gallery_urls'],
+                                             timings=timer.timings, expected_count=parsed['gallery_count'])
+            
+            self.metrics.observe_timings(timer.timings)
+            self.metrics.increment('restaurants_ok')
+            return self.build_restaurant_data(info, url, images, timer.timings)
             
         except Exception as e:
-            print(f"URL {url} 처리 중 오류: {e}")
+            logger.warning(f"URL {url} 처리 중 오류: {e}")
+            self.metrics.increment('restaurants_failed')
             return None
     
     def save_to_json(self, filename='michelin_restaurants_ultra.json'):
@@ -431,66 +490,128 @@ def scrape_single_restaurant_ultra(args):
     url, scraper_instance = args
     
     try:
-        print(f"🔄 {url} 처리 중...")
+        logger.debug(f"🔄 {url} 처리 중...")
         restaurant_data = scraper_instance.scrape_restaurant_detail(url)
         
         if restaurant_data:
-            print(f"✓ {restaurant_data['name']} 수집 완료 (이미지 {restaurant_data.get('image_count', 0)}개)")
+            logger.info(f"✓ {restaurant_data['name']} 수집 완료 (이미지 {restaurant_data.get('image_count', 0)}개)")
             return restaurant_data
         else:
-            print(f"❌ {url} 수집 실패")
+            logger.warning(f"❌ {url} 수집 실패")
             return None
             
     except Exception as e:
-        print(f"❌ {url} 처리 중 오류: {e}")
+        logger.warning(f"❌ {url} 처리 중 오류: {e}")
         return None
 
+def scrape_restaurants_continuously(scraper, restaurant_urls):
+    """
+    오래 유지되는 워커 풀에 URL을 계속 채워 넣으면서 상세 정보 수집
+    배치 경계 없이 끝나는 대로 결과를 모으므로 느린 음식점 하나가 다른 워커를 붙잡지 않습니다.
+    (성공 수, 실패 수) 반환
+    """
+    max_in_flight = scraper.max_workers * 2
+    total = len(restaurant_urls) if hasattr(restaurant_urls, '__len__') else '?'
+    url_iter = iter(restaurant_urls)
+    successful_count = 0
+    failed_count = 0
+    in_flight = {}
+    
+    with ThreadPoolExecutor(max_workers=scraper.max_workers) as executor:
+        def refill():
+            # 대기 작업이 워커 수의 2배를 넘지 않도록 유지
+            while len(in_flight) < max_in_flight:
+                url = next(url_iter, None)
+                if url is None:
+                    return
+                in_flight[executor.submit(scrape_single_restaurant_ultra, (url, scraper))] = url
+        
+        refill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.pop(future)
+                result = future.result()
+                if result:
+                    scraper.restaurants.append(result)
+                    if scraper.journal:
+                        scraper.journal.record_restaurant(result)
+                    successful_count += 1
+                else:
+                    failed_count += 1
+                
+                completed = successful_count + failed_count
+                if completed % 10 == 0:
+                    print(f"📊 진행 상황: {completed}/{total} (성공: {successful_count}, 실패: {failed_count}, 진행 중: {len(in_flight)})")
+            refill()
+    
+    return successful_count, failed_count
+
 def main():
+    parser = argparse.ArgumentParser(description="울트라 빠른 미슐랭 스크래퍼")
+    parser.add_argument('--since', nargs='?', const='michelin_restaurants_ultra.json', default=None,
+                        help="이전 결과 JSON 에서 변경 없는(304) 음식점 레코드를 그대로 가져옴")
+    parser.add_argument('--cache-dir', default='.http_cache', help="HTTP 캐시 디렉토리")
+    parser.add_argument('--no-cache', action='store_true', help="조건부 요청 캐시 사용 안 함")
+    parser.add_argument('--legacy-image-names', action='store_true',
+                        help="이미지 저장소 대신 {이름}_{번호} 파일명으로 매번 다운로드")
+    parser.add_argument('--image-workers', type=int, default=8, help="이미지 다운로드 워커 수")
+    parser.add_argument('--journal', default='crawl_journal_ultra.jsonl', help="크롤 저널 경로")
+    parser.add_argument('--resume', action='store_true', help="저널에 기록된 음식점은 건너뛰고 이어서 수집")
+    parser.add_argument('--region', default=DEFAULT_REGION, help="regions.json 에 정의된 리전 이름")
+    parser.add_argument('--start-url', default=None, help="리전 대신 직접 지정할 시작 URL")
+    parser.add_argument('--parser', default=DEFAULT_BACKEND, choices=BACKEND_NAMES, help="HTML 파서 백엔드")
+    parser.add_argument('--parse-processes', type=int, default=2, help="파싱 프로세스 수 (0 이면 워커 스레드에서 파싱)")
+    parser.add_argument('--driver-max-pages', type=int, default=50, help="드라이버당 처리 페이지 수 한도 (넘으면 교체)")
+    parser.add_argument('--driver-max-rss-mb', type=int, default=1500, help="Chrome 프로세스 트리 메모리 한도 (MB)")
+    parser.add_argument('--full-browser', action='store_true', help="경량 프로필 없이 모든 리소스를 로드")
+    parser.add_argument('--tab-sessions', action='store_true',
+                        help="드라이버별 탭 재사용 + 다음 음식점 미리 로드 (워커 수를 드라이버 수의 2배로)")
+    parser.add_argument('--metrics-json', default='run_metrics_ultra.json', help="실행 지표 JSON 경로")
+    parser.add_argument('--metrics-prom', default=None, help="실행 중 주기적으로 갱신할 Prometheus 텍스트 파일 경로")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help="로그 레벨 (DEBUG 면 이미지 단위 로그까지 출력)")
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+    
+    http_cache = None if args.no_cache else HttpCache(args.cache_dir)
+    previous_records = load_previous_records(args.since) if args.since else {}
+    if args.since:
+        print(f"♻️ 이전 결과 {len(previous_records)}개 로드: {args.since}")
+    
     # 울트라 빠른 스크래퍼 초기화
-    scraper = UltraFastMichelinScraper(max_workers=4, driver_pool_size=4)
+    # 탭 세션은 대기 중인 다음 작업이 있어야 미리 로드할 수 있으므로 워커를 드라이버보다 많이 둠
+    driver_pool_size = 4
+    max_workers = driver_pool_size * 2 if args.tab_sessions else 4
+    scraper = UltraFastMichelinScraper(max_workers=max_workers, driver_pool_size=driver_pool_size,
+                                       http_cache=http_cache, previous_records=previous_records,
+                                       dedup_images=not args.legacy_image_names,
+                                       image_workers=args.image_workers,
+                                       parser_backend=args.parser, parse_processes=args.parse_processes,
+                                       driver_max_pages=args.driver_max_pages,
+                                       driver_max_rss_mb=args.driver_max_rss_mb,
+                                       lean_browser=not args.full_browser,
+                                       tab_sessions=args.tab_sessions)
+    
+    journal = CrawlJournal(args.journal, resume=args.resume)
+    scraper.attach_journal(journal)
+    if args.resume:
+        print(f"📒 저널에서 {len(journal.restaurants)}개 음식점, {len(journal.images)}개 이미지 복원")
     
-    # 시작 URL
-    start_url = "https://guide.michelin.com/kr/ko/seoul-capital-area/kr-seoul/restaurants?sort=distance"
+    # 시작 URL (리전 매니페스트 또는 --start-url)
+    start_url = resolve_start_url(args.region, args.start_url)
+    if args.metrics_prom:
+        scraper.metrics.start_live(args.metrics_prom)
     
     try:
-        # 1단계: 음식점 URL들 수집
-        restaurant_urls = scraper.get_restaurant_urls(start_url)
-        
-        # 2단계: 멀티스레딩으로 상세 정보 수집
-        print(f"\n상세 정보 수집 시작... (울트라 빠른 멀티스레딩: {scraper.max_workers}개 워커)")
+        # 목록 수집과 상세 수집을 겹쳐서 진행: 찾는 대로 작업 큐에 투입 (저널에 있는 URL 제외)
+        print(f"\n음식점 URL 수집 + 상세 정보 수집 시작... (울트라 빠른 멀티스레딩: {scraper.max_workers}개 워커)")
+        restaurant_urls = (url for url in scraper.iter_restaurant_urls(start_url) if not journal.is_completed(url))
         
         start_time = time.time()
         
-        # 배치로 처리
-        batch_size = scraper.max_workers * 2
-        successful_count = 0
-        failed_count = 0
-        
-        for i in range(0, len(restaurant_urls), batch_size):
-            batch_urls = restaurant_urls[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(restaurant_urls) + batch_size - 1) // batch_size
-            
-            print(f"\n📦 배치 {batch_num}/{total_batches} 처리 중... ({len(batch_urls)}개)")
-            
-            # 멀티스레딩으로 배치 처리
-            with ThreadPoolExecutor(max_workers=scraper.max_workers) as executor:
-                args = [(url, scraper) for url in batch_urls]
-                results = list(executor.map(scrape_single_restaurant_ultra, args))
-            
-            # 결과 처리
-            for result in results:
-                if result:
-                    scraper.restaurants.append(result)
-                    successful_count += 1
-                else:
-                    failed_count += 1
-            
-            print(f"📊 배치 {batch_num} 완료: 성공 {len([r for r in results if r])}개")
-            
-            # 배치 간 대기
-            if i + batch_size < len(restaurant_urls):
-                time.sleep(0.5)  # 대기 시간 단축
+        # 연속 작업 큐로 처리
+        successful_count, failed_count = scrape_restaurants_continuously(scraper, restaurant_urls)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -500,10 +621,11 @@ def main():
         print(f"📊 총 음식점: {len(scraper.restaurants)}개")
         print(f"✅ 성공: {successful_count}개")
         print(f"❌ 실패: {failed_count}개")
-        print(f"⚡ 평균 처리 시간: {elapsed_time/len(restaurant_urls):.2f}초/개")
+        print(f"⚡ 평균 처리 시간: {elapsed_time/max(successful_count + failed_count, 1):.2f}초/개")
         
-        # 파일로 저장
-        scraper.save_to_json()
+        # 저널 정리 → 최종 JSON, CSV 저장
+        journal.close()
+        compact_journal(args.journal, 'michelin_restaurants_ultra.json')
         scraper.save_to_csv()
         
         # 최종 통계
@@ -512,6 +634,22 @@ def main():
         print(f"📊 총 음식점: {len(scraper.restaurants)}개")
         print(f"🖼️ 총 이미지: {total_images}개")
         print(f"📁 이미지 저장 위치: {scraper.images_dir.absolute()}")
+        scraper.image_resolver.print_summary()
+        if scraper.http_cache:
+            scraper.http_cache.print_summary()
+        print(f"♻️ 이전 결과 재사용: {len(scraper.carried_forward_urls)}개")
+        scraper.rate_limiter.print_summary()
+        print(f"🔁 재시도: {scraper.retry_policy.retries}회 / 요청 {scraper.retry_policy.requests}개")
+        if scraper.image_store:
+            scraper.image_store.print_summary()
+        scraper.page_parser.counter.print_summary()
+        scraper.driver_pool.print_summary()
+        scraper.browser_traffic.print_summary()
+        if scraper.tab_pipeline:
+            scraper.tab_pipeline.print_summary()
+        scraper.gallery_counter.print_summary()
+        scraper.image_pipeline.counter.print_summary()
+        scraper.metrics.print_summary()
         
     except KeyboardInterrupt:
         print("\n\n스크래핑이 중단되었습니다.")
@@ -521,16 +659,20 @@ def main():
         if scraper.restaurants:
             scraper.save_to_json('michelin_restaurants_ultra_partial.json')
             scraper.save_to_csv('michelin_restaurants_ultra_partial.csv')
+        print(f"📒 --resume 으로 이어서 수집할 수 있습니다: {args.journal}")
     
     finally:
+        scraper.image_pipeline.close()
+        scraper.page_parser.close()
+        journal.close()
+        scraper.metrics.stop_live()
+        scraper.metrics.write_json(args.metrics_json)
+        
         # 드라이버 풀 정리
         print("🧹 드라이버 풀 정리 중...")
-        while not scraper.driver_pool.empty():
-            try:
-                driver = scraper.driver_pool.get_nowait()
-                driver.quit()
-            except:
-                pass
+        if scraper.tab_pipeline:
+            scraper.tab_pipeline.close()
+        scraper.driver_pool.close()
         print("✅ 드라이버 풀 정리 완료")
 
 if __name__ == "__main__":
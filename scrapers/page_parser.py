@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+목록/상세 페이지 파싱 단계
+스레드 안에서 BeautifulSoup(html.parser) 로 파싱하면 순수 파이썬 코드가 GIL 을 잡고 있어
+워커 스레드가 사실상 순서대로 돌게 됩니다. 여기서는
+- 스크래퍼가 읽는 필드(이름/주소/가격/카테고리/등급, 정적 갤러리 URL, 목록 URL/최대 페이지)만 뽑는
+  파서 백엔드 3종(html.parser, lxml, selectolax)을 제공하고
+- PageParser 로 파싱을 프로세스 풀에 넘겨 GIL 밖에서 실행합니다.
+결과는 dict/list 라서 프로세스 사이에 그대로 전달됩니다.
+"""
+
+import asyncio
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from image_extraction import (expected_gallery_count, extract_static_gallery_urls, filter_gallery_candidates,
+                              gallery_count_hint, json_ld_image_urls)
+from image_pipeline import StageCounter
+
+try:
+    import lxml.html
+except ImportError:  # lxml 이 없으면 html.parser 만 사용
+    lxml = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+BACKEND_NAMES = ('html.parser', 'lxml', 'selectolax')
+# CLI 기본 백엔드: lxml 이 설치되어 있으면 lxml, 없으면 html.parser (설치 안 된 기본값으로 죽지 않도록)
+DEFAULT_BACKEND = 'lxml' if lxml is not None else 'html.parser'
+
+PRICE_LABELS = {
+    '₩': '₩ (저렴)',
+    '₩₩': '₩₩ (보통)',
+    '₩₩₩': '₩₩₩ (다소 고가)',
+    '₩₩₩₩': '₩₩₩₩ (고가)',
+}
+
+# (키워드, 등급, 정확히 일치해야 하는지) - 위에서부터 처음 맞는 규칙 하나만 적용
+RATING_RULES = [
+    ('한 개의 별', '1 Star', False),
+    ('두 개의 별', '2 Stars', False),
+    ('세 개의 별', '3 Stars', False),
+    ('빕 구르망', 'Bib Gourmand', False),
+    ('New', 'New', True),
+    ('스몰 숍', 'Small Shop', False),
+]
+
+
+def restaurant_info(title, block_texts, classification_texts):
+    """파서가 뽑은 텍스트로 이름/주소/가격/카테고리/등급 결정 (parse_restaurant_info 와 같은 규칙)"""
+    name = title if title is not None else "정보 없음"
+
+    address = "정보 없음"
+    for text in block_texts:
+        if text and not text.startswith('₩') and not text.startswith('·') and len(text) > 5:
+            address = text
+            break
+
+    price = "정보 없음"
+    category = "정보 없음"
+    for text in block_texts:
+        if '₩' in text and '·' in text:
+            parts = text.split('·')
+            if len(parts) >= 2:
+                price_raw = parts[0].strip()
+                category = parts[1].strip()
+                price = PRICE_LABELS.get(price_raw, price_raw)
+            break
+
+    rating_parts = []
+    for text in classification_texts:
+        for keyword, label, exact in RATING_RULES:
+            matched = text == keyword if exact else keyword in text
+            if matched and label not in rating_parts:
+                rating_parts.append(label)
+                break
+
+    return {
+        'name': name,
+        'address': address,
+        'price': price,
+        'category': category,
+        'rating': ', '.join(rating_parts) if rating_parts else "0 Star, 추천 레스토랑"
+    }
+
+
+def _max_page_number(link_texts):
+    max_page_num = 0
+    for text in link_texts:
+        try:
+            max_page_num = max(max_page_num, int(text))
+        except ValueError:
+            continue
+    return max_page_num
+
+
+# ---------------------------------------------------------------- html.parser (BeautifulSoup)
+
+def detail_fields_from_soup(soup):
+    """BeautifulSoup 상세 페이지 → restaurant_info 입력값"""
+    name_element = soup.find('h1', class_='data-sheet__title')
+    return {
+        'title': name_element.get_text(strip=True) if name_element else None,
+        'block_texts': [block.get_text(strip=True) for block in soup.find_all('div', class_='data-sheet__block--text')],
+        'classification_texts': [
+            content_div.get_text(strip=True)
+            for item in soup.find_all('div', class_='data-sheet__classification-item')
+            for content_div in item.find_all('div', class_='data-sheet__classification-item--content')
+        ]
+    }
+
+
+def listing_urls_from_soup(soup, base_url):
+    """BeautifulSoup 목록 페이지 → 음식점 상세 URL 목록 (페이지 내 순서 유지)"""
+    page_urls = []
+    for card in soup.select('.js-restaurant__list_item'):
+        title_link = card.select_one('.card__menu-content--title a[href*="/restaurant/"]')
+        if title_link:
+            href = title_link.get('href')
+            if href and '/restaurant/' in href:
+                page_urls.append(urljoin(base_url, href))
+    return page_urls
+
+
+def max_page_from_soup(soup):
+    """BeautifulSoup 목록 페이지 → 페이지네이션 최대 페이지 번호 (없으면 0)"""
+    pagination = soup.find('nav', {'aria-label': 'pagination'}) or soup.find('div', class_=re.compile(r'pagination'))
+    if not pagination:
+        return 0
+    return _max_page_number(link.get_text(strip=True) for link in pagination.find_all('a'))
+
+
+def _bs4_detail(content):
+    soup = BeautifulSoup(content, 'html.parser')
+    return restaurant_info(**detail_fields_from_soup(soup)), extract_static_gallery_urls(soup), expected_gallery_count(soup)
+
+
+def _bs4_listing(content, base_url):
+    soup = BeautifulSoup(content, 'html.parser')
+    return listing_urls_from_soup(soup, base_url), max_page_from_soup(soup)
+
+
+# ---------------------------------------------------------------- lxml (XPath)
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _lxml_text(element):
+    # BeautifulSoup get_text(strip=True) 와 같게: 텍스트 조각마다 strip 후 이어붙임
+    return ''.join(part.strip() for part in element.xpath('.//text()'))
+
+
+def _lxml_document(content):
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
+    if not content.strip():
+        content = '<html></html>'
+    return lxml.html.document_fromstring(content)
+
+
+def _lxml_detail(content):
+    doc = _lxml_document(content)
+    titles = doc.xpath(f"//h1[{_has_class('data-sheet__title')}]")
+    fields = {
+        'title': _lxml_text(titles[0]) if titles else None,
+        'block_texts': [_lxml_text(block) for block in doc.xpath(f"//div[{_has_class('data-sheet__block--text')}]")],
+        'classification_texts': [
+            _lxml_text(content_div)
+            for item in doc.xpath(f"//div[{_has_class('data-sheet__classification-item')}]")
+            for content_div in item.xpath(f".//div[{_has_class('data-sheet__classification-item--content')}]")
+        ]
+    }
+
+    candidates = []
+    for img in doc.xpath(f"//*[{_has_class('modal__gallery-image')}]//img"):
+        candidates.extend(img.get(attr) for attr in ('ci-src', 'data-src', 'src') if img.get(attr))
+    candidates.extend(img.get('ci-src') for img in doc.xpath("//img[@ci-src]"))
+    for element in doc.xpath("//*[@data-gallery-image]"):
+        candidates.extend(element.get('data-gallery-image', '').split(','))
+    candidates.extend(json_ld_image_urls(
+        script.text for script in doc.xpath("//script[@type='application/ld+json']")
+    ))
+    gallery_count = gallery_count_hint(
+        len(doc.xpath(f"//*[{_has_class('modal__gallery-image')}]")),
+        [_lxml_text(button) for button in
+         doc.xpath(f"//*[{_has_class('js-gallery-button')} or {_has_class('masthead__gallery-open')}]")]
+    )
+    return restaurant_info(**fields), filter_gallery_candidates(candidates), gallery_count
+
+
+def _lxml_listing(content, base_url):
+    doc = _lxml_document(content)
+    page_urls = []
+    for card in doc.xpath(f"//*[{_has_class('js-restaurant__list_item')}]"):
+        links = card.xpath(f".//*[{_has_class('card__menu-content--title')}]//a[contains(@href, '/restaurant/')]")
+        if links:
+            page_urls.append(urljoin(base_url, links[0].get('href')))
+
+    pagination = doc.xpath("//nav[@aria-label='pagination']") or doc.xpath("//div[contains(@class, 'pagination')]")
+    max_page = _max_page_number(_lxml_text(link) for link in pagination[0].xpath('.//a')) if pagination else 0
+    return page_urls, max_page
+
+
+# ---------------------------------------------------------------- selectolax (lexbor, 선택 설치)
+
+def _selectolax_text(node):
+    return node.text(deep=True, separator='', strip=True)
+
+
+def _selectolax_detail(content):
+    tree = HTMLParser(content)
+    title = tree.css_first('h1.data-sheet__title')
+    fields = {
+        'title': _selectolax_text(title) if title else None,
+        'block_texts': [_selectolax_text(block) for block in tree.css('div.data-sheet__block--text')],
+        'classification_texts': [
+            _selectolax_text(content_div)
+            for item in tree.css('div.data-sheet__classification-item')
+            for content_div in item.css('div.data-sheet__classification-item--content')
+        ]
+    }
+
+    candidates = []
+    for img in tree.css('.modal__gallery-image img'):
+        candidates.extend(img.attributes.get(attr) for attr in ('ci-src', 'data-src', 'src') if img.attributes.get(attr))
+    candidates.extend(img.attributes.get('ci-src') for img in tree.css('img[ci-src]'))
+    for element in tree.css('[data-gallery-image]'):
+        candidates.extend((element.attributes.get('data-gallery-image') or '').split(','))
+    candidates.extend(json_ld_image_urls(
+        script.text(deep=True) for script in tree.css('script[type="application/ld+json"]')
+    ))
+    buttons = {id(node): node for selector in ('.js-gallery-button', '.masthead__gallery-open')
+               for node in tree.css(selector)}
+    gallery_count = gallery_count_hint(len(tree.css('.modal__gallery-image')),
+                                       [_selectolax_text(node) for node in buttons.values()])
+    return restaurant_info(**fields), filter_gallery_candidates(candidates), gallery_count
+
+
+def _selectolax_listing(content, base_url):
+    tree = HTMLParser(content)
+    page_urls = []
+    for card in tree.css('.js-restaurant__list_item'):
+        link = card.css_first('.card__menu-content--title a[href*="/restaurant/"]')
+        if link and link.attributes.get('href'):
+            page_urls.append(urljoin(base_url, link.attributes['href']))
+
+    pagination = tree.css_first('nav[aria-label="pagination"]') or tree.css_first('div[class*="pagination"]')
+    max_page = _max_page_number(_selectolax_text(link) for link in pagination.css('a')) if pagination else 0
+    return page_urls, max_page
+
+
+BACKENDS = {
+    'html.parser': (_bs4_detail, _bs4_listing),
+    'lxml': (_lxml_detail, _lxml_listing),
+    'selectolax': (_selectolax_detail, _selectolax_listing),
+}
+
+
+def available_backends():
+    """현재 환경에서 쓸 수 있는 파서 백엔드 이름"""
+    backends = ['html.parser']
+    if lxml is not None:
+        backends.append('lxml')
+    if HTMLParser is not None:
+        backends.append('selectolax')
+    return backends
+
+
+def parse_detail(content, backend='html.parser'):
+    """상세 페이지 → {'info': {...}, 'gallery_urls': [...], 'gallery_count': 기대 이미지 수} (프로세스 풀에서 호출 가능)"""
+    info, gallery_urls, gallery_count = BACKENDS[backend][0](content)
+    return {'info': info, 'gallery_urls': gallery_urls, 'gallery_count': gallery_count}
+
+
+def parse_listing(content, base_url, backend='html.parser'):
+    """목록 페이지 → (상세 URL 목록, 최대 페이지)"""
+    return BACKENDS[backend][1](content, base_url)
+
+
+class PageParser:
+    """파서 백엔드 선택 + (processes > 0 이면) 프로세스 풀에서 파싱"""
+
+    def __init__(self, backend='html.parser', processes=0):
+        if backend not in available_backends():
+            raise ValueError(f"사용할 수 없는 파서 백엔드: {backend} (사용 가능: {', '.join(available_backends())})")
+        self.backend = backend
+        self.processes = processes
+        self.executor = ProcessPoolExecutor(max_workers=processes) if processes > 0 else None
+        self.counter = StageCounter(f'parse[{backend}]')
+
+    def _run(self, function, *args):
+        started = time.perf_counter()
+        if self.executor:
+            result = self.executor.submit(function, *args).result()
+        else:
+            result = function(*args)
+        self.counter.record(started, nbytes=len(args[0]))
+        return result
+
+    async def _run_async(self, function, *args):
+        started = time.perf_counter()
+        if self.executor:
+            result = await asyncio.wrap_future(self.executor.submit(function, *args))
+        else:
+            result = function(*args)
+        self.counter.record(started, nbytes=len(args[0]))
+        return result
+
+    def parse_detail(self, content):
+        return self._run(parse_detail, content, self.backend)
+
+    def parse_listing(self, content, base_url):
+        return self._run(parse_listing, content, base_url, self.backend)
+
+    async def parse_detail_async(self, content):
+        return await self._run_async(parse_detail, content, self.backend)
+
+    async def parse_listing_async(self, content, base_url):
+        return await self._run_async(parse_listing, content, base_url, self.backend)
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=True)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호스트별 적응형 요청 속도 제한기
+- 호스트(guide.michelin.com / cloudimg.io)마다 토큰 버킷을 두고
+- 성공하면 속도를 조금씩 올리고(additive increase), 429/5xx 면 절반으로 줄임(multiplicative decrease)
+- Retry-After 를 지키고, 그 외에는 지터가 들어간 지수 백오프로 재시도
+- 재시도는 전체 요청 수 대비 예산(retry budget) 안에서만 허용
+고정 time.sleep() 대신 서버가 허용하는 만큼 처리량이 올라갑니다.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HostLimit:
+    """호스트별 속도 설정 (초당 요청 수)"""
+
+    def __init__(self, initial_rate, max_rate, min_rate=0.2, burst=None, increase_step=None):
+        self.initial_rate = initial_rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst or max(1.0, initial_rate)
+        self.increase_step = increase_step or initial_rate * 0.05
+
+
+DEFAULT_HOST_LIMITS = {
+    'guide.michelin.com': HostLimit(initial_rate=3, max_rate=15),
+    'cloudimg.io': HostLimit(initial_rate=10, max_rate=60, burst=10),
+}
+DEFAULT_LIMIT = HostLimit(initial_rate=5, max_rate=30)
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 초 (없으면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_time = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_time.timestamp() - time.time())
+
+
+class _HostBucket:
+    def __init__(self, limit):
+        self.limit = limit
+        self.rate = limit.initial_rate
+        self.tokens = limit.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+
+
+class HostRateLimiter:
+    def __init__(self, host_limits=None, default_limit=DEFAULT_LIMIT):
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self.default_limit = default_limit
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _host_key(self, url):
+        """URL → 버킷 키 (등록된 도메인 접미사가 있으면 그것으로 묶음)"""
+        host = urlparse(url).hostname or ''
+        for suffix in self.host_limits:
+            if host == suffix or host.endswith('.' + suffix):
+                return suffix
+        return host
+
+    def _bucket(self, key):
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = _HostBucket(self.host_limits.get(key, self.default_limit))
+            self.buckets[key] = bucket
+        return bucket
+
+    def reserve(self, url):
+        """토큰 하나를 예약하고 요청 전에 기다려야 할 시간(초) 반환"""
+        with self.lock:
+            bucket = self._bucket(self._host_key(url))
+            now = time.monotonic()
+            bucket.tokens = min(bucket.limit.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+            bucket.requests += 1
+            delay = 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+            return max(delay, bucket.blocked_until - now)
+
+    def acquire(self, url):
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url):
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self, url):
+        """성공 응답: 속도를 조금 올림"""
+        with self.lock:
+            bucket = self._bucket(self._host_key(url))
+            bucket.rate = min(bucket.limit.max_rate, bucket.rate + bucket.limit.increase_step)
+
+    def on_throttle(self, url, retry_after=None):
+        """429/5xx: 속도를 절반으로 줄이고 Retry-After 동안 호스트 차단"""
+        with self.lock:
+            bucket = self._bucket(self._host_key(url))
+            bucket.rate = max(bucket.limit.min_rate, bucket.rate / 2)
+            bucket.tokens = min(bucket.tokens, 0)
+            bucket.throttled += 1
+            if retry_after:
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+
+    def snapshot(self):
+        """호스트별 현재 속도/요청 수/제한 횟수"""
+        with self.lock:
+            return {
+                key: {'rate': round(bucket.rate, 2), 'requests': bucket.requests, 'throttled': bucket.throttled}
+                for key, bucket in self.buckets.items()
+            }
+
+    def print_summary(self):
+        for key, stats in self.snapshot().items():
+            print(f"🚦 {key}: 최종 {stats['rate']}req/s, 요청 {stats['requests']}개, 제한(429/5xx) {stats['throttled']}회")
+
+
+class RetryPolicy:
+    """지터 지수 백오프 + 재시도 예산"""
+
+    def __init__(self, max_retries=4, base_delay=0.5, max_delay=30.0, budget_ratio=0.2, budget_min=10):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+
+    def note_request(self):
+        with self.lock:
+            self.requests += 1
+
+    def try_spend(self, attempt):
+        """재시도 가능하면 예산을 쓰고 True (시도 횟수 초과 또는 예산 소진이면 False)"""
+        if attempt >= self.max_retries:
+            return False
+        with self.lock:
+            if self.retries >= self.budget_min + self.budget_ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+    def backoff(self, attempt, retry_after=None):
+        """다음 재시도까지 대기 시간 (Retry-After 가 있으면 그 값, 없으면 full jitter)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RateLimitedSession:
+    """requests.Session 을 감싸 모든 GET 을 속도 제한기와 재시도 정책에 통과시킴"""
+
+    def __init__(self, session, limiter, retry_policy=None):
+        self.session = session
+        self.limiter = limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def __getattr__(self, name):
+        # headers, mount, close 등은 원래 세션으로 위임
+        return getattr(self.session, name)
+
+    def get(self, url, **kwargs):
+        """속도 제한 + 재시도가 적용된 GET (최종 응답은 호출자가 raise_for_status)"""
+        attempt = 0
+        while True:
+            self.limiter.acquire(url)
+            self.retry_policy.note_request()
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.limiter.on_throttle(url)
+                if not self.retry_policy.try_spend(attempt):
+                    raise
+                time.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUSES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self.limiter.on_throttle(url, retry_after)
+                if self.retry_policy.try_spend(attempt):
+                    response.close()
+                    time.sleep(self.retry_policy.backoff(attempt, retry_after))
+                    attempt += 1
+                    continue
+                return response
+
+            self.limiter.on_success(url)
+            return response
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤 대상 리전 매니페스트 (regions.json)
+도시/가이드마다 이름, 시작 URL, 리전별 최대 동시 작업 수, (지오코딩용) 한국어 시/도 이름을 적어두고
+스크래퍼 main() 과 crawl_orchestrator.py 가 같은 목록을 사용합니다.
+"""
+
+import json
+import os
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'regions.json')
+DEFAULT_REGION = 'seoul'
+
+
+class Region:
+    def __init__(self, name, start_url, max_concurrency=None, city=None):
+        self.name = name
+        self.start_url = start_url
+        self.max_concurrency = max_concurrency
+        self.city = city
+
+    def __repr__(self):
+        return f"Region({self.name!r}, {self.start_url!r})"
+
+
+def load_regions(path=DEFAULT_MANIFEST, names=None):
+    """매니페스트에서 리전 목록 로드 (names 를 주면 그 순서대로 골라냄)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    defaults = manifest.get('defaults', {})
+    regions = {}
+    for entry in manifest.get('regions', []):
+        regions[entry['name']] = Region(
+            entry['name'], entry['start_url'],
+            max_concurrency=entry.get('max_concurrency', defaults.get('max_concurrency')),
+            city=entry.get('city')
+        )
+
+    if not names:
+        return list(regions.values())
+    missing = [name for name in names if name not in regions]
+    if missing:
+        raise ValueError(f"매니페스트에 없는 리전: {', '.join(missing)} (사용 가능: {', '.join(regions)})")
+    return [regions[name] for name in names]
+
+
+def resolve_start_url(region_name=DEFAULT_REGION, start_url=None, path=DEFAULT_MANIFEST):
+    """--start-url 이 있으면 그대로, 없으면 매니페스트의 리전 시작 URL"""
+    if start_url:
+        return start_url
+    return load_regions(path, [region_name])[0].start_url
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤 실행 지표 (단계별 카운터 + 지연 시간 히스토그램)
+- 단계: listing_fetch, detail_fetch, parse, browser_load, gallery_wait, image_download, disk_write
+- 단계별 성공/실패 수, 전송 바이트, 지연 시간 히스토그램(p50/p95/최대)
+- 재시도 수 등 다른 컴포넌트의 값은 register_source 로 스냅샷에 합침
+- 실행이 끝나면 JSON 으로 저장, 실행 중에는 Prometheus 텍스트 형식 파일을 주기적으로 갱신(선택)
+- configure_logging: 이미지/선택자 단위의 자세한 로그는 DEBUG 레벨로 (기본 INFO 에서는 출력 안 함)
+- python run_metrics.py: 자체 점검 (바이트만 기록된 단계 등)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+STAGES = ('listing_fetch', 'detail_fetch', 'parse', 'browser_load', 'gallery_wait', 'image_download', 'disk_write')
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# PhaseTimer 단계 이름 → 지표 단계 (갤러리 버튼/모달/이미지 안정화 대기는 gallery_wait 로 합침)
+TIMING_STAGES = {
+    'detail_fetch': 'detail_fetch',
+    'parse': 'parse',
+    'browser_load': 'browser_load',
+    'gallery_button': 'gallery_wait',
+    'modal_open': 'gallery_wait',
+    'image_stabilize': 'gallery_wait',
+}
+
+
+def configure_logging(level='INFO'):
+    """스크래퍼 로그 레벨 설정 (메시지만 출력, DEBUG 면 이미지 단위 로그까지)"""
+    logging.basicConfig(level=getattr(logging, str(level).upper(), logging.INFO), format='%(message)s')
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (메모리 사용량 일정)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """q 분위가 속한 버킷의 상한 (마지막 버킷이면 관측 최대값)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def cumulative_counts(self):
+        """[(상한, 누적 수)] (Prometheus le 버킷)"""
+        result = []
+        cumulative = 0
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            cumulative += count
+            result.append((bound, cumulative))
+        return result
+
+
+class RunMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.histograms = {}
+        self.stages = {}
+        self.counters = {}
+        self.sources = {}
+        self.live_thread = None
+        self.live_stop = threading.Event()
+
+    def observe(self, stage, seconds, ok=True, nbytes=0):
+        """단계 한 건의 소요 시간/성공 여부/바이트 기록"""
+        with self.lock:
+            stats = self.stages.setdefault(stage, {'ok': 0, 'failed': 0, 'bytes': 0})
+            stats['ok' if ok else 'failed'] += 1
+            stats['bytes'] += nbytes
+            self.histograms.setdefault(stage, LatencyHistogram()).observe(seconds)
+
+    @contextmanager
+    def timed(self, stage):
+        """with 블록 소요 시간 기록 (예외가 나면 실패로 기록하고 다시 발생)"""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.observe(stage, time.perf_counter() - started, ok=False)
+            raise
+        self.observe(stage, time.perf_counter() - started)
+
+    def observe_timings(self, timings):
+        """레코드의 PhaseTimer 값(단계 → 초)을 지표 단계로 묶어 기록"""
+        grouped = {}
+        for phase, seconds in (timings or {}).items():
+            stage = TIMING_STAGES.get(phase)
+            if stage:
+                grouped[stage] = grouped.get(stage, 0.0) + seconds
+        for stage, seconds in grouped.items():
+            self.observe(stage, seconds)
+
+    def add_bytes(self, stage, nbytes):
+        """단계 전송 바이트만 추가 (시간은 따로 기록된 경우, 시간 기록 전에 실패해도 스냅샷에 빈 히스토그램으로 나옴)"""
+        with self.lock:
+            self.stages.setdefault(stage, {'ok': 0, 'failed': 0, 'bytes': 0})['bytes'] += nbytes
+            self.histograms.setdefault(stage, LatencyHistogram())
+
+    def increment(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def register_source(self, name, function):
+        """스냅샷 때 function() 결과(dict)를 name 아래에 포함 (재시도 수, 브라우저 풀 지표 등)"""
+        self.sources[name] = function
+
+    def snapshot(self):
+        """지표 전체 (dict)"""
+        with self.lock:
+            stages = {}
+            for stage in sorted(self.stages, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s)):
+                stats = self.stages[stage]
+                histogram = self.histograms[stage]
+                stages[stage] = {
+                    'ok': stats['ok'],
+                    'failed': stats['failed'],
+                    'bytes': stats['bytes'],
+                    'seconds_total': round(histogram.sum, 3),
+                    'p50_seconds': round(histogram.quantile(0.5), 3),
+                    'p95_seconds': round(histogram.quantile(0.95), 3),
+                    'max_seconds': round(histogram.max, 3),
+                }
+            snapshot = {
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+                'elapsed_seconds': round(time.time() - self.started_at, 3),
+                'stages': stages,
+                'bytes_total': sum(stats['bytes'] for stats in self.stages.values()),
+                'counters': dict(self.counters),
+            }
+        for name, function in self.sources.items():
+            try:
+                snapshot[name] = function()
+            except Exception as e:
+                snapshot[name] = {'error': str(e)}
+        return snapshot
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 노출 형식"""
+        lines = [
+            '# HELP michelin_stage_seconds Stage latency in seconds',
+            '# TYPE michelin_stage_seconds histogram',
+        ]
+        with self.lock:
+            for stage, histogram in self.histograms.items():
+                for bound, cumulative in histogram.cumulative_counts():
+                    lines.append(f'michelin_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'michelin_stage_seconds_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'michelin_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+            lines.append('# TYPE michelin_stage_total counter')
+            for stage, stats in self.stages.items():
+                lines.append(f'michelin_stage_total{{stage="{stage}",result="ok"}} {stats["ok"]}')
+                lines.append(f'michelin_stage_total{{stage="{stage}",result="failed"}} {stats["failed"]}')
+            lines.append('# TYPE michelin_stage_bytes_total counter')
+            for stage, stats in self.stages.items():
+                lines.append(f'michelin_stage_bytes_total{{stage="{stage}"}} {stats["bytes"]}')
+            lines.append('# TYPE michelin_events_total counter')
+            for name, value in self.counters.items():
+                lines.append(f'michelin_events_total{{event="{name}"}} {value}')
+        for name, function in self.sources.items():
+            try:
+                values = function()
+            except Exception:
+                continue
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f'michelin_{name}{{key="{key}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def _write_atomic(self, path, text):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def write_json(self, path):
+        """지표 스냅샷을 JSON 파일로 저장"""
+        self._write_atomic(path, json.dumps(self.snapshot(), ensure_ascii=False, indent=2))
+        print(f"📊 실행 지표 저장: {path}")
+
+    def write_prometheus(self, path):
+        self._write_atomic(path, self.prometheus_text())
+
+    def start_live(self, path, interval=10.0):
+        """interval 초마다 Prometheus 텍스트 파일 갱신 (node_exporter textfile 수집기 등에서 읽음)"""
+        def loop():
+            while not self.live_stop.wait(interval):
+                self.write_prometheus(path)
+
+        self.live_path = path
+        self.live_thread = threading.Thread(target=loop, name='metrics-live', daemon=True)
+        self.live_thread.start()
+
+    def stop_live(self):
+        """주기 갱신을 멈추고 마지막 값으로 한 번 더 기록"""
+        if self.live_thread:
+            self.live_stop.set()
+            self.live_thread.join()
+            self.live_thread = None
+            self.write_prometheus(self.live_path)
+
+    def print_summary(self):
+        snapshot = self.snapshot()
+        for stage, stats in snapshot['stages'].items():
+            print(f"⏱️ [{stage}] {stats['ok']}건 (실패 {stats['failed']}), p50 {stats['p50_seconds']}초, "
+                  f"p95 {stats['p95_seconds']}초, 최대 {stats['max_seconds']}초, {stats['bytes'] / 1024 / 1024:.1f}MB")
+
+
+def _self_check():
+    """바이트만 기록된 단계(상세 페이지를 받은 뒤 파싱 전에 실패)도 스냅샷/Prometheus 출력이 되는지 확인"""
+    metrics = RunMetrics()
+    metrics.add_bytes('detail_fetch', 10)
+    stats = metrics.snapshot()['stages']['detail_fetch']
+    assert stats['bytes'] == 10 and stats['ok'] == 0 and stats['p95_seconds'] == 0.0, stats
+    assert 'michelin_stage_seconds_count{stage="detail_fetch"} 0' in metrics.prometheus_text()
+    metrics.observe('detail_fetch', 0.2)
+    assert metrics.snapshot()['stages']['detail_fetch']['ok'] == 1
+    print("✅ run_metrics 자체 점검 통과")
+
+
+if __name__ == "__main__":
+    _self_check()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지도 화면(뷰포트) 단위로 내려받을 수 있는 공간 타일 인덱스 생성
+좌표(lat/lng, geocoding.py 로 채움)가 있는 음식점 레코드를 웹 메르카토르 z/x/y 타일로 나눠
+타일마다 마커에 필요한 최소 정보만 담은 작은 JSON 을 만들고, 상세 정보는 별도 샤드 파일로 분리합니다.
+
+출력 구조 (<output>/):
+    index.json             타일 목록(z/x/y → 마커 수), 나눠진 부모 타일 목록(split), 기본/최대 줌, 샤드 수, 전체 범위
+    tiles/<z>/<x>/<y>.json {"fields": [...], "markers": [[id, lat, lng, rating, category], ...]}
+    details/<샤드>.json     id → 전체 레코드 (샤드 = int(id, 16) % 샤드 수, 클라이언트가 id 로 바로 계산)
+
+- 타일 하나의 마커가 max_markers 를 넘으면 다음 줌의 4개 타일로 나눔 (max_zoom 까지) → 타일 크기 상한 유지
+- 뷰포트는 기본 줌에서 겹치는 타일을 구하고, split 에 있는 타일만 하위 타일로 내려감 (tiles_for_bbox)
+  (tiles 에도 split 에도 없는 타일은 마커가 없는 빈 타일)
+- 새 디렉토리에 모두 쓴 뒤 교체하므로 배포 중에 이전/새 타일이 섞이지 않음
+
+사용법:
+    python spatial_index.py ../public/michelin_restaurants.json --output ../public/restaurant_tiles
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import shutil
+
+MARKER_FIELDS = ('id', 'lat', 'lng', 'rating', 'category')
+DEFAULT_ZOOM = 12
+MAX_ZOOM = 16
+DEFAULT_MAX_MARKERS = 200
+DEFAULT_SHARD_COUNT = 16
+
+
+def restaurant_id(record):
+    """미슐랭 URL 기반 고정 id (12자리 16진수, 재수집해도 같은 값)"""
+    return hashlib.sha1(record['url'].encode('utf-8')).hexdigest()[:12]
+
+
+def tile_for(lat, lng, zoom):
+    """위경도 → 웹 메르카토르 타일 (x, y)"""
+    n = 2 ** zoom
+    lat = max(-85.05112878, min(85.05112878, lat))
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(n - 1, max(0, x)), min(n - 1, max(0, y))
+
+
+def split_tiles(markers, zoom, max_zoom, max_markers, split=None):
+    """
+    마커를 zoom 타일로 묶고, max_markers 를 넘는 타일은 max_zoom 까지 4등분
+
+    Args:
+        split: 나눈 부모 타일 (z, x, y) 를 모을 set
+    Returns:
+        {(z, x, y): [마커, ...]}
+    """
+    buckets = {}
+    for marker in markers:
+        x, y = tile_for(marker[1], marker[2], zoom)
+        buckets.setdefault((zoom, x, y), []).append(marker)
+
+    tiles = {}
+    for key, bucket in buckets.items():
+        if len(bucket) > max_markers and zoom < max_zoom:
+            # 하위 줌에서 다시 나눔 (같은 부모의 마커만 넘기므로 자식 타일은 이 타일 안에 있음)
+            if split is not None:
+                split.add(key)
+            tiles.update(split_tiles(bucket, zoom + 1, max_zoom, max_markers, split))
+        else:
+            tiles[key] = bucket
+    return tiles
+
+
+def tiles_for_bbox(index, south, west, north, east):
+    """
+    뷰포트(남서/북동 좌표)에 필요한 타일 키 목록 ("z/x/y")
+
+    기본 줌에서 겹치는 타일을 구하고, index['split'] 에 있는 타일만 뷰포트와 겹치는 하위 타일로 대체합니다.
+    tiles 에도 split 에도 없는 타일은 비어 있으므로 더 내려가지 않습니다.
+    (프론트엔드도 같은 규칙으로 받을 타일을 계산)
+    """
+    available = index['tiles']
+    split = set(index.get('split', ()))
+    ranges = {}  # 줌 → 뷰포트가 덮는 (min_x, min_y, max_x, max_y), 줌마다 한 번만 계산
+
+    def view_range(z):
+        if z not in ranges:
+            ranges[z] = tile_for(north, west, z) + tile_for(south, east, z)
+        return ranges[z]
+
+    min_x, min_y, max_x, max_y = view_range(index['base_zoom'])
+    keys = []
+    pending = [(index['base_zoom'], x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+    while pending:
+        z, x, y = pending.pop()
+        key = f"{z}/{x}/{y}"
+        if key in available:
+            keys.append(key)
+        elif key in split:
+            min_x, min_y, max_x, max_y = view_range(z + 1)
+            pending.extend((z + 1, cx, cy) for cx in (2 * x, 2 * x + 1) for cy in (2 * y, 2 * y + 1)
+                           if min_x <= cx <= max_x and min_y <= cy <= max_y)
+    return sorted(keys)
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def build_spatial_index(restaurants, output_dir, base_zoom=DEFAULT_ZOOM, max_zoom=MAX_ZOOM,
+                        max_markers=DEFAULT_MAX_MARKERS, shard_count=DEFAULT_SHARD_COUNT):
+    """
+    음식점 레코드로 타일/상세 샤드/index.json 을 만들어 output_dir 을 교체
+
+    Returns:
+        index dict
+    """
+    markers = []
+    shards = [{} for _ in range(shard_count)]
+    unlocated = 0
+    for record in restaurants:
+        rid = restaurant_id(record)
+        shards[int(rid, 16) % shard_count][rid] = record
+        if record.get('lat') is None or record.get('lng') is None:
+            unlocated += 1  # 좌표가 없으면 상세 샤드에만 넣고 지도 타일에서는 제외
+            continue
+        markers.append([rid, round(record['lat'], 6), round(record['lng'], 6), record.get('rating'),
+                        record.get('category')])
+
+    split = set()
+    tiles = split_tiles(markers, base_zoom, max_zoom, max_markers, split)
+
+    # 새 디렉토리에 모두 쓴 뒤 교체
+    build_dir = f"{output_dir.rstrip(os.sep)}.building"
+    shutil.rmtree(build_dir, ignore_errors=True)
+    tile_sizes = []
+    for (z, x, y), tile_markers in tiles.items():
+        path = os.path.join(build_dir, 'tiles', str(z), str(x), f"{y}.json")
+        _write_json(path, {'fields': MARKER_FIELDS, 'markers': sorted(tile_markers)})
+        tile_sizes.append(os.path.getsize(path))
+    for number, shard in enumerate(shards):
+        _write_json(os.path.join(build_dir, 'details', f"{number:02d}.json"), shard)
+
+    index = {
+        'base_zoom': base_zoom,
+        'max_zoom': max_zoom,
+        'max_markers': max_markers,
+        'shard_count': shard_count,
+        'fields': MARKER_FIELDS,
+        'tiles': {f"{z}/{x}/{y}": len(tile_markers) for (z, x, y), tile_markers in sorted(tiles.items())},
+        'split': [f"{z}/{x}/{y}" for z, x, y in sorted(split)],
+        'bounds': [
+            min(marker[1] for marker in markers), min(marker[2] for marker in markers),
+            max(marker[1] for marker in markers), max(marker[2] for marker in markers),
+        ] if markers else None,
+        'total': len(restaurants),
+        'unlocated': unlocated,
+    }
+    _write_json(os.path.join(build_dir, 'index.json'), index)
+
+    old_dir = f"{output_dir.rstrip(os.sep)}.old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(output_dir):
+        os.rename(output_dir, old_dir)
+    os.rename(build_dir, output_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    print(f"🗺️  타일 {len(tiles)}개 (줌 {base_zoom}~{max(z for z, _, _ in tiles) if tiles else base_zoom}), "
+          f"마커 {len(markers)}개, 좌표 없음 {unlocated}개, 상세 샤드 {shard_count}개")
+    if tile_sizes:
+        print(f"📦 타일 크기: 최대 {max(tile_sizes) / 1024:.1f}KB, 평균 {sum(tile_sizes) / len(tile_sizes) / 1024:.1f}KB")
+    print(f"💾 공간 인덱스 저장: {output_dir}")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음식점 좌표로 뷰포트 조회용 공간 타일 인덱스 생성")
+    parser.add_argument('paths', nargs='+', help="음식점 JSON 파일 (여러 개면 URL 기준으로 합침)")
+    parser.add_argument('--output', default='restaurant_tiles', help="출력 디렉토리")
+    parser.add_argument('--zoom', type=int, default=DEFAULT_ZOOM, help="기본 타일 줌 레벨")
+    parser.add_argument('--max-zoom', type=int, default=MAX_ZOOM, help="타일을 나눌 수 있는 최대 줌 레벨")
+    parser.add_argument('--max-markers', type=int, default=DEFAULT_MAX_MARKERS, help="타일 하나의 최대 마커 수")
+    parser.add_argument('--shards', type=int, default=DEFAULT_SHARD_COUNT, help="상세 정보 샤드 파일 수")
+    args = parser.parse_args()
+
+    merged = {}
+    for path in args.paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in json.load(f):
+                merged.setdefault(record['url'], record)
+    build_spatial_index(list(merged.values()), args.output, base_zoom=args.zoom, max_zoom=args.max_zoom,
+                        max_markers=args.max_markers, shard_count=args.shards)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+드라이버별 탭 재사용 + 다음 음식점 미리 로드(prefetch)
+드라이버마다 탭 두 개를 열어두고 미슐랭 오리진으로 미리 접속해 둡니다.
+한 탭에서 갤러리를 추출하는 동안 다른 탭에서 다음 음식점 페이지를 로드하고,
+다음 작업은 이미 로드된 탭으로 전환만 해서 시작합니다. (탐색 지연을 추출 시간 뒤로 숨김)
+두 탭이 번갈아 새 페이지로 이동하므로 모달/배너 상태가 계속 쌓이지 않습니다.
+"""
+
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from queue import Queue, Empty
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+MAX_SESSION_ATTEMPTS = 3  # 세션을 만들지 못한 작업을 다른 드라이버로 다시 넣는 최대 횟수
+
+
+class BrowserSession:
+    """드라이버 하나의 현재 탭 / 백그라운드 탭"""
+
+    def __init__(self, driver, warm_url=None):
+        self.driver = driver
+        self.current = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        self.background = driver.current_window_handle
+        if warm_url:
+            driver.get(warm_url)  # 백그라운드 탭도 오리진 연결/캐시를 데워둠
+        driver.switch_to.window(self.current)
+        if warm_url:
+            driver.get(warm_url)
+        self.prefetched_url = None
+
+    def prefetch(self, url):
+        """백그라운드 탭에서 url 로드 시작 (기다리지 않고 바로 현재 탭으로 복귀)"""
+        self.driver.switch_to.window(self.background)
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        self.driver.switch_to.window(self.current)
+        self.prefetched_url = url
+
+    def load(self, url, timeout=10):
+        """url 을 현재 탭에 띄움 (미리 로드한 탭이면 전환만 하고 True 반환)"""
+        hit = url == self.prefetched_url
+        self.prefetched_url = None
+        if hit:
+            self.current, self.background = self.background, self.current
+            self.driver.switch_to.window(self.current)
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                lambda d: d.execute_script("return document.readyState") == 'complete'
+            )
+        else:
+            self.driver.get(url)
+        return hit
+
+
+class _GalleryJob:
+    def __init__(self, url, restaurant_name, timings):
+        self.url = url
+        self.restaurant_name = restaurant_name
+        self.timings = timings
+        self.future = Future()
+        self.attempts = 0  # 세션 생성 실패 횟수
+
+
+class TabPipeline:
+    """드라이버마다 워커 스레드 하나: 작업을 이어서 처리하며 다음 작업을 백그라운드 탭에 미리 로드"""
+
+    def __init__(self, pool, extract, warm_url=None):
+        """
+        Args:
+            pool: BrowserPool
+            extract: extract(driver, url, restaurant_name, timings, load) → URL 목록
+                     (load() 를 호출하면 현재 탭에 페이지가 준비됨)
+            warm_url: 세션을 만들 때 미리 접속할 오리진 URL
+        """
+        self.pool = pool
+        self.extract = extract
+        self.warm_url = warm_url
+        self.jobs = Queue()
+        self.sessions = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'hit_seconds': 0.0, 'miss_seconds': 0.0}
+        self.threads = []
+        for i in range(max(1, pool.size)):
+            thread = threading.Thread(target=self._worker, name=f"tab-pipeline-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def extract_gallery_urls(self, url, restaurant_name, timings=None):
+        """작업을 넣고 결과(URL 목록)를 기다림"""
+        job = _GalleryJob(url, restaurant_name, timings)
+        self.jobs.put(job)
+        return job.future.result()
+
+    def _take_next_job(self):
+        try:
+            job = self.jobs.get_nowait()
+        except Empty:
+            return None
+        if job is None:
+            self.jobs.put(None)  # 종료 신호는 다른 워커를 위해 되돌려 둠
+        return job
+
+    def _session(self, driver):
+        session = self.sessions.get(driver)
+        if session is None:
+            session = BrowserSession(driver, self.warm_url)
+            self.sessions[driver] = session
+        return session
+
+    def _load(self, session, job, state):
+        """현재 작업 페이지를 띄우고 바로 다음 작업을 백그라운드 탭에 미리 로드"""
+        started = time.perf_counter()
+        hit = session.load(job.url)
+        elapsed = time.perf_counter() - started
+        with self.lock:
+            self.stats['hits' if hit else 'misses'] += 1
+            self.stats['hit_seconds' if hit else 'miss_seconds'] += elapsed
+
+        state['next'] = self._take_next_job() if state['remaining'] > 1 else None
+        if state['next'] is not None:
+            session.prefetch(state['next'].url)
+
+    def _worker(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            driver = self.pool.checkout()
+            if driver is None:
+                job.future.set_result([])
+                continue
+
+            # 드라이버 교체 주기를 지키도록 한 번 빌린 드라이버로는 max_pages 개까지만 연속 처리
+            state = {'remaining': self.pool.max_pages or 50, 'next': None}
+            pages = 0
+            healthy = True
+            try:
+                session = self._session(driver)
+                while job is not None:
+                    current = job
+                    try:
+                        result = self.extract(driver, current.url, current.restaurant_name, current.timings,
+                                              lambda: self._load(session, current, state))
+                        current.future.set_result(result)
+                    except Exception as e:
+                        current.future.set_exception(e)
+                    pages += 1
+                    state['remaining'] -= 1
+                    job, state['next'] = state['next'], None
+            except Exception as e:
+                # 세션 생성(새 탭/오리진 접속) 실패: 드라이버는 교체하고 작업은 정해진 횟수까지만 다시 처리
+                print(f"    ❌ 탭 세션 오류: {e}")
+                healthy = False
+                if job is not None and not job.future.done():
+                    job.attempts += 1
+                    if job.attempts >= MAX_SESSION_ATTEMPTS:
+                        job.future.set_exception(e)
+                    else:
+                        self.jobs.put(job)  # 다른 드라이버에서 다시 처리
+            finally:
+                self.pool.checkin(driver, healthy=healthy, pages=max(1, pages))
+
+    def print_summary(self):
+        with self.lock:
+            stats = dict(self.stats)
+        hit_avg = stats['hit_seconds'] / stats['hits'] if stats['hits'] else 0.0
+        miss_avg = stats['miss_seconds'] / stats['misses'] if stats['misses'] else 0.0
+        print(f"🗂️ 탭 미리 로드: 적중 {stats['hits']}회 (평균 {hit_avg:.2f}초), "
+              f"미적중 {stats['misses']}회 (평균 {miss_avg:.2f}초)")
+
+    def close(self):
+        for _ in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads:
+            thread.join()
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 기반 URL 프런티어 (여러 워커 프로세스가 공유하는 작업 목록)
+- URL은 PRIMARY KEY 라서 여러 번 넣어도 한 번만 수집 (중복 제거)
+- 워커는 URL을 lease(임대)해서 처리하고, 제한 시간 안에 끝내지 못하면 다른 워커가 다시 가져감
+  (살아있는 워커는 처리 중인 URL의 임대를 주기적으로 연장하므로 긴 갤러리 수집도 중복으로 가져가지 않음)
+- 실패한 URL은 max_attempts 번까지 재시도, 결과 레코드는 같은 DB에 저장
+Chrome 인스턴스가 메모리를 많이 쓰므로 프로세스(또는 같은 파일을 보는 다른 머신)에 브라우저 작업을 나눕니다.
+
+사용법:
+    python url_frontier.py seed --region seoul --region busan   # 목록 페이지 → 프런티어
+    python url_frontier.py work --processes 4 --threads 2        # 워커 프로세스 실행
+    python url_frontier.py status
+    python url_frontier.py export michelin_restaurants_frontier.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from crawl_orchestrator import write_json_atomic
+from http_cache import HttpCache
+from michelin_scraper_ultra_fast import UltraFastMichelinScraper
+from page_parser import BACKEND_NAMES, DEFAULT_BACKEND
+from regions import DEFAULT_MANIFEST, load_regions
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    region TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS urls_status ON urls (status, lease_expires);
+CREATE TABLE IF NOT EXISTS results (
+    url TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    worker TEXT,
+    completed_at REAL
+);
+"""
+
+
+class UrlFrontier:
+    def __init__(self, path="frontier.sqlite3", lease_timeout=300, max_attempts=3):
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.local = threading.local()  # sqlite 연결은 스레드마다 따로
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (동시에 같은 URL을 두 워커가 가져가지 않도록)"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        return conn
+
+    def add(self, urls, region=None):
+        """URL 추가 (이미 있는 URL은 무시) 후 새로 들어간 개수 반환"""
+        conn = self._transaction()
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, region, updated_at) VALUES (?, ?, ?)",
+                [(url, region, time.time()) for url in urls]
+            )
+            conn.execute('COMMIT')
+            return conn.total_changes - before
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def lease(self, worker_id, limit=1):
+        """처리할 URL을 최대 limit 개 임대해 [(url, region)] 반환 (만료된 임대는 회수)"""
+        now = time.time()
+        conn = self._transaction()
+        try:
+            # 제한 시간이 지난 임대: 시도 횟수가 남았으면 대기열로, 아니면 실패 처리
+            conn.execute(
+                "UPDATE urls SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "lease_owner = NULL, last_error = 'lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (self.max_attempts, now, now)
+            )
+            rows = conn.execute(
+                "SELECT url, region FROM urls WHERE status = 'pending' ORDER BY rowid LIMIT ?", (limit,)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE urls SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE url = ?",
+                [(worker_id, now + self.lease_timeout, now, url) for url, _ in rows]
+            )
+            conn.execute('COMMIT')
+            return rows
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def renew(self, url, worker_id):
+        """오래 걸리는 작업의 임대 연장 (이미 다른 워커에게 넘어갔으면 False)"""
+        cursor = self._connect().execute(
+            "UPDATE urls SET lease_expires = ? WHERE url = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time() + self.lease_timeout, url, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, url, worker_id, record):
+        """결과 레코드 저장 후 완료 처리 (임대가 만료된 뒤 끝난 결과도 버리지 않음)"""
+        now = time.time()
+        conn = self._transaction()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (url, record, worker, completed_at) VALUES (?, ?, ?, ?)",
+                (url, json.dumps(record, ensure_ascii=False), worker_id, now)
+            )
+            conn.execute(
+                "UPDATE urls SET status = 'done', lease_owner = NULL, last_error = NULL, updated_at = ? WHERE url = ?",
+                (now, url)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def fail(self, url, worker_id, error):
+        """실패 기록: 시도 횟수가 남았으면 다시 대기열로"""
+        self._connect().execute(
+            "UPDATE urls SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+            "lease_owner = NULL, last_error = ?, updated_at = ? "
+            "WHERE url = ? AND status = 'leased' AND lease_owner = ?",
+            (self.max_attempts, str(error)[:500], time.time(), url, worker_id)
+        )
+
+    def stats(self):
+        """상태별 URL 수 (pending / leased / done / failed)"""
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        for status, count in self._connect().execute("SELECT status, COUNT(*) FROM urls GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def has_work(self):
+        """아직 대기 중이거나 다른 워커가 처리 중인 URL이 있으면 True"""
+        stats = self.stats()
+        return stats['pending'] > 0 or stats['leased'] > 0
+
+    def results(self):
+        """완료된 레코드 목록 (URL이 프런티어에 들어간 순서)"""
+        rows = self._connect().execute(
+            "SELECT results.record, urls.region FROM results JOIN urls ON urls.url = results.url ORDER BY urls.rowid"
+        )
+        records = []
+        for record_json, region in rows:
+            record = json.loads(record_json)
+            if region and 'region' not in record:
+                record['region'] = region
+            records.append(record)
+        return records
+
+    def export(self, output_path):
+        """완료된 레코드를 JSON 으로 원자적으로 저장하고 개수 반환"""
+        records = self.results()
+        write_json_atomic(output_path, records)
+        print(f"💾 프런티어 결과 {len(records)}개 → {output_path}")
+        return len(records)
+
+    def print_summary(self):
+        stats = self.stats()
+        print(f"🧭 프런티어: 대기 {stats['pending']}개, 처리 중 {stats['leased']}개, "
+              f"완료 {stats['done']}개, 실패 {stats['failed']}개")
+
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+
+class LeaseHeartbeat:
+    """워커 프로세스에서 처리 중인 URL들의 임대를 lease_timeout 의 1/3 마다 연장하는 스레드"""
+
+    def __init__(self, frontier, interval=None):
+        self.frontier = frontier
+        self.interval = interval or frontier.lease_timeout / 3
+        self.in_flight = {}  # url → worker_id
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='frontier-heartbeat', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def track(self, url, worker_id):
+        with self.lock:
+            self.in_flight[url] = worker_id
+
+    def untrack(self, url):
+        with self.lock:
+            self.in_flight.pop(url, None)
+
+    def _run(self):
+        try:
+            while not self.stop_event.wait(self.interval):
+                with self.lock:
+                    in_flight = list(self.in_flight.items())
+                for url, worker_id in in_flight:
+                    if not self.frontier.renew(url, worker_id):
+                        print(f"⚠️ [{worker_id}] 임대를 잃었습니다 (다른 워커가 다시 가져갔을 수 있음): {url}")
+                        self.untrack(url)
+        finally:
+            self.frontier.close()  # 이 스레드의 sqlite 연결
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+
+
+def seed_frontier(frontier, scraper, regions):
+    """리전 목록 페이지를 돌며 음식점 URL을 프런티어에 추가"""
+    for region in regions:
+        print(f"🌱 [{region.name}] 목록 수집: {region.start_url}")
+        added = frontier.add(list(scraper.iter_restaurant_urls(region.start_url)), region=region.name)
+        print(f"🌱 [{region.name}] 새 URL {added}개 추가")
+
+
+def _worker_thread(frontier, scraper, worker_id, idle_wait, heartbeat):
+    """URL을 하나씩 임대해 상세 수집 후 결과를 프런티어에 기록 (수집 중에는 heartbeat 가 임대 연장)"""
+    processed = 0
+    while True:
+        leased = frontier.lease(worker_id)
+        if not leased:
+            if not frontier.has_work():
+                return processed
+            time.sleep(idle_wait)  # 다른 워커의 임대가 끝나거나 만료될 때까지 대기
+            continue
+
+        url, region = leased[0]
+        heartbeat.track(url, worker_id)
+        try:
+            record = scraper.scrape_restaurant_detail(url)
+        except Exception as e:
+            frontier.fail(url, worker_id, e)
+            continue
+        finally:
+            heartbeat.untrack(url)
+        if record is None:
+            frontier.fail(url, worker_id, 'scrape_restaurant_detail 실패')
+            continue
+        if region:
+            record['region'] = region
+        frontier.complete(url, worker_id, record)
+        processed += 1
+        print(f"✓ [{worker_id}] {record['name']} 완료")
+
+
+def run_worker(frontier_path, threads=2, driver_pool_size=2, scrape_images=True, cache_dir='.http_cache',
+               lease_timeout=300, max_attempts=3, idle_wait=1.0, parser_backend=DEFAULT_BACKEND):
+    """워커 프로세스 하나: 자체 스크래퍼(드라이버 풀)로 threads 개 스레드가 프런티어를 소비"""
+    frontier = UrlFrontier(frontier_path, lease_timeout=lease_timeout, max_attempts=max_attempts)
+    scraper = UltraFastMichelinScraper(
+        max_workers=threads, driver_pool_size=driver_pool_size, scrape_images=scrape_images,
+        http_cache=HttpCache(cache_dir) if cache_dir else None,
+        parser_backend=parser_backend
+    )
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+    results = [0] * threads
+    heartbeat = LeaseHeartbeat(frontier).start()
+
+    def target(index):
+        results[index] = _worker_thread(frontier, scraper, f"{worker_prefix}:{index}", idle_wait, heartbeat)
+
+    workers = [threading.Thread(target=target, args=(i,), name=f"frontier-worker-{i}") for i in range(threads)]
+    try:
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        heartbeat.stop()
+        scraper.image_pipeline.close()
+        scraper.driver_pool.close()
+    print(f"🏁 워커 {worker_prefix}: {sum(results)}개 처리")
+    return sum(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite URL 프런티어 / 분산 워커")
+    parser.add_argument('--db', default='frontier.sqlite3', help="프런티어 SQLite 파일")
+    parser.add_argument('--lease-timeout', type=float, default=300, help="임대 만료 시간 (초)")
+    parser.add_argument('--max-attempts', type=int, default=3, help="URL당 최대 시도 횟수")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = subparsers.add_parser('seed', help="리전 목록 페이지에서 URL 추가")
+    seed_parser.add_argument('--regions-file', default=DEFAULT_MANIFEST)
+    seed_parser.add_argument('--region', action='append', help="리전 이름 (기본: 전체)")
+
+    work_parser = subparsers.add_parser('work', help="워커 프로세스 실행")
+    work_parser.add_argument('--processes', type=int, default=2, help="워커 프로세스 수")
+    work_parser.add_argument('--threads', type=int, default=2, help="프로세스당 스레드 수")
+    work_parser.add_argument('--driver-pool-size', type=int, default=2, help="프로세스당 Selenium 드라이버 수")
+    work_parser.add_argument('--no-images', action='store_true', help="이미지 수집 생략")
+    work_parser.add_argument('--cache-dir', default='.http_cache', help="HTTP 캐시 디렉토리")
+    work_parser.add_argument('--parser', default=DEFAULT_BACKEND, choices=BACKEND_NAMES,
+                             help="HTML 파서 백엔드 (워커가 이미 프로세스라서 별도 파싱 풀은 쓰지 않음)")
+
+    subparsers.add_parser('status', help="상태별 URL 수 출력")
+    export_parser = subparsers.add_parser('export', help="완료된 레코드를 JSON 으로 저장")
+    export_parser.add_argument('output', nargs='?', default='michelin_restaurants_frontier.json')
+
+    args = parser.parse_args()
+    frontier = UrlFrontier(args.db, lease_timeout=args.lease_timeout, max_attempts=args.max_attempts)
+
+    if args.command == 'seed':
+        scraper = UltraFastMichelinScraper(driver_pool_size=0, scrape_images=False)
+        try:
+            seed_frontier(frontier, scraper, load_regions(args.regions_file, args.region))
+        finally:
+            scraper.image_pipeline.close()
+    elif args.command == 'work':
+        worker_kwargs = {
+            'threads': args.threads,
+            'driver_pool_size': args.driver_pool_size,
+            'scrape_images': not args.no_images,
+            'cache_dir': args.cache_dir,
+            'lease_timeout': args.lease_timeout,
+            'max_attempts': args.max_attempts,
+            'parser_backend': args.parser
+        }
+        processes = [
+            multiprocessing.Process(target=run_worker, args=(args.db,), kwargs=worker_kwargs, name=f"frontier-{i}")
+            for i in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    elif args.command == 'export':
+        frontier.export(args.output)
+
+    frontier.print_summary()
+    frontier.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -404,7 +404,10 @@ const Map = ({
       
       const coordinatePromises = restaurants.map(async (restaurant, index) => {
         try {
-          const coordinates = await geocodeAddress(restaurant.address);
+          // 데이터에 미리 계산된 좌표가 있으면 API 호출 없이 사용
+          const coordinates = restaurant.lat != null && restaurant.lng != null
+            ? { lat: restaurant.lat, lng: restaurant.lng }
+            : await geocodeAddress(restaurant.address);
           return {
             restaurant,
             coordinates,